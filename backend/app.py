@@ -1,9 +1,30 @@
 from config import config_by_name
 from datetime import datetime
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 from scrapers import get_all_scrapers, get_scraper, discover_scrapers
+from services.scrape_runner import ScrapeRunner
+from services.http_client import configure_http_client
+from services.rate_limiter import configure_rate_limiter
+from services.http_cache import configure_http_cache
+from services.content_fingerprint import configure_fingerprint_memo
+from services.detail_cache import configure_detail_cache
+from services.high_water import configure_high_water_marks, run_incremental
+from services.browser_pool import configure_browser_pool, get_browser_pool
+from services.parse_pool import configure_parse_pool
+from services.html_parser import configure_html_parser
+from services.async_http import configure_async_http_client
+from services.async_engine import AsyncScrapeEngine
+from services.scrape_cache import configure_scrape_cache
+from services.single_flight import SingleFlight
+from services.process_lock import configure_source_locks
+from services.refresh_scheduler import RefreshScheduler
+from services.ttl_policy import TTLPolicy, entry_age
+from services.response_cache import ResponseCache
+from services.scrape_jobs import ScrapeJobManager
+from routes.tor_routes import tor_bp
+import json
 import os
 import sys
 import traceback
@@ -33,11 +54,83 @@ app.config.from_object(config_by_name[env])
 # enable cors
 CORS(app)
 
+# register blueprints
+app.register_blueprint(tor_bp)
+
 # discover all scrapers on startup
 scrapers = discover_scrapers()
 
-# store last scraped data - dynamic cache
-cache = {}
+# store last scraped data - thread-safe, kept in sqlite across restarts
+cache = configure_scrape_cache(app.config)
+
+# concurrent scrapes of the same source share one execution
+scrape_flight = SingleFlight()
+
+# with several worker processes, only one scrapes a given source at a time
+source_locks = configure_source_locks(app.config)
+
+# the debug reloader's watcher process and spawned parse workers (which
+# re-import this module as __mp_main__) must not start background work
+background_allowed = __name__ != '__mp_main__' and not (
+        __name__ == '__main__' and app.debug and os.environ.get('WERKZEUG_RUN_MAIN') != 'true')
+
+# parser backend - set before the parse pool starts, its workers use it too
+configure_html_parser(app.config)
+
+# html parsing worker processes - started (forkserver/spawn) on the first large page, in the
+# process that parses it, so none are forked from this one or across gunicorn --preload
+parse_pool = configure_parse_pool(app.config) if background_allowed else None
+
+# per-host politeness limits applied to every fetch
+rate_limiter = configure_rate_limiter(app.config)
+
+# on-disk conditional-get cache behind every scraper fetch
+http_cache = configure_http_cache(app.config)
+fingerprints = configure_fingerprint_memo(app.config)
+
+# persistent per-url cache of values scraped from detail pages
+detail_cache = configure_detail_cache(app.config)
+
+# rows already seen per source - scrapes stop paging once they reach them
+high_water = configure_high_water_marks(app.config)
+
+# shared keep-alive http client used by every scraper
+http_client = configure_http_client(app.config)
+
+# warm headless chrome for the selenium scrapers (launched in the background)
+browser_pool = configure_browser_pool(app.config) if background_allowed else get_browser_pool()
+
+# concurrent execution engine shared by /api/scrape/all and /api/tor/scan
+runner = ScrapeRunner.from_config(app.config)
+app.extensions['scrape_runner'] = runner
+
+# optional asyncio backend - all fetches share one event loop and session
+async_engine = None
+if app.config.get('SCRAPE_BACKEND') == 'asyncio':
+    configure_async_http_client(app.config)
+    async_engine = AsyncScrapeEngine.from_config(app.config)
+app.extensions['async_engine'] = async_engine
+
+# background scrape jobs - long scrapes return a job id right away
+jobs = ScrapeJobManager.from_config(app.config)
+app.extensions['scrape_jobs'] = jobs
+
+# read endpoints encode (and compress) each version of their body once
+response_cache = ResponseCache.from_config(app.config)
+
+# per-source freshness and backoff for failing sources
+ttl_policy = TTLPolicy.from_config(app.config)
+
+# background refresh - keeps every source warm so reads answer from memory
+scheduler = RefreshScheduler.from_config(
+        app.config,
+        lambda source: refresh_source(source),
+        sources=list(get_all_scrapers()),
+        policy=ttl_policy
+        )
+
+# the ToR scan reads sources through the same cached, coalesced scrape path
+app.extensions['run_scraper'] = lambda source, force_refresh=False: run_scraper(source, force_refresh)
 
 
 @app.route('/')
@@ -49,6 +142,9 @@ def index():
             {'path': '/api/scrapers', 'method': 'get', 'description': 'list all available scrapers'},
             {'path': '/api/stats', 'method': 'get', 'description': 'scraper statistics'},
             {'path': '/api/scrape/all', 'method': 'get', 'description': 'run all scrapers'},
+            {'path': '/api/metrics', 'method': 'get', 'description': 'performance metrics'},
+            {'path': '/api/jobs', 'method': 'post', 'description': 'start a background scrape job'},
+            {'path': '/api/jobs/<job_id>', 'method': 'get', 'description': 'scrape job progress and results'},
             ]
 
     # add dynamic endpoints for each scraper
@@ -75,7 +171,10 @@ def index():
         'description': 'api for scraping tender data from various sources',
         'documentation': {
             'endpoints': endpoints,
-            'usage': 'add ?force=true to bypass cache and force fresh scraping'
+            'usage': 'add ?force=true to bypass cache and force fresh scraping, '
+                     '?full=true to re-crawl every page instead of stopping at rows already seen, '
+                     '?async=true to /api/scrape/all to get a job id instead of waiting, '
+                     '?stream=ndjson or ?stream=sse to get each source as soon as it finishes'
             },
         'timestamp': datetime.now().isoformat()
         })
@@ -105,23 +204,143 @@ def scrape_all():
     """run all scrapers and return combined data"""
     try:
         force_refresh = request.args.get('force', 'false').lower() == 'true'
+        full = request.args.get('full', 'false').lower() == 'true'
         scraper_list = get_all_scrapers()
+        if full:
+            request_full_crawl(scraper_list)
+            force_refresh = True
+
+        # hand long scrapes to a background job and return its id right away
+        if request.args.get('async', 'false').lower() == 'true':
+            return start_scrape_job(list(scraper_list), force_refresh)
+
+        # send each source as soon as its scraper finishes
+        stream = request.args.get('stream', '').lower()
+        if stream in ('ndjson', 'sse'):
+            return stream_scrape_all(list(scraper_list), force_refresh, stream)
+
+        # run every source at once - wall time is the slowest source
+        source_results = runner.run_all(scraper_list, lambda name: run_scraper(name, force_refresh))
+
+        # every source's result is in the cache now - sources that timed
+        # out fall back to whatever we scraped last time
+        timed_out = [name for name in scraper_list if source_results[name]['status'] != 'done']
+        entries = {name: cache.get(name) for name in scraper_list}
+
+        return response_cache.respond(
+                'scrape_all',
+                (data_version(entries), tuple(timed_out)),
+                lambda: {
+                    'success': True,
+                    'data': {name: entry['data'] for name, entry in entries.items()},
+                    'timed_out': timed_out,
+                    'timestamp': latest_timestamp(entries)
+                    })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'traceback': traceback.format_exc()
+            }), 500
 
-        results = {}
-        for scraper_name in scraper_list:
-            results[scraper_name] = run_scraper(scraper_name, force_refresh)
 
-        return jsonify({
+def stream_scrape_all(sources, force_refresh=False, fmt='ndjson'):
+    """stream one message per source as ndjson lines or server-sent events"""
+    def encode(event, payload):
+        body = json.dumps(payload, default=str)
+        if fmt == 'sse':
+            return f"event: {event}\ndata: {body}\n\n"
+        return body + "\n"
+
+    def generate():
+        timed_out = []
+        # closing the generator (client went away) cancels unfinished sources
+        for result in runner.iter_results(sources, lambda name: run_scraper(name, force_refresh)):
+            source = result['source']
+            if result['status'] == 'done':
+                data = result['data']
+            else:
+                timed_out.append(source)
+                data = cache.get(source)['data']
+
+            yield encode('source', {
+                'source': source,
+                'status': result['status'],
+                'data': data,
+                'count': len(data),
+                'elapsed': result['elapsed']
+                })
+
+        yield encode('done', {
+            'done': True,
             'success': True,
-            'data': results,
+            'timed_out': timed_out,
             'timestamp': datetime.now().isoformat()
             })
-    except Exception as e:
+
+    mimetype = 'text/event-stream' if fmt == 'sse' else 'application/x-ndjson'
+    return Response(stream_with_context(generate()), mimetype=mimetype,
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@app.route('/api/jobs', methods=['post'])
+def create_job():
+    """start a background scrape job for some or all sources"""
+    body = request.get_json(silent=True) or {}
+    scraper_list = get_all_scrapers()
+    sources = body.get('sources') or list(scraper_list)
+
+    invalid = [source for source in sources if source not in scraper_list]
+    if invalid:
         return jsonify({
             'success': False,
-            'error': str(e),
-            'traceback': traceback.format_exc()
-            }), 500
+            'error': f'invalid sources: {invalid}. available: {list(scraper_list.keys())}'
+            }), 400
+
+    force_refresh = bool(body.get('force', False))
+    if body.get('full'):
+        request_full_crawl(sources)
+        force_refresh = True
+    return start_scrape_job(sources, force_refresh)
+
+
+@app.route('/api/jobs', methods=['get'])
+def list_jobs():
+    """list retained scrape jobs"""
+    return jsonify({
+        'success': True,
+        'jobs': jobs.list_jobs(),
+        'timestamp': datetime.now().isoformat()
+        })
+
+
+@app.route('/api/jobs/<job_id>', methods=['get'])
+def get_job(job_id):
+    """get a scrape job's per-source progress and finished results"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': f'unknown or expired job: {job_id}'
+            }), 404
+
+    return jsonify({
+        'success': True,
+        'job': job,
+        'timestamp': datetime.now().isoformat()
+        })
+
+
+def start_scrape_job(sources, force_refresh=False):
+    """submit a scrape job and build the 202 response pointing at it"""
+    job_id = jobs.submit('scrape', sources, lambda source: run_scraper(source, force_refresh))
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status_url': f'/api/jobs/{job_id}',
+        'sources': sources,
+        'timestamp': datetime.now().isoformat()
+        }), 202
 
 
 @app.route('/api/scrape/<source>', methods=['get'])
@@ -137,14 +356,27 @@ def scrape_source(source):
                 'error': f'invalid source: {source}. available: {list(scraper_list.keys())}'
                 }), 400
 
-        data = run_scraper(source, force_refresh)
-
-        return jsonify({
-            'success': True,
-            'data': data,
-            'source': source,
-            'timestamp': datetime.now().isoformat()
-            })
+        if request.args.get('full', 'false').lower() == 'true':
+            request_full_crawl([source])
+            force_refresh = True
+
+        run_scraper(source, force_refresh)
+
+        # the scrape's result is in the cache; answer with the cached body
+        entry = cache.get(source)
+        stale = is_stale(source)
+        refreshing = source in scheduler.get_stats()['refreshing']
+        return response_cache.respond(
+                ('scrape', source),
+                (entry['timestamp'], stale, refreshing),
+                lambda: {
+                    'success': True,
+                    'data': entry['data'],
+                    'source': source,
+                    'stale': stale,
+                    'refreshing': refreshing,
+                    'timestamp': entry['timestamp']
+                    })
     except Exception as e:
         return jsonify({
             'success': False,
@@ -165,86 +397,219 @@ def get_cached_data(source):
             'error': f'invalid source: {source}. available: {list(scraper_list.keys())}'
             }), 400
 
-    # initialize cache if not exists
-    if source not in cache:
-        cache[source] = {'data': [], 'timestamp': None}
+    entry = cache.get(source)
+    stale = is_stale(source)
+    refreshing = source in scheduler.get_stats()['refreshing']
 
-    return jsonify({
-        'success': True,
-        'data': cache[source]['data'],
-        'timestamp': cache[source]['timestamp'],
-        'source': source
-        })
+    return response_cache.respond(
+            ('data', source),
+            (entry['timestamp'], stale, refreshing),
+            lambda: {
+                'success': True,
+                'data': entry['data'],
+                'timestamp': entry['timestamp'],
+                'stale': stale,
+                'refreshing': refreshing,
+                'source': source
+                })
 
 
 @app.route('/api/stats', methods=['get'])
 def get_stats():
     """get scraping statistics"""
-    stats = {}
     scraper_list = get_all_scrapers()
+    refresh_status = scheduler.get_stats()
+
+    # ages move every second - the body is rebuilt at most every
+    # RESPONSE_STATS_MAX_AGE seconds unless a source changes
+    max_age = app.config.get('RESPONSE_STATS_MAX_AGE', 5)
+    version = (
+            int(datetime.now().timestamp() // max_age) if max_age else datetime.now().timestamp(),
+            tuple(sorted(cache.timestamps().items())),
+            tuple(refresh_status['refreshing']),
+            tuple(sorted(ttl_policy.get_stats()['failing']))
+            )
+    return response_cache.respond('stats', version, lambda: build_stats(scraper_list, refresh_status),
+                                  max_age=max_age)
+
+
+def build_stats(scraper_list, refresh_status):
+    """per-source counts, ages and refresh status for /api/stats"""
+    stats = {}
+    entries = cache.snapshot()
 
     for source in scraper_list:
-        if source in cache:
+        if source in entries:
             stats[source] = {
-                    'count': len(cache[source]['data']),
-                    'last_updated': cache[source]['timestamp'],
-                    'cached': cache[source]['timestamp'] is not None,
-                    'display_name': scraper_list[source]['display_name']
+                    'count': len(entries[source]['data']),
+                    'last_updated': entries[source]['timestamp'],
+                    'cached': entries[source]['timestamp'] is not None,
+                    'refreshing': source in refresh_status['refreshing'],
+                    'next_refresh': refresh_status['sources'][source]['next_run'],
+                    'display_name': scraper_list[source]['display_name'],
+                    **ttl_policy.describe(source, entries[source])
                     }
         else:
             stats[source] = {
                     'count': 0,
                     'last_updated': None,
                     'cached': False,
-                    'display_name': scraper_list[source]['display_name']
+                    'refreshing': source in refresh_status['refreshing'],
+                    'next_refresh': refresh_status['sources'][source]['next_run'],
+                    'display_name': scraper_list[source]['display_name'],
+                    **ttl_policy.describe(source, {'timestamp': None})
                     }
 
-    return jsonify({
+    return {
         'success': True,
         'stats': stats,
         'timestamp': datetime.now().isoformat()
+        }
+
+
+@app.route('/api/metrics', methods=['get'])
+def get_metrics():
+    """get performance metrics of the scraping engine"""
+    return jsonify({
+        'success': True,
+        'runner': runner.get_stats(),
+        'http': http_client.get_stats(),
+        'rate_limiter': rate_limiter.get_stats(),
+        'http_cache': http_cache.get_stats() if http_cache else None,
+        'fingerprints': fingerprints.get_stats() if fingerprints else None,
+        'detail_cache': detail_cache.get_stats() if detail_cache else None,
+        'high_water': high_water.get_stats() if high_water else None,
+        'browser_pool': browser_pool.get_stats(),
+        'parse_pool': parse_pool.get_stats() if parse_pool else None,
+        'single_flight': scrape_flight.get_stats(),
+        'source_locks': source_locks.get_stats() if source_locks else None,
+        'scheduler': scheduler.get_stats(),
+        'ttl_policy': ttl_policy.get_stats(),
+        'response_cache': response_cache.get_stats(),
+        'jobs': jobs.get_stats(),
+        'backend': app.config.get('SCRAPE_BACKEND'),
+        'timestamp': datetime.now().isoformat()
         })
 
 
+def data_version(entries):
+    """version of a set of cache entries - changes whenever one is re-scraped"""
+    return tuple(sorted((source, entry['timestamp']) for source, entry in entries.items()))
+
+
+def latest_timestamp(entries):
+    """timestamp of the most recent scrape among entries"""
+    return max((entry['timestamp'] for entry in entries.values() if entry['timestamp']), default=None)
+
+
+def is_stale(source):
+    """whether a source's cached data is past its ttl (and not backing off after a failure)"""
+    return not ttl_policy.is_fresh(source, cache.get(source))
+
+
 def run_scraper(source, force_refresh=False):
     """run specific scraper with caching"""
-    # initialize cache if not exists
-    if source not in cache:
-        cache[source] = {'data': [], 'timestamp': None}
-
-    # check cache first
-    if not force_refresh and cache[source]['timestamp'] is not None:
-        # return cached data if less than 5 minutes old
-        try:
-            cache_time = datetime.fromisoformat(cache[source]['timestamp'])
-            time_diff = datetime.now() - cache_time
-            if time_diff.seconds < 300:  # 5 minutes
-                print(f"📦 returning cached data for {source}")
-                return cache[source]['data']
-        except ValueError as e:
-            print(f"⚠️ invalid timestamp format for {source}: {e}")
-        except TypeError as e:
-            print(f"⚠️ invalid timestamp type for {source}: {e}")
-        except Exception as e:
-            print(f"⚠️ unexpected error checking cache for {source}: {e}")
-
-    # run scraper
+    entry = cache.get(source)
+
+    # stale-while-revalidate: with background refresh running, answer from
+    # memory right away and let the scheduler re-scrape stale sources
+    if not force_refresh and scheduler.running and entry['timestamp'] is not None:
+        if is_stale(source):
+            scheduler.trigger(source)
+        print(f"📦 returning cached data for {source}")
+        return entry['data']
+
+    # check cache first - fresh within the source's ttl, or a recent
+    # failure is still backing off
+    if not force_refresh and ttl_policy.is_fresh(source, entry):
+        print(f"📦 returning cached data for {source}")
+        return entry['data']
+
+    # callers arriving while this source is being scraped wait and share the result
+    return scrape_flight.do(source, lambda: _scrape_shared(source))
+
+
+def refresh_source(source):
+    """background refresh - skipped while a failing source backs off, or
+    when another worker refreshed the source recently"""
+    retry_in = ttl_policy.retry_in(source)
+    if retry_in > 0:
+        print(f"⏸️ {source} is backing off after a failure, next try in {retry_in:.0f}s")
+        return cache.get(source)['data']
+    age = entry_age(cache.get(source))
+    if age is not None and age < ttl_policy.ttl_for(source) / 2:
+        print(f"📦 {source} was refreshed {age:.0f}s ago, skipping")
+        return cache.get(source)['data']
+    return run_scraper(source, force_refresh=True)
+
+
+def _scrape_shared(source):
+    """scrape a source while holding its cross-process lock.
+
+    a worker that had to wait for another worker's scrape of the same
+    source returns that scrape's result instead of scraping again.
+    """
+    if source_locks is None:
+        return _scrape_and_cache(source)
+
+    before = cache.get(source)['timestamp']
+    with source_locks.hold(source) as acquired:
+        entry = cache.get(source)
+        if entry['timestamp'] != before:
+            print(f"📦 {source} was just scraped by another worker")
+            return entry['data']
+        if not acquired:
+            print(f"⚠️ gave up waiting for the {source} lock - scraping anyway")
+        return _scrape_and_cache(source)
+
+
+def request_full_crawl(sources):
+    """make the next scrape of each source re-crawl every page"""
+    if high_water:
+        for source in sources:
+            high_water.request_full(source)
+
+
+def _scrape_and_cache(source):
+    """run a scraper and store its results in the cache"""
     print(f"🔍 running {source} scraper...")
 
-    scraper_class = get_scraper(source)
-    if scraper_class:
-        try:
-            scraper = scraper_class()
-            data = scraper.scrape()
-        except Exception as e:
-            print(f"❌ error running {source} scraper: {e}")
-            data = []
-    else:
-        data = []
+    previous = cache.get(source)
+    if previous['timestamp'] is None:
+        # nothing cached to merge new rows into yet
+        request_full_crawl([source])
+
+    outcome = {'rows': 0}
+
+    def scrape():
+        scraper_class = get_scraper(source)
+        if not scraper_class:
+            return []
+        # a scraper that cannot read its site raises (ScrapeError), so a
+        # failure never reaches the high-water marks or the cache
+        rows = async_engine.scrape(source) if async_engine else scraper_class().scrape()
+        outcome['rows'] = len(rows or [])
+        return rows or []
+
+    # new rows are merged over the rows of the previous scrape
+    try:
+        data, _ = run_incremental(source, scrape, previous['data'])
+        error = None if outcome['rows'] or not previous['data'] else 'scrape returned no notices'
+    except Exception as e:
+        print(f"❌ error running {source} scraper: {e}")
+        error = str(e)
+
+    # an error, or nothing at all where there were notices before, is a
+    # failure: keep serving the last good notices (if any) and back off -
+    # also on a cold start, so a site that is down is not hit on every request
+    if error:
+        delay = ttl_policy.record_failure(source, error)
+        print(f"⚠️ keeping {len(previous['data'])} cached items for {source}, next try in {delay:.0f}s")
+        return previous['data']
+    ttl_policy.record_success(source)
 
     # update cache
-    cache[source]['data'] = data
-    cache[source]['timestamp'] = datetime.now().isoformat()
+    cache.set(source, data)
 
     print(f"✅ scraped {len(data)} items from {source}")
     return data
@@ -254,20 +619,25 @@ def run_scraper(source, force_refresh=False):
 def export_json():
     """export all data as json"""
     try:
-        # combine all data
-        all_data = []
-        for source in cache:
-            for item in cache[source]['data']:
-                item_copy = item.copy() if hasattr(item, 'copy') else dict(item)
-                item_copy['source'] = source
-                all_data.append(item_copy)
-
-        return jsonify({
-            'success': True,
-            'data': all_data,
-            'count': len(all_data),
-            'timestamp': datetime.now().isoformat()
-            })
+        entries = cache.snapshot()
+
+        def build():
+            # combine all data
+            all_data = []
+            for source, entry in entries.items():
+                for item in entry['data']:
+                    item_copy = item.copy() if hasattr(item, 'copy') else dict(item)
+                    item_copy['source'] = source
+                    all_data.append(item_copy)
+
+            return {
+                'success': True,
+                'data': all_data,
+                'count': len(all_data),
+                'timestamp': latest_timestamp(entries)
+                }
+
+        return response_cache.respond('export_json', data_version(entries), build)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -281,8 +651,8 @@ def export_csv():
     try:
         # combine all data
         all_data = []
-        for source in cache:
-            for item in cache[source]['data']:
+        for source, entry in cache.snapshot().items():
+            for item in entry['data']:
                 item_copy = item.copy() if hasattr(item, 'copy') else dict(item)
                 item_copy['source'] = source
                 all_data.append(item_copy)
@@ -327,6 +697,13 @@ def export_csv():
             }), 500
 
 
+# warm the cache and keep it fresh - sources still fresh from before a
+# restart wait until they go stale
+if app.config.get('REFRESH_ENABLED') and background_allowed:
+    scheduler.start(ages={source: entry_age({'timestamp': timestamp})
+                          for source, timestamp in cache.timestamps().items()})
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("📊 tender scraper api server")
@@ -338,7 +715,10 @@ if __name__ == '__main__':
     print("   get /api/health - health check")
     print("   get /api/scrapers - list all scrapers")
     print("   get /api/stats - scraper statistics")
-    print("   get /api/scrape/all - run all scrapers")
+    print("   get /api/metrics - performance metrics")
+    print("   get /api/scrape/all - run all scrapers (?async=true for a job)")
+    print("   post /api/jobs - start a background scrape job")
+    print("   get /api/jobs/<job_id> - scrape job progress")
     for name in get_all_scrapers():
         print(f"   get /api/scrape/{name} - run {name} scraper")
     print("   get /api/export/json - export all data as json")
@@ -0,0 +1,77 @@
+# backend/benchmarks/bench_async_scan.py
+"""Compare a full scan on the sequential path against the asyncio backend.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_async_scan --latency 0.2
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+
+from benchmarks.stub_server import StubServer, point_scrapers_at
+from services.async_engine import AsyncScrapeEngine
+from services.rate_limiter import configure_rate_limiter
+
+
+def run_sequential(stub):
+    """Current path: every scraper's scrape() one after another"""
+    counts = {}
+    for name, scraper in point_scrapers_at(stub).items():
+        counts[name] = len(scraper.scrape())
+    return counts
+
+
+async def gather(engine, scrapers):
+    """Scrape {source: scraper instance} concurrently on the engine loop"""
+    async def scrape(source, scraper):
+        try:
+            return source, await asyncio.wait_for(engine.scrape_instance(scraper), engine.timeout_for(source))
+        except Exception as e:
+            print(f"❌ {source}: {e!r}")
+            return source, None
+
+    return dict(await asyncio.gather(*(scrape(source, scraper) for source, scraper in scrapers.items())))
+
+
+def run_async(stub, engine):
+    """Asyncio path: scrape_async() for every source on one loop"""
+    results = engine.run(gather(engine, point_scrapers_at(stub)))
+    return {name: len(data or []) for name, data in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--latency', type=float, default=0.2, help='stub server latency per request (s)')
+    parser.add_argument('--rate', type=float, default=20.0, help='politeness limit for the stub host (req/s)')
+    args = parser.parse_args()
+
+    stub = StubServer(latency=args.latency).start()
+    engine = AsyncScrapeEngine()
+
+    try:
+        rows = []
+        for label, scan in (('sequential', lambda: run_sequential(stub)),
+                            ('asyncio', lambda: run_async(stub, engine))):
+            # fresh token buckets, so the second path does not pay for the first
+            configure_rate_limiter({'RATE_LIMITS': {'127.0.0.1': (args.rate, 10)}})
+            stub.requests = 0
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                counts = scan()
+            rows.append((label, time.perf_counter() - started, stub.requests, sum(counts.values())))
+
+        print(f"stub latency: {args.latency}s per request")
+        print(f"{'path':<12}{'seconds':>10}{'requests':>10}{'items':>8}")
+        for label, seconds, requests, items in rows:
+            print(f"{label:<12}{seconds:>10.2f}{requests:>10}{items:>8}")
+        print(f"speedup: {rows[0][1] / rows[1][1]:.1f}x")
+    finally:
+        engine.close()
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
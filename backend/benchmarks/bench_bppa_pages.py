@@ -0,0 +1,60 @@
+# backend/benchmarks/bench_bppa_pages.py
+"""Time a full BPPA crawl at different page concurrencies.
+
+The stub serves a paginated listing (?page=N) with a fixed latency; later
+pages start one row early, so the crawl has duplicates to drop. With a
+fixed per-page latency the crawl should take about
+ceil((pages - 1) / concurrency) + 1 round trips, not one per page.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_bppa_pages --total 200 --per-page 20 --latency 0.2
+"""
+import argparse
+import contextlib
+import io
+import math
+import time
+
+from benchmarks.stub_server import StubServer, bppa_listing
+from scrapers.bppa import BPPAScraper
+from services.rate_limiter import configure_rate_limiter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--total', type=int, default=200, help='notices in the listing')
+    parser.add_argument('--per-page', type=int, default=20, help='notices per listing page')
+    parser.add_argument('--latency', type=float, default=0.2, help='stub response latency (seconds)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    configure_rate_limiter({'RATE_LIMITS': {'127.0.0.1': (1000.0, 100)}})
+    stub = StubServer(latency=args.latency, feeds={
+            '/bppa': lambda params: bppa_listing(params, total=args.total, per_page=args.per_page)}).start()
+    pages = math.ceil(args.total / args.per_page)
+
+    try:
+        print(f"{args.total} notices, {pages} pages, {args.latency * 1000:.0f} ms latency")
+        print(f"{'concurrency':<12}{'seconds':>9}{'requests':>10}{'tenders':>9}{'ideal s':>9}")
+        for concurrency in args.concurrency:
+            scraper = BPPAScraper()
+            scraper.base_url = stub.base_url
+            # a fresh query string per run so no cached page is reused
+            scraper.url = f"{stub.base_url}/bppa?run={concurrency}"
+            scraper.page_concurrency = concurrency
+            stub.requests = 0
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                tenders = scraper.scrape()
+            elapsed = time.perf_counter() - started
+            ideal = (1 + math.ceil((pages - 1) / concurrency)) * args.latency
+            unique = len({t['reference_no'] for t in tenders}) == len(tenders)
+            print(f"{concurrency:<12}{elapsed:>9.2f}{stub.requests:>10}{len(tenders):>9}{ideal:>9.2f}"
+                  f"{'' if unique else '  (duplicates!)'}")
+    finally:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# backend/benchmarks/bench_detail_reader.py
+"""Compare reading BDJobs detail pages whole vs streaming until the deadline.
+
+The full-page path is the previous get_deadline(): download everything,
+build a soup, get_text() and search. The streaming path feeds chunks to a
+FieldScanner and closes the connection once the deadline is found.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_detail_reader --pages 10 --padding 300000 --bandwidth 2000000
+"""
+import argparse
+import time
+
+from benchmarks.stub_server import StubServer
+from scrapers.bdjobs import DEADLINE_PATTERN
+from services.html_parser import make_soup
+from services.http_client import HttpClient
+from services.rate_limiter import configure_rate_limiter
+from services.stream_extract import FieldScanner
+
+
+def detail_page(padding, late):
+    filler = "<p>" + "lorem ipsum " * (padding // 12) + "</p>"
+    deadline = "<p>Application deadline: 10th March 2026</p>"
+    body = filler + deadline if late else deadline + filler
+    return f"<html><head><script>var x = '01/01/1999';</script></head><body><h1>Tender</h1>{body}</body></html>"
+
+
+def read_full(http, url):
+    response = http.get(url, timeout=30)
+    text = make_soup(response.content).get_text(separator=" ", strip=True)
+    match = DEADLINE_PATTERN.search(text)
+    return (match.group(0) if match else None), len(response.content)
+
+
+def read_streaming(http, url):
+    scanner = FieldScanner(DEADLINE_PATTERN)
+    return http.scan(url, scanner, timeout=30), scanner.bytes_read
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=10, help='detail pages read per path')
+    parser.add_argument('--padding', type=int, default=300000, help='bytes of filler text per page')
+    parser.add_argument('--bandwidth', type=float, default=2000000, help='stub transfer rate (bytes/s)')
+    parser.add_argument('--late', action='store_true', help='put the deadline after the filler')
+    args = parser.parse_args()
+
+    configure_rate_limiter({'RATE_LIMITS': {'127.0.0.1': (1000.0, 100)}})
+    stub = StubServer(latency=0.05, detail_page=lambda: detail_page(args.padding, args.late),
+                      bandwidth=args.bandwidth).start()
+    http = HttpClient().for_source('bdjobs')
+
+    try:
+        rows = []
+        for label, read in (('full page', read_full), ('streaming', read_streaming)):
+            stub.bytes_sent = 0
+            times, received, values = [], 0, set()
+            for i in range(args.pages):
+                started = time.perf_counter()
+                value, size = read(http, f"{stub.base_url}/bdjobs/detail/{i}")
+                times.append(time.perf_counter() - started)
+                received += size
+                values.add(value)
+            time.sleep(0.2)  # let the server notice closed connections
+            rows.append((label, sum(times) / len(times), received, stub.bytes_sent, values))
+
+        print(f"{args.pages} pages of ~{args.padding // 1024} KB at {args.bandwidth / 1e6:.1f} MB/s, "
+              f"deadline {'at the end' if args.late else 'near the top'}")
+        print(f"{'path':<12}{'ms to field':>12}{'KB read':>10}{'KB sent':>10}  value")
+        for label, seconds, received, sent, values in rows:
+            print(f"{label:<12}{seconds * 1000:>12.1f}{received // 1024:>10}{sent // 1024:>10}  {', '.join(map(str, values))}")
+    finally:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
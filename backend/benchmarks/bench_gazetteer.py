@@ -0,0 +1,107 @@
+# backend/benchmarks/bench_gazetteer.py
+"""Compare the previous country/Bangladesh checks with the shared gazetteer.
+
+The previous paths are copied here as they were: WorldBank's keyword dict
+rebuilt and lower-cased per title, and ToRFilter's upper-cased concatenation
+with substring checks (which also counts the 'BD' in 'ABDUL'). The new paths
+are WorldBankScraper._extract_country and ToRFilter._is_bangladesh on the
+gazetteer's single compiled pattern.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_gazetteer --titles 100000
+"""
+import argparse
+import random
+import re
+import time
+
+from scrapers.worldbank import WorldBankScraper
+from services.gazetteer import CODES, Gazetteer, _default_places
+from services.tor_filter import ToRFilter
+
+TOPICS = ['Impact evaluation of', 'Baseline survey for', 'Consultancy on', 'Third-party monitoring of',
+          'Feasibility study for', 'Endline assessment of', 'Technical support to']
+SUBJECTS = ['rural water supply', 'social protection', 'primary education', 'urban transport',
+            'climate resilience', 'health systems', 'ABDUL LATIF memorial school', 'agricultural value chains']
+PLACES = ['Kenya', 'Odisha', 'Vietnam', 'Nepal', 'Moldova', 'Dhaka', 'Cox\'s Bazar', 'Sirajganj', 'Peru',
+          'কুড়িগ্রাম', 'Sunamganj district', 'the region', 'Gaza', 'Tajikistan', 'Jessore']
+
+
+def previous_extract_country(title):
+    country_keywords = {
+            'India': ['India', 'Odisha', 'Telangana', 'Karnataka', 'Delhi', 'Mumbai'],
+            'Azerbaijan': ['Azerbaijan', 'Baku'],
+            'Jamaica': ['Jamaica', 'Kingston'],
+            'Central Asia': ['Central Asia', 'Kazakhstan', 'Uzbekistan', 'Turkmenistan', 'Kyrgyz', 'Tajik'],
+            'Africa': ['Africa', 'Kenya', 'Nigeria', 'Ghana', 'Ethiopia', 'Tanzania'],
+            'Southeast Asia': ['Vietnam', 'Thailand', 'Indonesia', 'Philippines', 'Cambodia', 'Laos'],
+            'Eastern Europe': ['Ukraine', 'Moldova', 'Georgia', 'Armenia'],
+            'Middle East': ['Jordan', 'Lebanon', 'Iraq', 'Yemen', 'West Bank', 'Gaza']
+            }
+    for country, keywords in country_keywords.items():
+        for keyword in keywords:
+            if keyword.lower() in title.lower():
+                return country
+    potential_places = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', title)
+    skip_words = ['For', 'The', 'And', 'Of', 'In', 'To', 'With', 'From', 'At', 'A', 'An',
+                  'Consultant', 'Consultancy', 'Services', 'Project', 'Program', 'Study',
+                  'Support', 'Development', 'Technical', 'Financial', 'Management']
+    for place in potential_places:
+        if place not in skip_words and len(place) > 3:
+            return place
+    return None
+
+
+def previous_is_bangladesh(notice):
+    text = str(notice.get('country', '')).upper() + ' ' + \
+            str(notice.get('place', '')).upper() + ' ' + \
+            str(notice.get('title', '')).upper() + ' ' + \
+            str(notice.get('description', '')).upper()
+    if 'BANGLADESH' in text or 'BD' in text or 'DHAKA' in text:
+        return True
+    return notice.get('source') in ['bppa', 'cptu', 'bdjobs']
+
+
+def timed(function, items):
+    started = time.perf_counter()
+    results = [function(item) for item in items]
+    return time.perf_counter() - started, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--titles', type=int, default=100000, help='synthetic titles to classify')
+    args = parser.parse_args()
+
+    random.seed(19)
+    titles = [f"{random.choice(TOPICS)} {random.choice(SUBJECTS)} in {random.choice(PLACES)}"
+              for _ in range(args.titles)]
+    notices = [{'title': title, 'country': '', 'description': '', 'source': 'undp'} for title in titles]
+
+    started = time.perf_counter()
+    gazetteer = Gazetteer(_default_places(), codes=CODES)
+    print(f"gazetteer: {len(gazetteer)} names, built once at import in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    scraper = WorldBankScraper(use_selenium=False, use_data_feed=False)
+    tor_filter = ToRFilter()
+    rows = [
+            ('country (before)',) + timed(previous_extract_country, titles),
+            ('country (gazetteer)',) + timed(scraper._extract_country, titles),
+            ('bangladesh (before)',) + timed(previous_is_bangladesh, notices),
+            ('bangladesh (gazetteer)',) + timed(tor_filter._is_bangladesh, notices),
+            ]
+
+    print(f"{'check':<24}{'seconds':>9}{'us/title':>10}  result")
+    for label, seconds, results in rows:
+        summary = (f"{sum(results)} Bangladesh" if label.startswith('bangladesh')
+                   else f"{sum(r is not None for r in results)} with a country")
+        print(f"{label:<24}{seconds:>9.2f}{seconds / len(titles) * 1e6:>10.1f}  {summary}")
+
+    flagged_before = sum(previous_is_bangladesh({'title': t}) for t in titles if 'ABDUL' in t)
+    flagged_now = sum(tor_filter._is_bangladesh({'title': t}) for t in titles if 'ABDUL' in t)
+    print(f"titles flagged only by the 'BD' in 'ABDUL': {flagged_before - flagged_now}")
+
+
+if __name__ == '__main__':
+    main()
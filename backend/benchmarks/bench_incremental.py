@@ -0,0 +1,89 @@
+# backend/benchmarks/bench_incremental.py
+"""Show incremental crawls stopping at rows already seen.
+
+A paginated BPPA listing (newest first) is crawled in full, then again
+after a few notices are published, then once more with a full re-crawl
+requested. Each run goes through run_incremental() the way the app does,
+so the merged listing, the new rows and the requests made are reported.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_incremental --total 200 --per-page 20 --new 3
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from benchmarks.stub_server import StubServer
+from scrapers.bppa import BPPAScraper
+from services.high_water import configure_high_water_marks, run_incremental
+from services.rate_limiter import configure_rate_limiter
+
+
+def newest_first_listing(state, per_page):
+    """BPPA listing page whose notice numbers count down from the newest"""
+    def page(params):
+        number = max(1, int(params.get('page', 1)))
+        newest = state['newest']
+        ids = range(newest - (number - 1) * per_page, max(0, newest - number * per_page), -1)
+        body = "".join(
+                f"<tr><td>{i}</td><td><a href='/bppa/notice/{i}'>BPPA notice {i}</a><br>REF-{i}</td>"
+                f"<td>Entity</td><td>01/01/2026</td><td>10/02/2026<br>12:00 PM</td><td>Dhaka</td></tr>"
+                for i in ids
+                )
+        first = (number - 1) * per_page + 1
+        return (f"<html><body><div id='bodyContent'><table><tbody>{body}</tbody></table>"
+                f"<div class='col-md-12'>Showing {first} to {first + len(ids) - 1} of {newest}</div>"
+                f"<a href='/bppa?page=2'>2</a></div></body></html>")
+    return page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--total', type=int, default=200, help='notices listed at first')
+    parser.add_argument('--per-page', type=int, default=20, help='notices per listing page')
+    parser.add_argument('--new', type=int, default=3, help='notices published before the second crawl')
+    parser.add_argument('--latency', type=float, default=0.1, help='stub response latency (seconds)')
+    args = parser.parse_args()
+
+    configure_rate_limiter({'RATE_LIMITS': {'127.0.0.1': (1000.0, 100)}})
+    marks = configure_high_water_marks({'HIGH_WATER_FILE': os.path.join(tempfile.mkdtemp(), 'marks.json')})
+    state = {'newest': args.total}
+    stub = StubServer(latency=args.latency, feeds={'/bppa': newest_first_listing(state, args.per_page)}).start()
+
+    listing = []
+    print(f"{'crawl':<22}{'requests':>9}{'seconds':>9}{'scraped':>9}{'new':>6}{'listing':>9}")
+    try:
+        for label, published, full in (('first (full)', 0, False), (f'{args.new} published', args.new, False),
+                                       ('nothing new', 0, False), ('full requested', 0, True)):
+            state['newest'] += published
+            if full:
+                marks.request_full('bppa')
+            scraper = BPPAScraper()
+            scraper.base_url = stub.base_url
+            scraper.url = f"{stub.base_url}/bppa"
+            stub.requests = 0
+            scraped = []
+
+            def scrape():
+                scraped.extend(scraper.scrape())
+                return scraped
+
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                listing, new = run_incremental('bppa', scrape, listing)
+            elapsed = time.perf_counter() - started
+            print(f"{label:<22}{stub.requests:>9}{elapsed:>9.2f}{len(scraped):>9}{len(new):>6}{len(listing):>9}")
+
+        expected = state['newest']
+        complete = sorted(int(t['reference_no'][4:]) for t in listing) == list(range(1, expected + 1))
+        print(f"final listing has every notice 1..{expected} exactly once: {'yes' if complete else 'NO'}")
+    finally:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# backend/benchmarks/bench_multi_worker.py
+"""Several worker processes asking for the same source at the same moment.
+
+Starts N app processes sharing one cache directory (as gunicorn workers
+on one host would), points their scrapers at the stub and has each force
+a refresh of the same source at the same instant. Counts the requests the
+stub received: with the cross-process scrape lock one worker scrapes and
+the others reuse its result; without it every worker scrapes.
+
+Each worker also records the same notices in a shared MemoryTracker file;
+every notice should be reported new exactly once across all workers.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_multi_worker --workers 4 --latency 0.3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.stub_server import StubServer
+
+
+def child():
+    """Runs in each worker process"""
+    import app as flask_app
+    from benchmarks.stub_server import patch_scrapers
+    from services.memory_tracker import MemoryTracker
+    from services.rate_limiter import configure_rate_limiter
+    configure_rate_limiter({'RATE_LIMITS': {'127.0.0.1': (1000.0, 100)}})
+    patch_scrapers(os.environ['STUB_URL'])
+    source = os.environ['SOURCE']
+    tracker = MemoryTracker(os.environ['MEMORY_FILE'])
+    notices = [{'link': f'/notice/{number}', 'title': f'notice {number}'} for number in range(50)]
+
+    # line up with the other workers
+    time.sleep(max(0.0, float(os.environ['START_AT']) - time.time()))
+    started = time.perf_counter()
+    response = flask_app.app.test_client().get(f'/api/scrape/{source}?force=true')
+    elapsed = time.perf_counter() - started
+    new = len(tracker.get_new_notices(notices))
+    print(json.dumps({'seconds': elapsed, 'notices': len(response.get_json()['data']), 'new': new}))
+
+
+def run(workers, locks, stub, source):
+    workdir = tempfile.mkdtemp()
+    env = dict(os.environ,
+               flask_env='testing', REFRESH_ENABLED='false', PARSE_POOL_ENABLED='false',
+               HTTP_CACHE_ENABLED='false', SCRAPE_LOCK_ENABLED='true' if locks else 'false',
+               SCRAPE_CACHE_FILE=os.path.join(workdir, 'scrape_cache.db'),
+               SCRAPE_LOCK_FILE=os.path.join(workdir, 'locks.db'),
+               DETAIL_CACHE_FILE=os.path.join(workdir, 'details.json'),
+               HIGH_WATER_FILE=os.path.join(workdir, 'high_water.json'),
+               MEMORY_FILE=os.path.join(workdir, 'seen_links.json'),
+               STUB_URL=stub.base_url, SOURCE=source,
+               # leave time for every worker to import the app first
+               START_AT=str(time.time() + 4))
+    before = stub.requests
+    processes = [subprocess.Popen([sys.executable, '-m', 'benchmarks.bench_multi_worker', '--child'],
+                                  env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+                 for _ in range(workers)]
+    results = [json.loads(process.communicate()[0].strip().splitlines()[-1]) for process in processes]
+    return stub.requests - before, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=4, help='worker processes')
+    parser.add_argument('--latency', type=float, default=0.3, help='stub response latency (seconds)')
+    parser.add_argument('--source', default='pksf', help='source every worker refreshes')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child()
+
+    stub = StubServer(latency=args.latency).start()
+    try:
+        print(f"{args.workers} workers refresh {args.source} at once; stub latency {args.latency * 1000:.0f} ms")
+        for locks in (False, True):
+            requests, results = run(args.workers, locks, stub, args.source)
+            slowest = max(result['seconds'] for result in results)
+            print(f"  lock {'on ' if locks else 'off'}: {requests:>3} stub requests, slowest worker {slowest:.2f}s, "
+                  f"notices {[result['notices'] for result in results]}, "
+                  f"reported new {sum(result['new'] for result in results)} of 50")
+    finally:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
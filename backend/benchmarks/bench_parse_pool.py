@@ -0,0 +1,61 @@
+# backend/benchmarks/bench_parse_pool.py
+"""Compare parsing several large pages at once in threads vs the parse pool.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_parse_pool --pages 6 --rows 1500 --workers 4
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.stub_server import worldbank_page
+from scrapers.worldbank import WorldBankScraper
+from services.parse_pool import ParsePool
+
+
+def parse_all(pages, parse):
+    """Parse every page concurrently, one thread per page (like the runner)"""
+    with ThreadPoolExecutor(max_workers=len(pages)) as threads:
+        return sum(len(result) for result in threads.map(parse, pages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=int, default=6, help='pages parsed at the same time')
+    parser.add_argument('--rows', type=int, default=1500, help='table rows per page')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1))
+    args = parser.parse_args()
+
+    page = worldbank_page(rows=args.rows).encode('utf-8')
+    pages = [page] * args.pages
+    scraper = WorldBankScraper(use_selenium=False)
+
+    started = time.perf_counter()
+    pool = ParsePool(max_workers=args.workers, min_bytes=0).start()
+    warmup = time.perf_counter() - started
+
+    try:
+        rows = []
+        for label, parse in (('threads', scraper._parse_html),
+                             ('parse pool', lambda html: pool.parse(scraper, '_parse_html', html))):
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                items = parse_all(pages, parse)
+            rows.append((label, time.perf_counter() - started, items))
+
+        print(f"{args.pages} pages x {len(page) // 1024} KB, {args.workers} worker(s), "
+              f"{os.cpu_count()} CPU(s), pool warm-up {warmup:.2f}s")
+        print(f"{'path':<12}{'seconds':>10}{'items':>8}")
+        for label, seconds, items in rows:
+            print(f"{label:<12}{seconds:>10.2f}{items:>8}")
+        print(f"speedup: {rows[0][1] / rows[1][1]:.1f}x")
+    finally:
+        pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
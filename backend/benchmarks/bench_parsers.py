@@ -0,0 +1,115 @@
+# backend/benchmarks/bench_parsers.py
+"""Compare parse time and peak memory of each HTML parser backend, parsing
+the whole page vs only the region each scraper declares.
+
+Every scraper's own parse method is run on a copy of its page under each
+available backend. Pages come from the stub generators wrapped in typical
+site chrome, or from saved copies named <page>.html in --saved-dir.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_parsers --repeat 5
+    python -m benchmarks.bench_parsers --saved-dir saved_pages
+"""
+import argparse
+import contextlib
+import io
+import os
+import time
+import tracemalloc
+
+from benchmarks import stub_server
+from scrapers.bppa import BPPAScraper
+from scrapers.pksf import PKSFScraper
+from scrapers.undp import UNDPScraper
+from scrapers.care import CareScraper
+from scrapers.bdjobs import BDJobsScraper
+from scrapers.worldbank import WorldBankScraper
+from services import html_parser
+
+# page name -> (scraper class, parse method, stub page)
+PAGES = {
+        'bppa': (BPPAScraper, '_parse_page', lambda: stub_server.bppa_page(rows=200)),
+        'pksf': (PKSFScraper, '_parse', lambda: stub_server.pksf_page(rows=200)),
+        'undp': (UNDPScraper, '_parse', lambda: stub_server.undp_page(rows=200)),
+        'care': (CareScraper, '_parse', lambda: stub_server.care_page(rows=50)),
+        'bdjobs': (BDJobsScraper, '_parse_cards', lambda: stub_server.bdjobs_page(rows=100)),
+        'worldbank': (WorldBankScraper, '_parse_html', lambda: stub_server.worldbank_page(rows=200)),
+        }
+
+
+def available_backends():
+    backends = ['html.parser']
+    if html_parser.LXML_AVAILABLE:
+        backends.append('lxml')
+    if html_parser.SELECTOLAX_AVAILABLE:
+        backends.append('selectolax')
+    return backends
+
+
+def load_page(name, make_page, saved_dir):
+    if saved_dir:
+        path = os.path.join(saved_dir, f"{name}.html")
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return f.read()
+    return stub_server.with_site_chrome(make_page()).encode('utf-8')
+
+
+def measure(parse, content, repeat):
+    """Best-of-n seconds, peak traced memory and result size of parse(content)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        result = parse(content)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            parse(content)
+            best = min(best, time.perf_counter() - started)
+
+    items = len(result) if isinstance(result, list) else int(result is not None)
+    return best, peak, items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per page and backend (best is kept)')
+    parser.add_argument('--saved-dir', help='directory of saved <page>.html files to use instead of stub pages')
+    args = parser.parse_args()
+
+    backends = available_backends()
+    print("peak memory is Python allocations (tracemalloc); C parser buffers are not counted")
+    print(f"{'':<34}{'--- full page ---':>20}{'---- region ----':>20}")
+    print(f"{'page':<15}{'KB':>6}  {'backend':<13}{'ms':>9}{'peak KB':>11}{'ms':>9}{'peak KB':>11}{'items':>7}")
+
+    try:
+        for name, (scraper_class, method, make_page) in PAGES.items():
+            content = load_page(name, make_page, args.saved_dir)
+            with contextlib.redirect_stdout(io.StringIO()):
+                scraper = scraper_class()
+            parse = getattr(scraper, method)
+
+            for backend in backends:
+                html_parser.set_backend(backend)
+                html_parser.set_partial_parsing(False)
+                full_seconds, full_peak, full_items = measure(parse, content, args.repeat)
+                html_parser.set_partial_parsing(True)
+                seconds, peak, items = measure(parse, content, args.repeat)
+                print(f"{name:<15}{len(content) // 1024:>6}  {backend:<13}"
+                      f"{full_seconds * 1000:>9.1f}{full_peak // 1024:>11}"
+                      f"{seconds * 1000:>9.1f}{peak // 1024:>11}{items:>7}"
+                      + ("" if items == full_items else f"  (full page: {full_items} items!)"))
+
+            if html_parser.SELECTOLAX_AVAILABLE:
+                seconds, _, _ = measure(html_parser.LexborHTMLParser, content, args.repeat)
+                print(f"{'':<21}  {'(lexbor raw)':<13}{seconds * 1000:>9.1f}")
+    finally:
+        html_parser.set_backend(os.environ.get('HTML_PARSER', 'lxml'))
+        html_parser.set_partial_parsing(os.environ.get('HTML_PARTIAL_PARSING', 'true').lower() == 'true')
+
+
+if __name__ == '__main__':
+    main()
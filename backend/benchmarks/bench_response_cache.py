@@ -0,0 +1,103 @@
+# backend/benchmarks/bench_response_cache.py
+"""Cost of answering the dashboard's polling of the read endpoints.
+
+Fills the scrape cache with synthetic notices and times requests to
+/api/export/json and /api/data/<source>, comparing three cases:
+
+  jsonify   - the payload encoded with jsonify on every request (before)
+  cached    - the stored body served again (200, same version)
+  304       - the client sends If-None-Match with the ETag it already has
+
+It also prints body sizes per content-coding.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_response_cache --sources 6 --notices 1000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault('flask_env', 'testing')
+os.environ.setdefault('REFRESH_ENABLED', 'false')
+os.environ.setdefault('PARSE_POOL_ENABLED', 'false')
+os.environ.setdefault('SCRAPE_CACHE_BACKEND', 'memory')
+_workdir = tempfile.mkdtemp()
+os.environ.setdefault('SCRAPE_LOCK_FILE', os.path.join(_workdir, 'locks.db'))
+os.environ.setdefault('HIGH_WATER_FILE', os.path.join(_workdir, 'high_water.json'))
+
+from flask import jsonify  # noqa: E402
+
+import app as flask_app  # noqa: E402
+
+
+def notices(source, count):
+    return [{
+        'id': number,
+        'title': f'Consultancy services for the {source} programme, lot {number} - terms of reference',
+        'organization': f'{source.upper()} Procurement Unit',
+        'procurement_number': f'{source.upper()}/2026/{number:05d}',
+        'publication_date': '2026-10-01',
+        'deadline': '2026-11-15',
+        'country': 'Bangladesh',
+        'detail_url': f'https://example.org/{source}/tenders/{number}',
+        } for number in range(count)]
+
+
+def per_request(fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sources', type=int, default=6, help='sources to fill')
+    parser.add_argument('--notices', type=int, default=1000, help='notices per source')
+    parser.add_argument('--repeat', type=int, default=50, help='requests per case')
+    args = parser.parse_args()
+
+    app, cache = flask_app.app, flask_app.cache
+    sources = list(flask_app.get_all_scrapers())[:args.sources]
+    for source in sources:
+        cache.set(source, notices(source, args.notices))
+    client = app.test_client()
+
+    def old_export():
+        # what /api/export/json did on every request
+        with app.test_request_context():
+            all_data = []
+            for source, entry in cache.snapshot().items():
+                for item in entry['data']:
+                    item_copy = item.copy()
+                    item_copy['source'] = source
+                    all_data.append(item_copy)
+            jsonify({'success': True, 'data': all_data, 'count': len(all_data)}).get_data()
+
+    def old_data():
+        with app.test_request_context():
+            jsonify({'success': True, 'data': cache.get(sources[0])['data']}).get_data()
+
+    print(f"{len(sources)} sources x {args.notices} notices; ms per request")
+    for path, old in (('/api/export/json', old_export), (f'/api/data/{sources[0]}', old_data)):
+        first = client.get(path)
+        etag = first.headers['ETag']
+        results = {
+                'jsonify': per_request(old, args.repeat),
+                'cached': per_request(lambda: client.get(path).get_data(), args.repeat),
+                'cached br': per_request(lambda: client.get(path, headers={'Accept-Encoding': 'br'}).get_data(),
+                                         args.repeat),
+                '304': per_request(lambda: client.get(path, headers={'If-None-Match': etag}), args.repeat),
+                }
+        sizes = {coding: len(client.get(path, headers={'Accept-Encoding': coding}).get_data())
+                 for coding in ('identity', 'gzip', 'br')}
+        print(f"  {path}")
+        print("    " + "  ".join(f"{name} {ms:.2f}" for name, ms in results.items()))
+        print("    bytes " + "  ".join(f"{coding} {size:,}" for coding, size in sizes.items()))
+    print(f"  response cache: {flask_app.response_cache.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
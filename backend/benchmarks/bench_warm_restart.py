@@ -0,0 +1,85 @@
+# backend/benchmarks/bench_warm_restart.py
+"""Measure startup to first useful response, with and without a persistent cache.
+
+Each run starts a fresh Python process that imports the app (with every
+scraper pointed at the stub) and times GET /api/scrape/all until it
+returns notices. Each backend gets a first start on an empty cache and
+then a restart. With the in-memory cache a restart scrapes every source
+again; with SQLite the restart answers from disk.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_warm_restart --latency 0.3
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.stub_server import StubServer
+
+
+def child():
+    """Runs in the restarted process: import the app and time the first response"""
+    started = time.perf_counter()
+    import app as flask_app
+    imported = time.perf_counter()
+
+    from benchmarks.stub_server import patch_scrapers
+    from services.rate_limiter import configure_rate_limiter
+    configure_rate_limiter({'RATE_LIMITS': {'127.0.0.1': (1000.0, 100)}})
+    patch_scrapers(os.environ['STUB_URL'])
+
+    response = flask_app.app.test_client().get('/api/scrape/all')
+    data = response.get_json()['data']
+    done = time.perf_counter()
+    print(json.dumps({
+        'import': imported - started,
+        'first_response': done - imported,
+        'notices': sum(len(notices) for notices in data.values())
+        }))
+
+
+def run(backend, workdir, stub_url):
+    env = dict(os.environ,
+               flask_env='testing', REFRESH_ENABLED='false', SCRAPE_CACHE_BACKEND=backend,
+               SCRAPE_CACHE_FILE=os.path.join(workdir, 'scrape_cache.db'),
+               HTTP_CACHE_ENABLED='false', PARSE_POOL_ENABLED='false',
+               DETAIL_CACHE_FILE=os.path.join(workdir, 'details.json'),
+               HIGH_WATER_FILE=os.path.join(workdir, 'high_water.json'),
+               STUB_URL=stub_url)
+    started = time.perf_counter()
+    out = subprocess.run([sys.executable, '-m', 'benchmarks.bench_warm_restart', '--child'],
+                         env=env, capture_output=True, text=True, check=True).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+    result['process'] = time.perf_counter() - started
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency', type=float, default=0.3, help='stub response latency (seconds)')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child()
+
+    stub = StubServer(latency=args.latency).start()
+    try:
+        print(f"stub latency {args.latency * 1000:.0f} ms; times in seconds")
+        print(f"{'backend':<8}{'start':<10}{'import':>8}{'first response':>16}{'process':>9}{'notices':>9}")
+        for backend in ('memory', 'sqlite'):
+            workdir = tempfile.mkdtemp()
+            for start in ('first', 'restart'):
+                result = run(backend, workdir, stub.base_url)
+                print(f"{backend:<8}{start:<10}{result['import']:>8.2f}{result['first_response']:>16.2f}"
+                      f"{result['process']:>9.2f}{result['notices']:>9}")
+    finally:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# backend/benchmarks/bench_worldbank_feed.py
+"""Compare the World Bank JSON data feed against reading the rendered table.
+
+The stub serves the listing page the way the site does: the first page of
+rows in the HTML plus a DataTables init script pointing at an ajax source,
+which pages through the recorded rows in recordings/worldbank_feed.json
+using the server-side protocol (draw/start/length). The data-feed path
+discovers that source and pages it over plain HTTP; the HTML path is the
+requests fallback, which only ever sees the first page without a browser.
+A feed that fails must fall through to the HTML path.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_worldbank_feed --latency 0.1
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+from urllib.parse import urlsplit
+
+from benchmarks.stub_server import StubServer
+from scrapers.worldbank import WorldBankScraper
+from services.rate_limiter import configure_rate_limiter
+
+RECORDING = os.path.join(os.path.dirname(__file__), 'recordings', 'worldbank_feed.json')
+FIRST_PAGE = 10
+
+
+def load_recording():
+    with open(RECORDING, 'r', encoding='utf-8') as f:
+        return json.load(f)['data']
+
+
+def listing_page(rows, rendered=FIRST_PAGE):
+    """The listing page with its first rendered rows (all of them if rendered is None)"""
+    body = "".join(f"<tr><td>{number}</td><td>{title}</td><td>{published}</td><td>{deadline}</td></tr>"
+                   for number, title, published, deadline in rows[:rendered])
+    script = ("<script>$(function () { $('#advertisements').DataTable({serverSide: true, pageLength: 10, "
+              "ajax: {url: 'advertisement/list.json', type: 'GET'}}); });</script>")
+    return (f"<html><body><table id='advertisements' class='table table-condensed'><tbody>{body}</tbody></table>"
+            f"{script}</body></html>")
+
+
+def feed(rows, fail=False, seen=None):
+    """DataTables server-side feed over rows; seen collects each request's parameters"""
+    def page(params):
+        if seen is not None:
+            seen.append(params)
+        if fail:
+            return {'error': 'Unexpected server error'}
+        start, length = int(params.get('start', 0)), int(params.get('length', 10))
+        return {
+                'draw': int(params.get('draw', 1)),
+                'recordsTotal': len(rows),
+                'recordsFiltered': len(rows),
+                'data': rows[start:start + length]
+                }
+    return page
+
+
+def run(stub, use_data_feed):
+    scraper = WorldBankScraper(use_selenium=False, use_data_feed=use_data_feed)
+    scraper.base_url = stub.base_url
+    scraper.url = f"{stub.base_url}/rfxnow/public/index.html"
+    WorldBankScraper._discovered_data_urls.pop(scraper.url, None)
+    stub.requests = 0
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        tenders = scraper.scrape()
+    return tenders, stub.requests, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency', type=float, default=0.1, help='stub response latency (seconds)')
+    args = parser.parse_args()
+
+    configure_rate_limiter({'RATE_LIMITS': {'127.0.0.1': (1000.0, 100)}})
+    rows = load_recording()
+    routes = {'/rfxnow/public/index.html': lambda: listing_page(rows)}
+
+    results = []
+    for label, use_feed, fail in (('html table', False, False), ('data feed', True, False),
+                                  ('feed failing', True, True)):
+        stub = StubServer(latency=args.latency, routes=routes,
+                          feeds={'/rfxnow/public/advertisement/list.json': feed(rows, fail)}).start()
+        try:
+            results.append((label,) + run(stub, use_feed))
+        finally:
+            stub.stop()
+
+    print(f"{len(rows)} recorded rows, {FIRST_PAGE} rendered in the page, {args.latency * 1000:.0f} ms latency")
+    print(f"{'path':<14}{'tenders':>8}{'requests':>10}{'seconds':>9}")
+    for label, tenders, requests, seconds in results:
+        print(f"{label:<14}{len(tenders):>8}{requests:>10}{seconds:>9.2f}")
+
+    html_tenders, feed_tenders, fallback_tenders = (r[1] for r in results)
+    def fields(tender):
+        # each run had its own stub port, so compare detail links by path
+        return (tender['procurement_number'], tender['title'], tender['country'], tender['publication_date'],
+                tender['deadline'], urlsplit(tender['detail_url']).path)
+
+    # the table only renders the first page; the feed must start with exactly those rows
+    same = [fields(t) for t in html_tenders] == [fields(t) for t in feed_tenders[:len(html_tenders)]]
+    print(f"feed rows match the rendered table: {'yes' if same else 'NO'}")
+    print(f"feed returned every recorded row: {'yes' if len(feed_tenders) == len(rows) else 'NO'}")
+    print(f"failing feed fell back to the table: {'yes' if len(fallback_tenders) == len(html_tenders) else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
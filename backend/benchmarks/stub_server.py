@@ -0,0 +1,275 @@
+# backend/benchmarks/stub_server.py
+"""Local stand-in for the scraped sites, used by the benchmarks.
+
+Serves small synthetic copies of each listing page (and BDJobs detail
+pages) with a fixed artificial latency and ETag revalidation, so scrape
+paths can be compared offline and repeatably. Pages that depend on the
+query string (JSON feeds such as a DataTables ajax source, paginated
+listings) are served from `feeds`, whose handlers get the parsed query.
+"""
+import hashlib
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+
+def bppa_page(rows=20):
+    body = "".join(
+            f"<tr><td>{i}</td><td><a href='/bppa/notice/{i}'>BPPA baseline study {i}</a><br>REF-{i}</td>"
+            f"<td>Entity {i}</td><td>01/01/2026</td><td>10/02/2026<br>12:00 PM</td><td>Dhaka</td></tr>"
+            for i in range(1, rows + 1)
+            )
+    return (f"<html><body><nav>menu</nav><div id='bodyContent'><table><tbody>{body}</tbody></table>"
+            f"<div class='col-md-12'>Showing 1 to {rows} of {rows}</div></div></body></html>")
+
+
+def bppa_listing(params, total=200, per_page=20, shift=1):
+    """One page of a paginated BPPA listing (?page=N). Later pages also
+    repeat the last `shift` rows of the page before, as when notices move
+    down while a crawl is running."""
+    page = max(1, int(params.get('page', 1)))
+    first = max(1, (page - 1) * per_page + 1 - (shift if page > 1 else 0))
+    last = min(total, page * per_page)
+    body = "".join(
+            f"<tr><td>{i}</td><td><a href='/bppa/notice/{i}'>BPPA baseline study {i}</a><br>REF-{i}</td>"
+            f"<td>Entity {i}</td><td>01/01/2026</td><td>10/02/2026<br>12:00 PM</td><td>Dhaka</td></tr>"
+            for i in range(first, last + 1)
+            )
+    pages = -(-total // per_page)
+    links = "".join(f"<li><a href='/bppa?page={n}'>{n}</a></li>" for n in range(1, min(pages, 5) + 1))
+    return (f"<html><body><div id='bodyContent'><table><tbody>{body}</tbody></table>"
+            f"<div class='col-md-12'>Showing {first} to {last} of {total}</div>"
+            f"<ul class='pagination'>{links}</ul></div></body></html>")
+
+
+def pksf_page(rows=20):
+    body = "".join(
+            f"<tr><td>{i}</td><td>PKSF/{i}</td><td><strong>PKSF assessment {i}</strong></td>"
+            f"<td>01/01/2026</td><td>10/02/2026</td><td><a href='/pksf/doc/{i}.pdf'>View</a></td></tr>"
+            for i in range(1, rows + 1)
+            )
+    return f"<html><body><table class='tender-table'><tbody>{body}</tbody></table></body></html>"
+
+
+def undp_page(rows=30):
+    items = "".join(
+            f"<a class='vacanciesTableLink' href='view_negotiation.cfm?nego_id={i}' data-region='BD'>"
+            + "".join(f"<div class='vacanciesTable__cell'><span>{label} {i}</span></div>"
+                      for label in ('UNDP evaluation', 'UNDP-BGD', 'Bangladesh', 'RFP', '10-Feb-26', '01-Jan-26'))
+            + "</a>"
+            for i in range(1, rows + 1)
+            )
+    return f"<html><body>{items}</body></html>"
+
+
+def care_page(rows=10):
+    cards = "".join(
+            f"<div class='col-md-3'><p>Deadline: 10 February 2026</p><p>CARE baseline {i}</p>"
+            f"<a class='default-btn' href='/care/{i}.pdf'>Download</a></div>"
+            for i in range(1, rows + 1)
+            )
+    return f"<html><body><div id='project1' class='tab-pane show active'>{cards}</div></body></html>"
+
+
+def bdjobs_page(rows=20):
+    cards = "".join(
+            f"<app-tender-card><div title='Org {i}'>Org {i}</div>"
+            f"<a href='/bdjobs/detail/{i}'>BDJobs research tender {i}</a></app-tender-card>"
+            for i in range(1, rows + 1)
+            )
+    return f"<html><body>{cards}</body></html>"
+
+
+def bdjobs_detail(padding=20000):
+    return ("<html><body><h1>Tender</h1><p>Application deadline: 10th March 2026</p>"
+            + "<p>" + "lorem ipsum " * (padding // 12) + "</p></body></html>")
+
+
+def worldbank_page(rows=20):
+    body = "".join(
+            f"<tr><td>WB-{i}</td><td><a href='/wb/{i}'>Impact evaluation in India {i}</a></td>"
+            f"<td>2026-01-01</td><td>2026-02-10</td></tr>"
+            for i in range(1, rows + 1)
+            )
+    return f"<html><body><table class='table-condensed'><tbody>{body}</tbody></table></body></html>"
+
+
+def with_site_chrome(html, links=150, scripts=6):
+    """Wrap a page body in the navigation, inline scripts and footer real
+    sites carry around the part the scrapers read"""
+    nav = "<header><nav><ul>" + "".join(
+            f"<li class='menu-item'><a href='/section/{i}'>Section {i}</a></li>" for i in range(links)
+            ) + "</ul></nav></header>"
+    script = "<script>" + "var cfg = {a: 1, b: [1, 2, 3]}; " * 200 + "</script>"
+    footer = "<footer>" + "".join(f"<p><a href='/about/{i}'>About {i}</a></p>" for i in range(links // 3)) + "</footer>"
+    html = html.replace("<body>", "<body>" + nav + script * scripts, 1)
+    return html.replace("</body>", footer + "</body>", 1)
+
+
+ROUTES = {
+        '/bppa': bppa_page,
+        '/pksf': pksf_page,
+        '/undp/': undp_page,
+        '/care': care_page,
+        '/bdjobs/h/': bdjobs_page,
+        '/worldbank': worldbank_page,
+        }
+
+
+class StubServer:
+    """Threaded HTTP server serving the synthetic pages with fixed latency.
+
+    bandwidth (bytes/s) trickles bodies out in chunks, so readers that stop
+    early actually save transfer time. feeds maps a path to a callable
+    taking the query parameters and returning HTML (a str) or a
+    JSON-serializable payload.
+    """
+
+    def __init__(self, latency=0.2, routes=None, detail_page=bdjobs_detail, bandwidth=None, feeds=None):
+        self.latency = latency
+        self.routes = dict(ROUTES)
+        self.routes.update(routes or {})
+        self.feeds = dict(feeds or {})
+        self.detail_page = detail_page
+        self.bandwidth = bandwidth
+        self.bytes_sent = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests += 1
+                time.sleep(stub.latency)
+
+                path, _, query = self.path.partition('?')
+                content_type = 'text/html; charset=utf-8'
+                if path in stub.feeds:
+                    params = {key: values[-1] for key, values in parse_qs(query).items()}
+                    body = stub.feeds[path](params)
+                    if not isinstance(body, str):
+                        body = json.dumps(body)
+                        content_type = 'application/json'
+                elif path in stub.routes:
+                    body = stub.routes[path]()
+                elif path.startswith('/bdjobs/detail/'):
+                    body = stub.detail_page()
+                else:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                payload = body.encode('utf-8') if isinstance(body, str) else body
+                etag = '"%s"' % hashlib.md5(payload).hexdigest()
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                try:
+                    self._write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True  # reader stopped early
+
+            def _write(self, payload):
+                chunk_size = 8 * 1024
+                for start in range(0, len(payload), chunk_size):
+                    chunk = payload[start:start + chunk_size]
+                    self.wfile.write(chunk)
+                    self.wfile.flush()
+                    with stub._lock:
+                        stub.bytes_sent += len(chunk)
+                    if stub.bandwidth:
+                        time.sleep(len(chunk) / stub.bandwidth)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def point_scrapers_at(stub):
+    """Create one scraper per source with its URLs pointed at the stub"""
+    from scrapers.bppa import BPPAScraper
+    from scrapers.pksf import PKSFScraper
+    from scrapers.undp import UNDPScraper
+    from scrapers.care import CareScraper
+    from scrapers.bdjobs import BDJobsScraper
+    from scrapers.worldbank import WorldBankScraper
+
+    scrapers = {
+            'bppa': BPPAScraper(),
+            'pksf': PKSFScraper(),
+            'undp': UNDPScraper(),
+            'care': CareScraper(),
+            'bdjobs': BDJobsScraper(),
+            'worldbank': WorldBankScraper(use_selenium=False, use_data_feed=False),
+            }
+    for name, scraper in scrapers.items():
+        _point(name, scraper, stub.base_url)
+    return scrapers
+
+
+def patch_scrapers(base_url):
+    """Make every scraper created from now on (e.g. by the app) fetch from
+    the stub at base_url instead of the real sites"""
+    from scrapers import get_all_scrapers, get_scraper
+
+    for name in get_all_scrapers():
+        cls = get_scraper(name)
+        original_init = cls.__init__
+
+        def __init__(self, *args, _name=name, _init=original_init, **kwargs):
+            _init(self, *args, **kwargs)
+            _point(_name, self, base_url)
+
+        cls.__init__ = __init__
+
+
+# attributes pointing each scraper at its stub route (relative to the stub's base url)
+STUB_URLS = {
+        'bppa': {'base_url': '', 'url': '/bppa'},
+        'pksf': {'url': '/pksf'},
+        'undp': {'base_url': '/undp', 'url': '/undp/'},
+        'care': {'url': '/care'},
+        'bdjobs': {'url': '/bdjobs/h/'},
+        'worldbank': {'base_url': '', 'url': '/worldbank'},
+        }
+
+
+def _point(name, scraper, base):
+    """Point one scraper's URLs at the stub"""
+    for attribute, path in STUB_URLS.get(name, {}).items():
+        setattr(scraper, attribute, base + path)
+    if name == 'worldbank':
+        # static table only - no browser, no feed discovery
+        scraper.use_selenium = scraper.use_data_feed = False
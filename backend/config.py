@@ -7,6 +7,129 @@ class Config:
     TESTING = False
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
 
+    # Concurrent scraping
+    SCRAPE_MAX_WORKERS = int(os.environ.get('SCRAPE_MAX_WORKERS', 8))
+    SCRAPE_TIMEOUT = int(os.environ.get('SCRAPE_TIMEOUT', 120))  # seconds per source
+    SCRAPE_TIMEOUTS = {
+            'worldbank': 300,  # Selenium pagination is slow
+            'bdjobs': 180,     # one detail page per tender card
+            }
+
+    # Scraping backend: 'threads' runs scrape() in the thread pool,
+    # 'asyncio' runs scrape_async() on one shared event loop
+    SCRAPE_BACKEND = os.environ.get('SCRAPE_BACKEND', 'threads')
+    ASYNC_HTTP_LIMIT = 100          # total open connections on the loop
+    ASYNC_HTTP_LIMIT_PER_HOST = 10  # caps BDJobs detail-page fan-out
+
+    # Background refresh - warms the cache at startup and re-scrapes each
+    # source on its own interval (+/- jitter) so reads never wait
+    REFRESH_ENABLED = os.environ.get('REFRESH_ENABLED', 'true').lower() == 'true'
+    REFRESH_DEFAULT_INTERVAL = 300  # seconds
+    REFRESH_INTERVALS = {
+            'worldbank': 1800,  # Selenium scrape, slow-moving listing
+            'bdjobs': 900,
+            'pksf': 1800,
+            'care': 3600,
+            }
+    REFRESH_JITTER = 0.1          # +/- 10% of the interval
+    REFRESH_STARTUP_SPREAD = 5    # seconds to spread the startup warm-up over
+    REFRESH_MAX_WORKERS = 4
+
+    # Cache TTLs - a source's notices stay fresh for its refresh interval
+    # above. A failed scrape keeps serving the last good notices and is not
+    # retried for FAILURE_TTL seconds, multiplied by FAILURE_BACKOFF for each
+    # further consecutive failure, up to FAILURE_MAX_BACKOFF
+    FAILURE_TTL = int(os.environ.get('FAILURE_TTL', 60))
+    FAILURE_BACKOFF = 2.0
+    FAILURE_MAX_BACKOFF = int(os.environ.get('FAILURE_MAX_BACKOFF', 1800))
+
+    # Read endpoints (/api/data, /api/scrape, /api/stats, /api/export/json)
+    # encode each version of their body once, with a strong ETag for 304s,
+    # and keep gzip (and brotli, when installed) copies of bodies over
+    # RESPONSE_COMPRESS_MIN_SIZE bytes. /api/stats may be RESPONSE_STATS_MAX_AGE
+    # seconds old
+    RESPONSE_CACHE_MAX_ENTRIES = 64
+    RESPONSE_COMPRESS_MIN_SIZE = 1024
+    RESPONSE_GZIP_LEVEL = 6
+    RESPONSE_BROTLI_QUALITY = 5
+    RESPONSE_STATS_MAX_AGE = 5
+
+    # Last scraped notices per source: 'sqlite' keeps them across restarts,
+    # 'memory' starts empty every time
+    SCRAPE_CACHE_BACKEND = os.environ.get('SCRAPE_CACHE_BACKEND', 'sqlite')
+    SCRAPE_CACHE_FILE = os.environ.get('SCRAPE_CACHE_FILE', os.path.join('cache', 'scrape_cache.db'))
+
+    # Cross-process scrape locks - with several worker processes only one
+    # scrapes a source at a time; the others wait and reuse its result.
+    # A lease expires SCRAPE_LOCK_TTL seconds after its last renewal (the
+    # holder renews it while scraping), waiters give up after SCRAPE_LOCK_WAIT
+    SCRAPE_LOCK_ENABLED = os.environ.get('SCRAPE_LOCK_ENABLED', 'true').lower() == 'true'
+    SCRAPE_LOCK_FILE = os.environ.get('SCRAPE_LOCK_FILE', os.path.join('cache', 'locks.db'))
+    SCRAPE_LOCK_TTL = 120
+    SCRAPE_LOCK_POLL = 0.25
+    SCRAPE_LOCK_WAIT = 600
+
+    # Background scrape jobs (?async=true)
+    JOB_MAX_WORKERS = 4
+    JOB_RETENTION = 3600  # seconds to keep finished jobs
+
+    # Per-host politeness limits: (requests per second, burst).
+    # Keys match the host or any parent domain.
+    RATE_LIMIT_DEFAULT = (2.0, 4)
+    RATE_LIMITS = {
+            'bdjobs.com': (4.0, 8),  # detail pages, fetched concurrently
+            'bppa.gov.bd': (4.0, 4),  # listing pages, fetched concurrently
+            'wbgeprocure-rfxnow.worldbank.org': (1.0, 2),  # pagination clicks
+            }
+
+    # On-disk conditional-GET cache (ETag / Last-Modified revalidation)
+    HTTP_CACHE_ENABLED = os.environ.get('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+    HTTP_CACHE_DIR = os.environ.get('HTTP_CACHE_DIR', os.path.join('cache', 'http'))
+    HTTP_CACHE_MAX_BYTES = 50 * 1024 * 1024  # LRU-evicted above this
+
+    # Fields scraped from detail pages (e.g. BDJobs deadlines), kept per url
+    DETAIL_CACHE_ENABLED = os.environ.get('DETAIL_CACHE_ENABLED', 'true').lower() == 'true'
+    DETAIL_CACHE_FILE = os.environ.get('DETAIL_CACHE_FILE', os.path.join('cache', 'details.json'))
+
+    # Rows already seen per source: paginated scrapes stop at them, and only
+    # new rows reach the ToR filter. Every page is re-crawled once a day
+    # (or on ?full=true) to pick up edits and removals.
+    HIGH_WATER_ENABLED = os.environ.get('HIGH_WATER_ENABLED', 'true').lower() == 'true'
+    HIGH_WATER_FILE = os.environ.get('HIGH_WATER_FILE', os.path.join('cache', 'high_water.json'))
+    HIGH_WATER_FULL_INTERVAL = int(os.environ.get('HIGH_WATER_FULL_INTERVAL', 86400))
+    HIGH_WATER_MAX_KEYS = 2000
+
+    # Skip re-parsing pages whose normalized content hash is unchanged
+    FINGERPRINT_ENABLED = os.environ.get('FINGERPRINT_ENABLED', 'true').lower() == 'true'
+    FINGERPRINT_MAX_ENTRIES = 512     # parsed results kept in memory
+    FINGERPRINT_IGNORE_PATTERNS = []  # extra regexes stripped before hashing
+
+    # HTML parser backend: 'lxml', 'selectolax' or 'html.parser' (fallback)
+    HTML_PARSER = os.environ.get('HTML_PARSER', 'lxml')
+    # only build the page region each scraper declares (off = whole page)
+    HTML_PARTIAL_PARSING = os.environ.get('HTML_PARTIAL_PARSING', 'true').lower() == 'true'
+
+    # Worker processes for HTML parsing (0 = one per CPU core, minus one)
+    PARSE_POOL_ENABLED = os.environ.get('PARSE_POOL_ENABLED', 'true').lower() == 'true'
+    PARSE_POOL_WORKERS = int(os.environ.get('PARSE_POOL_WORKERS', 0))
+    PARSE_POOL_MIN_BYTES = 64 * 1024  # smaller pages are parsed in-process
+
+    # Warm headless Chrome instances for the Selenium scrapers
+    BROWSER_POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', 1))
+    BROWSER_MAX_USES = 20          # scrapes before a browser is replaced
+    BROWSER_MAX_MEMORY_MB = 600    # replace a browser above this
+    BROWSER_ACQUIRE_TIMEOUT = 120  # seconds to wait for a free browser
+    BROWSER_WARM = os.environ.get('BROWSER_WARM', 'true').lower() == 'true'
+
+    # Shared HTTP connection pools
+    HTTP_TIMEOUT = 30
+    HTTP_POOL_CONNECTIONS = 10  # number of hosts kept pooled
+    HTTP_POOL_MAXSIZE = 10      # keep-alive connections per host
+    HTTP_POOL_SIZES = {
+            'hotjobs.bdjobs.com': 16,  # BDJobs detail pages
+            'bdjobs.com': 16,
+            }
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -23,6 +146,7 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     DEBUG = True
+    REFRESH_ENABLED = False
 
 
 # Map environment to config
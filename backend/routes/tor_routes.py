@@ -1,12 +1,13 @@
-from flask import Blueprint, request, jsonify, send_file
+from flask import Blueprint, request, jsonify, send_file, current_app
 from datetime import datetime
 import os
 
-from scrapers import get_all_scrapers, discover_scrapers
+from scrapers import get_all_scrapers
 from services.tor_filter import ToRFilter
 from services.memory_tracker import MemoryTracker
 from services.daily_reporter import DailyReporter
 from services.excel_exporter import ExcelExporter
+from services.high_water import get_high_water_marks
 
 tor_bp = Blueprint('tor', __name__, url_prefix='/api/tor')
 
@@ -21,37 +22,75 @@ excel_exporter = ExcelExporter()
 def scan_all_sources():
     """Run all scrapers and filter for ToR opportunities"""
     try:
-        # Discover and run all scrapers
+        # Discover and run all scrapers concurrently
         scrapers = get_all_scrapers()
+
+        # Every source is scraped fresh, through the app's shared scrape
+        # path (single-flight and incremental crawling: pages after the
+        # last known notice are skipped), so the scan never reports
+        # notices already taken down. What is new to the ToR pipeline is
+        # decided by the memory tracker alone, so rows first seen by a
+        # background refresh are still reported. ?full=true re-crawls
+        # every page. A source that fails keeps its last good notices.
+        run_scraper = current_app.extensions['run_scraper']
+        full = request.args.get('full', 'false').lower() == 'true'
+        marks = get_high_water_marks()
+        if full and marks:
+            for name in scrapers:
+                marks.request_full(name)
+
+        def run_one(name):
+            # copies - the filter annotates notices, the cached ones stay as scraped
+            return [dict(notice) for notice in run_scraper(name, force_refresh=True) or []]
+
+        # ?async=true - scan in a background job and return its id right away
+        if request.args.get('async', 'false').lower() == 'true':
+            jobs = current_app.extensions['scrape_jobs']
+            job_id = jobs.submit(
+                    'tor_scan', list(scrapers), run_one,
+                    finalize=lambda results: _filter_new_notices(
+                        [notice for notices in results.values() for notice in notices],
+                        len(scrapers))
+                    )
+            return jsonify({
+                'success': True,
+                'job_id': job_id,
+                'status_url': f'/api/jobs/{job_id}'
+                }), 202
+
+        runner = current_app.extensions['scrape_runner']
         all_notices = []
 
-        for name, info in scrapers.items():
-            try:
-                scraper_class = info['class']
-                scraper = scraper_class()
-                notices = scraper.scrape()
+        for result in runner.iter_results(scrapers, run_one):
+            name = result['source']
+            if result['status'] == 'done':
+                notices = result['data'] or []
                 all_notices.extend(notices)
-                print(f"✅ {info['display_name']}: {len(notices)} items")
-            except Exception as e:
-                print(f"❌ Error with {name}: {e}")
+                print(f"✅ {scrapers[name]['display_name']}: {len(notices)} items")
+            else:
+                print(f"❌ Error with {name}: {result['error']}")
 
-        # Apply ToR filters
-        filtered_notices = tor_filter.filter_notices(all_notices)
+        return jsonify(dict(success=True, **_filter_new_notices(all_notices, len(scrapers))))
 
-        # Check for new items
-        new_notices = memory_tracker.get_new_notices(filtered_notices)
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-        return jsonify({
-            'success': True,
+
+def _filter_new_notices(all_notices, sites_scanned):
+    """Apply ToR filters and memory tracking to scraped notices"""
+    # Apply ToR filters
+    filtered_notices = tor_filter.filter_notices(all_notices)
+
+    # Check for new items
+    new_notices = memory_tracker.get_new_notices(filtered_notices)
+
+    return {
             'total': len(filtered_notices),
             'new': len(new_notices),
             'new_notices': new_notices[:50],  # Limit response size
             'all_notices': filtered_notices[:100],
-            'sites_scanned': len(scrapers)
-            })
-
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+            'sites_scanned': sites_scanned
+            }
 
 
 @tor_bp.route('/daily-digest', methods=['GET'])
@@ -12,6 +12,12 @@ if sys.platform == 'win32':
 SCRAPERS = {}
 
 
+class ScrapeError(Exception):
+    """Raised by a scraper that could not read its source (site down,
+    blocked, page layout changed), so callers can keep the last good
+    notices instead of caching an empty list"""
+
+
 def register_scraper(name, display_name=None):
     """Decorator to register a scraper"""
     def decorator(scraper_class):
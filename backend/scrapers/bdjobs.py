@@ -1,16 +1,41 @@
 # backend/scrapers/bdjobs.py
 
-import requests
+import asyncio
 import re
 import time
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin
-from datetime import datetime
-from scrapers import register_scraper
+from datetime import datetime, timedelta
+from scrapers import register_scraper, ScrapeError
+from services.scrape_runner import is_cancelled
+from services.http_client import get_http_client
+from services.async_http import get_async_http_client
+from services.parse_pool import parse_with
+from services.html_parser import make_soup
+from services.detail_cache import get_detail_cache
+from services.stream_extract import FieldScanner
+
+# first date on a tender detail page, in any of the formats BDJobs uses
+DEADLINE_PATTERN = re.compile('|'.join([
+        r'\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4}',  # 10th March 2026
+        r'\w+,\s+\w+\s+\d{1,2},\s+\d{4}',          # Saturday, April 04, 2026
+        r'\d{1,2}/\d{1,2}/\d{4}',                  # 04/04/2026
+        ]))
+
+# formats matched by DEADLINE_PATTERN, after ordinal suffixes are dropped
+DEADLINE_FORMATS = ('%d %B %Y', '%d %b %Y', '%A, %B %d, %Y', '%d/%m/%Y')
 
 
 @register_scraper('bdjobs', display_name='BD Jobs')
 class BDJobsScraper:
+    # only this part of the listing page is parsed (see make_soup)
+    region = "app-tender-card"
+
+    # detail pages fetched at once (the bdjobs.com rate limit still applies)
+    detail_concurrency = 6
+
+    # how long to wait before re-checking a page with no (or a past) deadline
+    deadline_retry_ttl = 24 * 3600
 
     def __init__(self):
         self.url = "https://bdjobs.com/h/"
@@ -18,99 +43,124 @@ class BDJobsScraper:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Accept-Language": "en-US,en;q=0.9",
                 }
+        self.http = get_http_client().for_source("bdjobs", self.headers)
+        self.ahttp = get_async_http_client().for_source("bdjobs", self.headers)
 
     def get_deadline(self, tender_url):
-        """Visit tender page and extract deadline"""
+        """Get the deadline from the detail cache, visiting the tender page on a miss"""
+        cache = get_detail_cache()
+        if cache is not None:
+            found, deadline = cache.get("bdjobs", tender_url)
+            if found:
+                return deadline
+
+        started = time.monotonic()
         try:
-            resp = requests.get(tender_url, headers=self.headers, timeout=30)
-            resp.raise_for_status()
-
-            soup = BeautifulSoup(resp.text, "html.parser")
+            deadline = self.http.scan(tender_url, FieldScanner(DEADLINE_PATTERN), timeout=30)
 
-            text = soup.get_text(separator=" ", strip=True)
+        except Exception as e:
+            print(f"⚠️ Deadline scrape failed ({tender_url}): {e}")
+            return None
 
-            date_patterns = [
-                    r'\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4}',  # 10th March 2026
-                    r'\w+,\s+\w+\s+\d{1,2},\s+\d{4}',          # Saturday, April 04, 2026
-                    r'\d{1,2}/\d{1,2}/\d{4}',                  # 04/04/2026
-                    ]
+        self._remember_deadline(cache, tender_url, deadline, time.monotonic() - started)
+        return deadline
 
-            for pattern in date_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    return match.group(0)
+    async def get_deadline_async(self, tender_url):
+        """Same as get_deadline(), visiting the tender page on the shared event loop"""
+        cache = get_detail_cache()
+        if cache is not None:
+            found, deadline = cache.get("bdjobs", tender_url)
+            if found:
+                return deadline
 
-            return None
+        started = time.monotonic()
+        try:
+            deadline = await self.ahttp.scan(tender_url, FieldScanner(DEADLINE_PATTERN), timeout=30)
 
         except Exception as e:
             print(f"⚠️ Deadline scrape failed ({tender_url}): {e}")
             return None
 
+        self._remember_deadline(cache, tender_url, deadline, time.monotonic() - started)
+        return deadline
+
+    def _remember_deadline(self, cache, tender_url, deadline, elapsed):
+        """Cache a fetched deadline until the end of its day.
+
+        Pages without a recognisable deadline, or whose deadline has
+        already passed, are checked again after deadline_retry_ttl.
+        """
+        if cache is None:
+            return
+        retry_at = time.time() + self.deadline_retry_ttl
+        deadline_date = self._parse_deadline(deadline)
+        expires_at = retry_at
+        if deadline_date is not None:
+            expires_at = max(retry_at, (deadline_date + timedelta(days=1)).timestamp())
+        cache.put("bdjobs", tender_url, deadline, expires_at, elapsed)
+
+    def _parse_deadline(self, deadline):
+        """Turn an extracted deadline string into a datetime (None if unknown)"""
+        if not deadline:
+            return None
+        cleaned = re.sub(r'(\d)(?:st|nd|rd|th)\b', r'\1', deadline)
+        for fmt in DEADLINE_FORMATS:
+            try:
+                return datetime.strptime(cleaned, fmt)
+            except ValueError:
+                continue
+        return None
+
     def scrape(self):
         """Scrape BDJobs tenders"""
         try:
             print("🔍 Scraping BDJobs...")
 
-            resp = requests.get(self.url, headers=self.headers, timeout=30)
-            resp.raise_for_status()
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            tenders = []
+            tenders = self.http.fetch_parsed(self.url, parse_with(self, '_parse_cards'), timeout=30)
 
-            # 🔹 Use tender cards (original logic)
-            cards = soup.select("app-tender-card") or soup.select(".card") or soup.select("div[class*='tender']")
+            # 🔹 Scrape deadline from inner pages, a few at a time
+            # (politeness delay comes from the shared per-host rate limiter)
+            linked = [t for t in tenders if t["link"] != "#"]
+            with ThreadPoolExecutor(max_workers=self.detail_concurrency) as pool:
+                futures = {pool.submit(self.get_deadline, t["link"]): t for t in linked}
+                for future in as_completed(futures):
+                    if is_cancelled():
+                        print("⏹️ BDJobs scrape cancelled, returning partial results")
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        break
+                    futures[future]["deadline"] = future.result()
 
-            for i, card in enumerate(cards):
+            self._flush_detail_cache()
 
-                try:
-                    # Organization
-                    org_div = (
-                            card.select_one('div[title]')
-                            or card.select_one('.company-name')
-                            or card.select_one('.organization')
-                            )
-
-                    organization = org_div.get_text(strip=True) if org_div else f"Organization {i+1}"
+            print(f"✅ Scraped {len(tenders)} tenders from BDJobs")
 
-                    # Title + Link
-                    a_tag = card.select_one("a[href]")
-                    title = a_tag.get_text(strip=True) if a_tag else f"Tender {i+1}"
+            return tenders
 
-                    link = urljoin(self.url, a_tag["href"]) if a_tag else "#"
+        except Exception as e:
+            print(f"❌ Error scraping BDJobs: {e}")
+            raise ScrapeError(f"BDJobs: {e}") from e
 
-                    # Logo
-                    img = card.select_one("img")
+    async def scrape_async(self):
+        """Scrape BDJobs tenders, fetching every detail page concurrently"""
+        try:
+            print("🔍 Scraping BDJobs (async)...")
 
-                    logo = None
-                    if img and img.get("src"):
-                        logo = img["src"]
-                        if logo.startswith("//"):
-                            logo = "https:" + logo
+            tenders = await self.ahttp.fetch_parsed(
+                    self.url, parse_with(self, '_parse_cards'), timeout=30)
 
-                    if not logo:
-                        logo = "https://via.placeholder.com/60x60?text=BD"
+            # 🔹 Fan out detail fetches on the event loop, a few at a time
+            linked = [t for t in tenders if t["link"] != "#"]
+            semaphore = asyncio.Semaphore(self.detail_concurrency)
 
-                    # 🔹 Scrape deadline from inner page
-                    deadline = None
-                    if link != "#":
-                        time.sleep(0.5)
-                        deadline = self.get_deadline(link)
+            async def fetch(tender_url):
+                async with semaphore:
+                    return await self.get_deadline_async(tender_url)
 
-                    tenders.append({
-                        "id": len(tenders) + 1,
-                        "organization": organization,
-                        "title": title,
-                        "link": link,
-                        "logo": logo,
-                        "deadline": deadline,
-                        "posted": datetime.now().strftime("%Y-%m-%d"),
-                        "source": "bdjobs"
-                        })
+            deadlines = await asyncio.gather(*(fetch(t["link"]) for t in linked))
+            for tender, deadline in zip(linked, deadlines):
+                tender["deadline"] = deadline
 
-                except Exception as e:
-                    print(f"⚠️ Error parsing tender card: {e}")
-                    continue
+            self._flush_detail_cache()
 
             print(f"✅ Scraped {len(tenders)} tenders from BDJobs")
 
@@ -118,7 +168,71 @@ class BDJobsScraper:
 
         except Exception as e:
             print(f"❌ Error scraping BDJobs: {e}")
-            return []
+            raise ScrapeError(f"BDJobs: {e}") from e
+
+    def _flush_detail_cache(self):
+        cache = get_detail_cache()
+        if cache is not None:
+            try:
+                cache.flush()
+            except OSError as e:
+                print(f"⚠️ Could not save BDJobs deadline cache: {e}")
+
+    def _parse_cards(self, html):
+        """Parse tender cards from the listing page (deadlines not filled)"""
+        soup = make_soup(html, region=self.region)
+
+        tenders = []
+
+        # 🔹 Use tender cards (original logic)
+        cards = soup.select("app-tender-card") or soup.select(".card") or soup.select("div[class*='tender']")
+
+        for i, card in enumerate(cards):
+
+            try:
+                # Organization
+                org_div = (
+                        card.select_one('div[title]')
+                        or card.select_one('.company-name')
+                        or card.select_one('.organization')
+                        )
+
+                organization = org_div.get_text(strip=True) if org_div else f"Organization {i+1}"
+
+                # Title + Link
+                a_tag = card.select_one("a[href]")
+                title = a_tag.get_text(strip=True) if a_tag else f"Tender {i+1}"
+
+                link = urljoin(self.url, a_tag["href"]) if a_tag else "#"
+
+                # Logo
+                img = card.select_one("img")
+
+                logo = None
+                if img and img.get("src"):
+                    logo = img["src"]
+                    if logo.startswith("//"):
+                        logo = "https:" + logo
+
+                if not logo:
+                    logo = "https://via.placeholder.com/60x60?text=BD"
+
+                tenders.append({
+                    "id": len(tenders) + 1,
+                    "organization": organization,
+                    "title": title,
+                    "link": link,
+                    "logo": logo,
+                    "deadline": None,
+                    "posted": datetime.now().strftime("%Y-%m-%d"),
+                    "source": "bdjobs"
+                    })
+
+            except Exception as e:
+                print(f"⚠️ Error parsing tender card: {e}")
+                continue
+
+        return tenders
 
     def get_sample_data(self):
         return []
@@ -1,12 +1,37 @@
+import asyncio
+import math
+import re
 import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from urllib.parse import urljoin
-from . import register_scraper
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from . import register_scraper, ScrapeError
+from services.scrape_runner import is_cancelled
+from services.http_client import get_http_client
+from services.async_http import get_async_http_client
+from services.parse_pool import parse_with
+from services.html_parser import make_soup
+from services.high_water import reached_known_rows, stopped_paging_early
+
+# "Showing 1 to 20 of 1234"
+SHOWING_PATTERN = re.compile(r"(\d+)\s*to\s*(\d+)\s*of\s*(\d+)", re.IGNORECASE)
+# page selector in the pagination links: a page number or a row offset.
+# Only links inside the pagination block are matched, where even a bare
+# "p" can only be the page - notice links elsewhere carry ids of their own
+PAGE_LINK_PATTERN = re.compile(r"[?&](page|p|pg|start|limitstart|offset)=(\d+)", re.IGNORECASE)
+OFFSET_PARAMS = {"start", "limitstart", "offset"}
 
 
 @register_scraper('bppa', display_name='BPPA')
 class BPPAScraper:
+    # only this part of the listing page is parsed (see make_soup)
+    region = "div#bodyContent"
+
+    # listing pages fetched at once after the first (the shared rate
+    # limiter still spaces them out), and a cap on pages per crawl
+    page_concurrency = 4
+    max_pages = 100
+
     def __init__(self):
         self.base_url = "https://www.bppa.gov.bd"
         self.url = f"{self.base_url}/advertisement-notices/advertisement-services.html"
@@ -14,15 +39,133 @@ class BPPAScraper:
             "User-Agent": "Mozilla/5.0",
             "Referer": self.base_url,
         }
+        self.http = get_http_client().for_source("bppa", self.headers)
+        self.ahttp = get_async_http_client().for_source("bppa", self.headers)
 
     # ==============================
     # MAIN ENTRY
     # ==============================
     def scrape(self):
-        """Scrape BPPA tender notices"""
+        """Scrape BPPA tender notices from every listing page"""
         print("🔍 Scraping BPPA tender notices...")
 
-        content_div = self._fetch_content()
+        try:
+            first = self.http.fetch_parsed(self.url, parse_with(self, '_parse_listing'), timeout=30)
+        except requests.RequestException as e:
+            print(f"❌ Request failed: {e}")
+            raise ScrapeError(f"BPPA: {e}") from e
+
+        pages = {1: first["tenders"]}
+        page_urls = self._page_urls(first["pagination"])
+        if page_urls and reached_known_rows("bppa", first["tenders"]):
+            print("📄 First BPPA page reaches notices seen on an earlier crawl, skipping the rest")
+            stopped_paging_early("bppa")
+            page_urls = []
+        if page_urls:
+            print(f"📄 Fetching {len(page_urls)} more BPPA pages, {self.page_concurrency} at a time...")
+            # each page is parsed by the worker that fetched it, as it arrives
+            stop_after = None
+            with ThreadPoolExecutor(max_workers=self.page_concurrency) as pool:
+                futures = {pool.submit(self._fetch_page, url): number for number, url in page_urls}
+                for future in as_completed(futures):
+                    if is_cancelled():
+                        print("⏹️ BPPA scrape cancelled, returning partial results")
+                        stopped_paging_early("bppa")
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        break
+                    number = futures[future]
+                    if future.cancelled() or (stop_after and number > stop_after):
+                        continue
+                    pages[number] = future.result()
+                    # later pages only hold notices seen on an earlier crawl
+                    if reached_known_rows("bppa", pages[number]):
+                        stop_after = min(stop_after or number, number)
+                        for other, other_number in futures.items():
+                            if other_number > stop_after:
+                                other.cancel()
+
+            if stop_after:
+                print(f"📄 Reached notices seen on an earlier crawl on page {stop_after}")
+                pages = {number: rows for number, rows in pages.items() if number <= stop_after}
+                if stop_after < page_urls[-1][0]:
+                    stopped_paging_early("bppa")
+
+        return self._merge_pages(pages)
+
+    async def scrape_async(self):
+        """Scrape BPPA tender notices on the shared event loop"""
+        print("🔍 Scraping BPPA tender notices (async)...")
+
+        try:
+            first = await self.ahttp.fetch_parsed(self.url, parse_with(self, '_parse_listing'), timeout=30)
+        except requests.RequestException as e:
+            print(f"❌ Request failed: {e}")
+            raise ScrapeError(f"BPPA: {e}") from e
+
+        pages = {1: first["tenders"]}
+        page_urls = self._page_urls(first["pagination"])
+        if page_urls and reached_known_rows("bppa", first["tenders"]):
+            print("📄 First BPPA page reaches notices seen on an earlier crawl, skipping the rest")
+            stopped_paging_early("bppa")
+            page_urls = []
+        if page_urls:
+            print(f"📄 Fetching {len(page_urls)} more BPPA pages, {self.page_concurrency} at a time...")
+            semaphore = asyncio.Semaphore(self.page_concurrency)
+            stop_after = None
+
+            async def fetch(number, url):
+                async with semaphore:
+                    # pages past a known one are skipped once they get a slot
+                    if stop_after and number > stop_after:
+                        return number, None
+                    return number, await self._fetch_page_async(url)
+
+            for arrival in asyncio.as_completed([fetch(number, url) for number, url in page_urls]):
+                number, rows = await arrival
+                if rows is None or (stop_after and number > stop_after):
+                    continue
+                pages[number] = rows
+                if reached_known_rows("bppa", rows):
+                    stop_after = min(stop_after or number, number)
+
+            if stop_after:
+                print(f"📄 Reached notices seen on an earlier crawl on page {stop_after}")
+                pages = {number: rows for number, rows in pages.items() if number <= stop_after}
+                if stop_after < page_urls[-1][0]:
+                    stopped_paging_early("bppa")
+
+        return self._merge_pages(pages)
+
+    def _fetch_page(self, url):
+        try:
+            return self.http.fetch_parsed(url, parse_with(self, '_parse_page'), timeout=30)
+        except requests.RequestException as e:
+            print(f"⚠️ BPPA page failed: {url} ({e})")
+            return []
+
+    async def _fetch_page_async(self, url):
+        try:
+            return await self.ahttp.fetch_parsed(url, parse_with(self, '_parse_page'), timeout=30)
+        except requests.RequestException as e:
+            print(f"⚠️ BPPA page failed: {url} ({e})")
+            return []
+
+    def _parse_listing(self, content):
+        """Tenders on the first page plus what its pagination block says"""
+        content_div = self._find_content(content)
+        if content_div is None:
+            # later pages may come back empty; the first one must hold the listing
+            raise ScrapeError("BPPA listing content not found")
+        return {
+            "tenders": self._scrape_content(content_div),
+            "pagination": self._pagination(content_div),
+        }
+
+    def _parse_page(self, content):
+        content_div = self._find_content(content)
+        return self._scrape_content(content_div)
+
+    def _scrape_content(self, content_div):
         if not content_div:
             return []
 
@@ -30,25 +173,38 @@ class BPPAScraper:
         if not rows:
             return []
 
-        tenders = self._parse_rows(rows)
+        return self._parse_rows(rows)
 
-        self._print_pagination(content_div)
+    # ==============================
+    # MERGE PAGES
+    # ==============================
+    def _merge_pages(self, pages):
+        """Join pages in order, dropping rows already seen on an earlier
+        page (notices shift between pages while the crawl runs)"""
+        tenders = []
+        seen = set()
+        duplicates = 0
+
+        for number in sorted(pages):
+            for tender in pages[number]:
+                key = tender["reference_no"] or tender["detail_url"] or tender["title"]
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                tender["id"] = len(tenders) + 1
+                tenders.append(tender)
 
-        print(f"✅ Scraped {len(tenders)} tenders from BPPA")
+        if duplicates:
+            print(f"🔁 Dropped {duplicates} duplicate BPPA notices")
+        print(f"✅ Scraped {len(tenders)} tenders from {len(pages)} BPPA pages")
         return tenders
 
     # ==============================
-    # FETCH PAGE
+    # FIND CONTENT DIV
     # ==============================
-    def _fetch_content(self):
-        try:
-            response = requests.get(self.url, headers=self.headers, timeout=30)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"❌ Request failed: {e}")
-            return None
-
-        soup = BeautifulSoup(response.content, "html.parser")
+    def _find_content(self, content):
+        soup = make_soup(content, region=self.region)
 
         content_div = (
             soup.select_one("div#bodyContent")
@@ -149,15 +305,60 @@ class BPPAScraper:
     # ==============================
     # PAGINATION INFO
     # ==============================
-    def _print_pagination(self, content_div):
-        pagination_div = content_div.find("div", class_="col-md-12")
-        if not pagination_div:
-            return
+    def _pagination(self, content_div):
+        """Read the total, page size and page links from the first page"""
+        info = {"total": None, "per_page": None, "param": "page", "last_link": 1}
 
-        text = pagination_div.get_text()
-        if "of" in text:
-            total = text.split("of")[-1].strip()
-            print(f"📊 Total available notices: {total}")
+        pagination_div = content_div.find("div", class_="col-md-12")
+        if pagination_div:
+            match = SHOWING_PATTERN.search(pagination_div.get_text(" "))
+            if match:
+                first, last, total = (int(n) for n in match.groups())
+                info["total"] = total
+                info["per_page"] = last - first + 1
+                print(f"📊 Total available notices: {total}")
+
+        # learn the query parameter (and highest page) from the page links
+        for link in self._page_links(content_div, pagination_div):
+            match = PAGE_LINK_PATTERN.search(link["href"])
+            if match:
+                info["param"] = match.group(1)
+                info["last_link"] = max(info["last_link"], int(match.group(2)))
+
+        return info
+
+    def _page_links(self, content_div, pagination_div):
+        """Links of the pagination block: ul.pagination, else the "Showing"
+        div - never the notice links in the table"""
+        blocks = content_div.select("ul.pagination, .pagination")
+        if not blocks and pagination_div:
+            blocks = [pagination_div]
+        return [link for block in blocks for link in block.find_all("a", href=True)]
+
+    def _page_urls(self, pagination):
+        """(page number, url) for every listing page after the first"""
+        per_page = pagination.get("per_page")
+        param = pagination.get("param", "page")
+        offsets = param.lower() in OFFSET_PARAMS
+
+        if pagination.get("total") and per_page:
+            last_page = math.ceil(pagination["total"] / per_page)
+        elif offsets:
+            last_page = pagination.get("last_link", 0) // per_page + 1 if per_page else 1
+        else:
+            last_page = pagination.get("last_link", 1)
+
+        if last_page > self.max_pages:
+            print(f"⚠️ BPPA lists {last_page} pages, fetching the first {self.max_pages}")
+            last_page = self.max_pages
+
+        parts = urlsplit(self.url)
+        query = [(key, value) for key, value in parse_qsl(parts.query) if key != param]
+        urls = []
+        for number in range(2, last_page + 1):
+            value = (number - 1) * per_page if offsets else number
+            urls.append((number, urlunsplit(parts._replace(query=urlencode(query + [(param, value)])))))
+        return urls
 
     # ==============================
     # UTILITIES
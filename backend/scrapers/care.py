@@ -1,32 +1,55 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-from . import register_scraper
+from . import register_scraper, ScrapeError
+from services.http_client import get_http_client
+from services.async_http import get_async_http_client
+from services.parse_pool import parse_with
+from services.html_parser import make_soup
 
 
 @register_scraper('care', display_name='Care')
 class CareScraper:
+    # only this part of the listing page is parsed (see make_soup)
+    region = "div#project1"
+
     def __init__(self):
         self.url = "https://www.carebangladesh.org/consultancy"
         self.headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
                 }
+        self.http = get_http_client().for_source("care", self.headers)
+        self.ahttp = get_async_http_client().for_source("care", self.headers)
 
     def scrape(self):
         """Scrape CARE Bangladesh tenders"""
         try:
             print("🔍 Scraping CARE Bangladesh...")
-            res = requests.get(self.url, headers=self.headers, timeout=30)
-            res.raise_for_status()
+            return self.http.fetch_parsed(self.url, parse_with(self, '_parse'), timeout=30)
+
+        except Exception as e:
+            print(f"❌ Error scraping CARE Bangladesh: {e}")
+            raise ScrapeError(f"CARE Bangladesh: {e}") from e
 
-            soup = BeautifulSoup(res.text, "html.parser")  # Changed to html.parser
+    async def scrape_async(self):
+        """Scrape CARE Bangladesh tenders on the shared event loop"""
+        try:
+            print("🔍 Scraping CARE Bangladesh (async)...")
+            return await self.ahttp.fetch_parsed(self.url, parse_with(self, '_parse'), timeout=30)
+
+        except Exception as e:
+            print(f"❌ Error scraping CARE Bangladesh: {e}")
+            raise ScrapeError(f"CARE Bangladesh: {e}") from e
+
+    def _parse(self, html):
+        """Parse consultancy cards out of the CARE page"""
+        try:
+            soup = make_soup(html, region=self.region)
 
             # Target the active tab
             project_tab = soup.select_one("div#project1.tab-pane.show.active") or soup.select_one(".consultancy-list") or soup.select_one(".tender-list")
 
             if not project_tab:
-                print("⚠️ Project tab not found, using sample data")
-                return []
+                print("⚠️ Project tab not found")
+                raise ScrapeError("CARE Bangladesh project tab not found")
 
             tenders = []
 
@@ -78,9 +101,11 @@ class CareScraper:
             print(f"✅ Scraped {len(tenders)} tenders from CARE Bangladesh")
             return tenders
 
+        except ScrapeError:
+            raise
         except Exception as e:
             print(f"❌ Error scraping CARE Bangladesh: {e}")
-            return []
+            raise ScrapeError(f"CARE Bangladesh: {e}") from e
 
     def get_sample_data(self):
         """Return sample data if scraping fails"""
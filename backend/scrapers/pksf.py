@@ -1,33 +1,56 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-from . import register_scraper
+from . import register_scraper, ScrapeError
+from services.http_client import get_http_client
+from services.async_http import get_async_http_client
+from services.parse_pool import parse_with
+from services.html_parser import make_soup
 
 
 @register_scraper('pksf', display_name='PKSF')
 class PKSFScraper:
+    # only this part of the listing page is parsed (see make_soup)
+    region = ".tender-table"
 
     def __init__(self):
         self.url = "https://pksf.org.bd/tender/"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
         }
+        self.http = get_http_client().for_source("pksf", self.headers)
+        self.ahttp = get_async_http_client().for_source("pksf", self.headers)
 
     def scrape(self):
         """Scrape PKSF tender table"""
         try:
             print("🔍 Scraping PKSF tenders...")
 
-            res = requests.get(self.url, headers=self.headers, timeout=30)
-            res.raise_for_status()
+            return self.http.fetch_parsed(self.url, parse_with(self, '_parse'), timeout=30)
 
-            soup = BeautifulSoup(res.text, "html.parser")
+        except Exception as e:
+            print(f"❌ Error scraping PKSF: {e}")
+            raise ScrapeError(f"PKSF: {e}") from e
+
+    async def scrape_async(self):
+        """Scrape PKSF tender table on the shared event loop"""
+        try:
+            print("🔍 Scraping PKSF tenders (async)...")
+
+            return await self.ahttp.fetch_parsed(self.url, parse_with(self, '_parse'), timeout=30)
+
+        except Exception as e:
+            print(f"❌ Error scraping PKSF: {e}")
+            raise ScrapeError(f"PKSF: {e}") from e
+
+    def _parse(self, html):
+        """Parse the tender table out of the PKSF page"""
+        try:
+            soup = make_soup(html, region=self.region)
 
             table = soup.select_one(".tender-table")
 
             if not table:
                 print("⚠️ Tender table not found")
-                return []
+                raise ScrapeError("PKSF tender table not found")
 
             rows = table.select("tbody tr")
 
@@ -71,9 +94,11 @@ class PKSFScraper:
 
             return results
 
+        except ScrapeError:
+            raise
         except Exception as e:
             print(f"❌ Error scraping PKSF: {e}")
-            return []
+            raise ScrapeError(f"PKSF: {e}") from e
 
     def get_sample_data(self):
         return []
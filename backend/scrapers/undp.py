@@ -1,14 +1,19 @@
-from . import register_scraper
+from . import register_scraper, ScrapeError
 import pandas as pd  # Add this import
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
 import re
+from services.http_client import get_http_client
+from services.async_http import get_async_http_client
+from services.parse_pool import parse_with
+from services.html_parser import make_soup
 
 
 @register_scraper('undp', display_name='UNDP')
 class UNDPScraper:
     # Your existing UNDP scraper code...class UNDPScraper:
+    # only this part of the listing page is parsed (see make_soup)
+    region = "a.vacanciesTableLink"
+
     def __init__(self):
         # Clean URL without tracking parameters
         self.base_url = "https://procurement-notices.undp.org"
@@ -18,19 +23,37 @@ class UNDPScraper:
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
                 }
+        self.http = get_http_client().for_source('undp', self.headers)
+        self.ahttp = get_async_http_client().for_source('undp', self.headers)
 
     def scrape(self, max_items=50):
         """Scrape UNDP procurement notices"""
         print("🔍 Scraping UNDP procurement notices...")
 
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=30)
+            return self.http.fetch_parsed(
+                    self.url, parse_with(self, '_parse', max_items), timeout=30)
 
-            if response.status_code != 200:
-                print(f"❌ Failed with status: {response.status_code}")
-                return []
+        except Exception as e:
+            print(f"❌ Error scraping UNDP: {e}")
+            raise ScrapeError(f"UNDP: {e}") from e
+
+    async def scrape_async(self, max_items=50):
+        """Scrape UNDP procurement notices on the shared event loop"""
+        print("🔍 Scraping UNDP procurement notices (async)...")
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+        try:
+            return await self.ahttp.fetch_parsed(
+                    self.url, parse_with(self, '_parse', max_items), timeout=30)
+
+        except Exception as e:
+            print(f"❌ Error scraping UNDP: {e}")
+            raise ScrapeError(f"UNDP: {e}") from e
+
+    def _parse(self, content, max_items=50):
+        """Parse procurement items out of the UNDP page"""
+        try:
+            soup = make_soup(content, region=self.region)
 
             # Find all procurement items
             # They are in <a> tags with class "vacanciesTableLink"
@@ -123,7 +146,7 @@ class UNDPScraper:
 
         except Exception as e:
             print(f"❌ Error scraping UNDP: {e}")
-            return []
+            raise ScrapeError(f"UNDP: {e}") from e
 
     def get_sample_data(self):
         """Return sample UNDP data"""
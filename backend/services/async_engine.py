@@ -0,0 +1,84 @@
+# backend/services/async_engine.py
+import asyncio
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from scrapers import get_scraper
+from services.async_http import AIOHTTP_AVAILABLE, get_async_http_client
+from services.scrape_runner import is_cancelled
+
+
+class AsyncScrapeEngine:
+    """Run scrapers on one shared event loop in a background thread.
+
+    Scrapers with a scrape_async() method run natively on the loop, so all
+    their listing and detail fetches share one aiohttp session. Sync-only
+    scrapers (e.g. Selenium) are adapted by running scrape() in a thread.
+    """
+
+    def __init__(self, default_timeout=120, timeouts=None):
+        self.default_timeout = default_timeout
+        self.timeouts = dict(timeouts or {})
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build an engine from a Flask config mapping"""
+        return cls(
+                default_timeout=config.get('SCRAPE_TIMEOUT', 120),
+                timeouts=config.get('SCRAPE_TIMEOUTS', {})
+                )
+
+    def timeout_for(self, source):
+        """Get the time budget in seconds for a source"""
+        return self.timeouts.get(source, self.default_timeout)
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever,
+                                                name='scrape-loop', daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro, timeout=None, poll=0.25):
+        """Run a coroutine on the engine loop and block for its result.
+
+        The coroutine is cancelled on the loop (releasing its sockets and
+        rate limiter slots) when timeout runs out, or when the ScrapeRunner
+        cancels the scrape running on the calling thread.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = poll if deadline is None else max(0.0, min(poll, deadline - time.monotonic()))
+            try:
+                return future.result(wait)
+            except FutureTimeoutError:
+                if is_cancelled() or (deadline is not None and time.monotonic() >= deadline):
+                    future.cancel()
+                    raise
+
+    async def scrape_instance(self, scraper):
+        """Scrape with the native async path, or adapt a sync scraper"""
+        if AIOHTTP_AVAILABLE and hasattr(scraper, 'scrape_async'):
+            return await scraper.scrape_async()
+        return await asyncio.get_running_loop().run_in_executor(None, scraper.scrape)
+
+    def scrape(self, source):
+        """Scrape one registered source on the shared loop (blocking)"""
+        scraper_class = get_scraper(source)
+        if not scraper_class:
+            return []
+        return self.run(self.scrape_instance(scraper_class()), timeout=self.timeout_for(source))
+
+    def close(self):
+        """Close the shared session and stop the loop"""
+        if self._loop is None:
+            return
+        self.run(get_async_http_client().close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
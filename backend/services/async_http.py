@@ -0,0 +1,217 @@
+# backend/services/async_http.py
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from services.rate_limiter import get_rate_limiter
+from services.http_cache import get_http_cache
+from services.content_fingerprint import fetch_parsed_result
+from services.html_parser import content_type_charset
+
+# Try to import aiohttp, handle gracefully if not installed
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    print("⚠️ aiohttp not installed. Async scraping disabled. Install with: pip install aiohttp")
+
+
+class AsyncResponse:
+    """Fully-read response with the parts of requests.Response scrapers use"""
+
+    def __init__(self, url, status_code, headers, content, encoding=None, from_cache=False):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} error for url: {self.url}", response=self)
+
+
+class AsyncHttpClient:
+    """One aiohttp session shared by every async scraper.
+
+    The session belongs to the event loop it was created on, so the client
+    must only be used from the scrape engine's loop. Errors are raised as
+    requests exceptions so scrapers handle both paths the same way.
+    """
+
+    def __init__(self, limit=100, limit_per_host=10, timeout=30):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self._session = None
+        self._lock = threading.Lock()
+        self.host_stats = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a client from a Flask config mapping"""
+        return cls(
+                limit=config.get('ASYNC_HTTP_LIMIT', 100),
+                limit_per_host=config.get('ASYNC_HTTP_LIMIT_PER_HOST', 10),
+                timeout=config.get('HTTP_TIMEOUT', 30)
+                )
+
+    def for_source(self, source, headers=None):
+        """Get a client bound to a scraper's name and default headers"""
+        return AsyncSourceClient(self, source, headers)
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def request(self, method, url, headers=None, timeout=None, source=None):
+        """Send a request and read the whole body, revalidating cached GETs"""
+        http_cache = get_http_cache() if method == 'GET' else None
+        if http_cache is None:
+            return await self._send(method, url, headers, timeout)
+
+        conditional = http_cache.validators(url)
+        response = await self._send(method, url, dict(headers or {}, **conditional), timeout)
+
+        if response.status_code == 304 and conditional:
+            cached = http_cache.load(url)
+            if cached is None:
+                response = await self._send(method, url, headers, timeout)
+            else:
+                body, content_type = cached
+                http_cache.record(source, 'hit')
+                return AsyncResponse(response.url, 200, {'Content-Type': content_type or ''},
+                                     body, content_type_charset(content_type), from_cache=True)
+
+        if response.status_code == 200:
+            stored = http_cache.store(url, response.headers, response.content)
+            http_cache.record(source, 'miss' if stored else 'uncacheable')
+
+        return response
+
+    async def _send(self, method, url, headers, timeout):
+        session = self._get_session()
+        await get_rate_limiter().acquire_async(url)
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        started = time.monotonic()
+        try:
+            async with session.request(method, url, headers=headers, timeout=client_timeout) as resp:
+                content = await resp.read()
+                return AsyncResponse(str(resp.url), resp.status, resp.headers, content, resp.charset)
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(f"timed out fetching {url}") from e
+        except aiohttp.ClientError as e:
+            raise requests.ConnectionError(f"{e.__class__.__name__} fetching {url}: {e}") from e
+        finally:
+            self._record(urlsplit(url).netloc, time.monotonic() - started)
+
+    def _record(self, host, elapsed):
+        with self._lock:
+            entry = self.host_stats.setdefault(host, {'requests': 0, 'total_seconds': 0.0})
+            entry['requests'] += 1
+            entry['total_seconds'] += elapsed
+
+    async def scan(self, url, scanner, headers=None, timeout=None, source=None, chunk_size=16 * 1024):
+        """Stream a GET through a FieldScanner, closing the connection as
+        soon as the scanner finds its field"""
+        session = self._get_session()
+        await get_rate_limiter().acquire_async(url)
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        started = time.monotonic()
+        try:
+            async with session.get(url, headers=headers, timeout=client_timeout) as resp:
+                if resp.status >= 400:
+                    raise requests.HTTPError(f"{resp.status} error for url: {url}")
+                scanner.encoding = resp.charset or scanner.encoding
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    if scanner.feed(chunk) is not None:
+                        resp.close()  # drop the rest of the page with the connection
+                        break
+                else:
+                    scanner.finish()
+                return scanner.result
+        except asyncio.TimeoutError as e:
+            raise requests.Timeout(f"timed out fetching {url}") from e
+        except aiohttp.ClientError as e:
+            raise requests.ConnectionError(f"{e.__class__.__name__} fetching {url}: {e}") from e
+        finally:
+            self._record(urlsplit(url).netloc, time.monotonic() - started)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def get_stats(self):
+        """Get request counts per host"""
+        with self._lock:
+            return {
+                    host: {
+                        'requests': entry['requests'],
+                        'avg_seconds': round(entry['total_seconds'] / entry['requests'], 3)
+                        }
+                    for host, entry in self.host_stats.items()
+                    }
+
+
+class AsyncSourceClient:
+    """Per-scraper view of the shared async client with its default headers"""
+
+    def __init__(self, client, source, headers=None):
+        self.client = client
+        self.source = source
+        self.headers = dict(headers or {})
+
+    async def get(self, url, headers=None, timeout=None):
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return await self.client.request('GET', url, headers=merged, timeout=timeout, source=self.source)
+
+    async def scan(self, url, scanner, timeout=None):
+        """Stream url through scanner until it finds its field (see FieldScanner)"""
+        return await self.client.scan(url, scanner, headers=self.headers, timeout=timeout, source=self.source)
+
+    async def fetch_parsed(self, url, parse, timeout=None):
+        """GET url and return parse(response), reusing the last parsed
+        result when the page content has not changed"""
+        response = await self.get(url, timeout=timeout)
+        response.raise_for_status()
+        # parsing is CPU work (or a wait on the parse pool) - keep it off the loop
+        return await asyncio.get_running_loop().run_in_executor(
+                None, fetch_parsed_result, self.source, url, response, parse)
+
+
+# Shared instance used by every scraper's scrape_async()
+_client = None
+_client_lock = threading.Lock()
+
+
+def configure_async_http_client(config):
+    """Create the shared async client from app config"""
+    global _client
+    with _client_lock:
+        _client = AsyncHttpClient.from_config(config)
+    return _client
+
+
+def get_async_http_client():
+    """Get the shared async client, creating it with defaults if needed"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = AsyncHttpClient()
+        return _client
@@ -0,0 +1,301 @@
+# backend/services/browser_pool.py
+import atexit
+import threading
+import time
+
+# Try to import selenium, handle gracefully if not installed
+try:
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+    SELENIUM_AVAILABLE = True
+except ImportError:
+    SELENIUM_AVAILABLE = False
+
+# psutil gives the real memory of Chrome's process tree; without it the
+# JS heap reported by the page is used instead
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Requests for these are dropped - scrapers only read the DOM
+BLOCKED_URLS = ['*.css', '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+                '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.ico']
+
+
+class BrowserPool:
+    """Warm headless Chrome instances shared across Selenium scrapes.
+
+    The chromedriver binary is resolved once, and browsers are kept open
+    between scrapes instead of being launched and quit every time. A
+    browser is replaced after max_uses scrapes, when its memory passes
+    max_memory_mb, or when a scrape using it fails. Images, fonts and
+    stylesheets are blocked and pages load with the 'eager' strategy.
+    """
+
+    def __init__(self, size=1, max_uses=20, max_memory_mb=600, acquire_timeout=120, warm=True):
+        self.size = size
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self.acquire_timeout = acquire_timeout
+        self.warm = warm
+        self._driver_path = None
+        self._idle = []        # LIFO, so the warmest browser is reused first
+        self._browsers = {}    # id(driver) -> {'uses', 'launched_at', 'cold'}
+        self._launching = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._resolve_lock = threading.Lock()
+        self.stats = {
+                'launches': 0,
+                'launch_seconds': 0.0,
+                'recycled': {'uses': 0, 'memory': 0, 'failed': 0},
+                'cold': {'scrapes': 0, 'seconds': 0.0},
+                'warm': {'scrapes': 0, 'seconds': 0.0},
+                }
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a pool from a Flask config mapping"""
+        return cls(
+                size=config.get('BROWSER_POOL_SIZE', 1),
+                max_uses=config.get('BROWSER_MAX_USES', 20),
+                max_memory_mb=config.get('BROWSER_MAX_MEMORY_MB', 600),
+                acquire_timeout=config.get('BROWSER_ACQUIRE_TIMEOUT', 120),
+                warm=config.get('BROWSER_WARM', True)
+                )
+
+    def start(self):
+        """Resolve the driver and launch the browsers in the background"""
+        if not SELENIUM_AVAILABLE:
+            return self
+        threading.Thread(target=self._warm_up, name='browser-pool-warmup', daemon=True).start()
+        return self
+
+    def _warm_up(self):
+        try:
+            self._resolve_driver()
+            if self.warm:
+                for _ in range(self.size):
+                    self._launch_into_pool()
+        except Exception as e:
+            print(f"⚠️ Browser pool warm-up failed: {e}")
+
+    def _resolve_driver(self):
+        with self._resolve_lock:
+            if self._driver_path is None:
+                self._driver_path = ChromeDriverManager().install()
+            return self._driver_path
+
+    def _options(self):
+        options = Options()
+        options.add_argument('--headless=new')  # Run in background
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--disable-gpu')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--window-size=1920,1080')
+        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+                'profile.managed_default_content_settings.stylesheets': 2,
+                })
+        options.page_load_strategy = 'eager'  # DOM ready is enough, don't wait for subresources
+        return options
+
+    def _launch(self):
+        """Start one Chrome instance (the slow, cold part)"""
+        started = time.monotonic()
+        driver = webdriver.Chrome(service=Service(self._resolve_driver()), options=self._options())
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+        except Exception as e:
+            print(f"⚠️ Could not block page assets: {e}")
+        elapsed = time.monotonic() - started
+        with self._cond:
+            self._browsers[id(driver)] = {'uses': 0, 'launched_at': time.time(), 'cold': False}
+            self.stats['launches'] += 1
+            self.stats['launch_seconds'] += elapsed
+        print(f"🌐 Launched headless Chrome in {elapsed:.1f}s")
+        return driver
+
+    def _launch_into_pool(self):
+        with self._cond:
+            if self._closed or len(self._browsers) + self._launching >= self.size:
+                return
+            self._launching += 1
+        try:
+            driver = self._launch()
+        finally:
+            with self._cond:
+                self._launching -= 1
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def acquire(self):
+        """Take a browser, launching one if the pool has room.
+
+        Raises TimeoutError if every browser stays busy for acquire_timeout.
+        """
+        if not SELENIUM_AVAILABLE:
+            raise RuntimeError("Selenium not installed")
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self._idle:
+                    driver = self._idle.pop()
+                    self._browsers[id(driver)]['uses'] += 1
+                    return driver
+                if len(self._browsers) + self._launching < self.size:
+                    self._launching += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError("No headless browser became free in time")
+                self._cond.wait(remaining)
+
+        try:
+            driver = self._launch()
+        finally:
+            with self._cond:
+                self._launching -= 1
+        with self._cond:
+            # this scrape waited for the launch
+            self._browsers[id(driver)].update(uses=1, cold=True)
+        return driver
+
+    def release(self, driver, elapsed=None, healthy=True):
+        """Give a browser back, recycling it if it is worn out or broken"""
+        with self._cond:
+            info = self._browsers.get(id(driver)) or {}
+            uses = info.get('uses', 0)
+            cold, info['cold'] = info.get('cold', False), False
+            if elapsed is not None:
+                bucket = self.stats['cold' if cold else 'warm']
+                bucket['scrapes'] += 1
+                bucket['seconds'] += elapsed
+
+        reason = None
+        if not healthy:
+            reason = 'failed'
+        elif uses >= self.max_uses:
+            reason = 'uses'
+        elif self.max_memory_mb and self._memory_mb(driver) > self.max_memory_mb:
+            reason = 'memory'
+
+        if reason is None:
+            try:
+                driver.delete_all_cookies()
+                driver.get('about:blank')
+            except Exception:
+                reason = 'failed'
+
+        if reason is not None:
+            self._retire(driver, reason)
+            if self.warm:
+                threading.Thread(target=self._launch_into_pool, daemon=True).start()
+            return
+
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._idle.append(driver)
+                self._cond.notify()
+        if closed:
+            self._retire(driver, None)
+
+    def _retire(self, driver, reason):
+        with self._cond:
+            self._browsers.pop(id(driver), None)
+            if reason:
+                self.stats['recycled'][reason] += 1
+            self._cond.notify()
+        if reason:
+            print(f"♻️ Recycling headless Chrome ({reason})")
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _memory_mb(self, driver):
+        """Resident memory of the browser's process tree, in MB"""
+        if PSUTIL_AVAILABLE:
+            try:
+                process = psutil.Process(driver.service.process.pid)
+                processes = [process] + process.children(recursive=True)
+                return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+            except (psutil.Error, AttributeError):
+                return 0
+        try:
+            heap = driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : 0")
+            return (heap or 0) / (1024 * 1024)
+        except Exception:
+            return 0
+
+    def get_stats(self):
+        """Get pool occupancy, recycling counts and cold vs warm scrape latency"""
+        def average(bucket):
+            return round(bucket['seconds'] / bucket['scrapes'], 2) if bucket['scrapes'] else None
+
+        with self._cond:
+            return {
+                    'available': SELENIUM_AVAILABLE,
+                    'size': self.size,
+                    'open': len(self._browsers),
+                    'idle': len(self._idle),
+                    'driver_resolved': self._driver_path is not None,
+                    'launches': self.stats['launches'],
+                    'avg_launch_seconds': round(self.stats['launch_seconds'] / self.stats['launches'], 2)
+                    if self.stats['launches'] else None,
+                    'recycled': dict(self.stats['recycled']),
+                    'cold_scrapes': self.stats['cold']['scrapes'],
+                    'cold_avg_seconds': average(self.stats['cold']),
+                    'warm_scrapes': self.stats['warm']['scrapes'],
+                    'warm_avg_seconds': average(self.stats['warm'])
+                    }
+
+    def close(self):
+        """Quit every idle browser; busy ones are quit when released"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for driver in idle:
+            self._retire(driver, None)
+
+
+# Shared instance used by the Selenium scrapers
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def configure_browser_pool(config):
+    """Create the shared pool from app config and start warming it"""
+    global _pool
+    with _pool_lock:
+        _pool = BrowserPool.from_config(config)
+    return _pool.start()
+
+
+def get_browser_pool():
+    """Get the shared pool, creating an unwarmed one with defaults if needed"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(warm=False)
+        return _pool
+
+
+@atexit.register
+def _close_browsers():
+    if _pool is not None:
+        _pool.close()
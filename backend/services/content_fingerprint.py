@@ -0,0 +1,135 @@
+# backend/services/content_fingerprint.py
+import copy
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+# ISO-8601 timestamp with seconds
+_TIMESTAMP = rb'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?'
+
+# Parts of a page that change on every request without the content changing
+VOLATILE_PATTERNS = [
+        # CSRF / anti-forgery tokens in hidden inputs and meta tags
+        rb'<input[^>]+name=["\']?(?:csrf[\w-]*|_token|csrfmiddlewaretoken|authenticity_token'
+        rb'|__RequestVerificationToken|__VIEWSTATE\w*|__EVENTVALIDATION)["\']?[^>]*>',
+        rb'<meta[^>]+name=["\']csrf[\w-]*["\'][^>]*>',
+        # per-request script nonces
+        rb'\snonce=["\'][^"\']*["\']',
+        # render times and cache stamps - only in meta tags, comments and
+        # script variables named for them; timestamps in the listing itself
+        # (deadlines, publication dates) are content
+        rb'<meta[^>]+content=["\']' + _TIMESTAMP + rb'["\'][^>]*>',
+        rb'<!--[^>]*?' + _TIMESTAMP + rb'[^>]*?-->',
+        rb'["\']?\w*(?:server|render|generat|build|cache|request)\w*["\']?\s*[:=]\s*["\']' + _TIMESTAMP + rb'["\']',
+        # cache-busting query strings on assets
+        rb'[?&](?:v|ver|t|_|ts|cb)=\d{6,}',
+        ]
+
+
+class FingerprintMemo:
+    """Skip re-parsing pages whose content has not changed.
+
+    Each fetched body is normalized (tokens, nonces and render stamps
+    removed) and hashed. If the hash matches the one recorded for the same
+    URL and parser last time, the previously parsed result is reused
+    instead of parsing again.
+    This covers both byte-identical 200 responses and 304s answered from
+    the HTTP cache.
+    """
+
+    def __init__(self, max_entries=512, extra_patterns=None):
+        self.max_entries = max_entries
+        patterns = VOLATILE_PATTERNS + [p.encode() if isinstance(p, str) else p
+                                        for p in (extra_patterns or [])]
+        self._volatile = re.compile(b'|'.join(b'(?:' + p + b')' for p in patterns), re.IGNORECASE)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (url, parser) -> (fingerprint, parsed result)
+        self.stats = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a memo from a Flask config mapping"""
+        return cls(
+                max_entries=config.get('FINGERPRINT_MAX_ENTRIES', 512),
+                extra_patterns=config.get('FINGERPRINT_IGNORE_PATTERNS', [])
+                )
+
+    def fingerprint(self, body):
+        """Hash a response body with volatile parts stripped out"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        return hashlib.blake2b(self._volatile.sub(b'', body), digest_size=16).hexdigest()
+
+    def recall(self, key, fingerprint):
+        """Get (found, copy of parsed result) if the content under key is unchanged"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprint:
+                return False, None
+            self._entries.move_to_end(key)
+            # callers (e.g. the ToR filter) mutate notices, so hand out a copy
+            return True, copy.deepcopy(entry[1])
+
+    def remember(self, key, fingerprint, result):
+        """Record the fingerprint and parsed result of the content under key"""
+        with self._lock:
+            self._entries[key] = (fingerprint, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record(self, source, outcome):
+        """Count an 'unchanged' (parse skipped) or 'parsed' page"""
+        with self._lock:
+            stats = self.stats.setdefault(source or 'unknown', {'unchanged': 0, 'parsed': 0})
+            stats[outcome] += 1
+
+    def get_stats(self):
+        """Get skipped/parsed counters per source"""
+        with self._lock:
+            return {'entries': len(self._entries),
+                    'sources': {source: dict(stats) for source, stats in self.stats.items()}}
+
+
+def fetch_parsed_result(source, url, response, parse):
+    """Parse a response, or reuse the last result if its content is unchanged.
+
+    Results are remembered per url and parse.memo_key (the parser and its
+    arguments, set by parse_with()); a callback without one is always run.
+    """
+    memo = get_fingerprint_memo()
+    parser = getattr(parse, 'memo_key', None)
+    if memo is None or parser is None:
+        return parse(response)
+
+    key = (url, parser)
+    fingerprint = memo.fingerprint(response.content)
+    found, result = memo.recall(key, fingerprint)
+    if found:
+        memo.record(source, 'unchanged')
+        print(f"♻️ {source}: {url} unchanged, reusing parsed result")
+        return result
+
+    result = parse(response)
+    memo.remember(key, fingerprint, result)
+    memo.record(source, 'parsed')
+    return result
+
+
+# Shared instance used by every scraper's fetch_parsed()
+_memo = None
+_memo_lock = threading.Lock()
+
+
+def configure_fingerprint_memo(config):
+    """Create the shared memo from app config (None when disabled)"""
+    global _memo
+    with _memo_lock:
+        _memo = FingerprintMemo.from_config(config) if config.get('FINGERPRINT_ENABLED', True) else None
+    return _memo
+
+
+def get_fingerprint_memo():
+    """Get the shared memo (None until configured or when disabled)"""
+    return _memo
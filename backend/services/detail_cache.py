@@ -0,0 +1,119 @@
+# backend/services/detail_cache.py
+import json
+import os
+import threading
+import time
+
+from services.process_lock import file_lock, write_json_atomic
+
+
+class DetailCache:
+    """Persistent cache of fields extracted from tender detail pages.
+
+    Scrapers that enrich listing cards by visiting each card's detail page
+    (e.g. BDJobs deadlines) store the extracted value per detail URL with
+    the time it was fetched and an expiry chosen by the scraper, so later
+    refreshes only fetch detail pages for new cards. Entries are kept in a
+    JSON file and written back once per scrape with flush(), merged with
+    whatever other worker processes flushed in the meantime.
+    """
+
+    def __init__(self, path='cache/details.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.stats = {}
+        self._entries = self._load()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a cache from a Flask config mapping"""
+        return cls(path=config.get('DETAIL_CACHE_FILE', os.path.join('cache', 'details.json')))
+
+    def _load(self):
+        """Load url -> entry, dropping anything already expired"""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        now = time.time()
+        return {url: entry for url, entry in entries.items() if entry.get('expires_at', 0) > now}
+
+    def get(self, source, url):
+        """Get (found, value) for a detail url, counting a hit or miss"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry['expires_at'] <= time.time():
+                del self._entries[url]
+                self._dirty = True
+                entry = None
+            stats = self._stats_for(source)
+            stats['hits' if entry is not None else 'misses'] += 1
+            return (True, entry['value']) if entry is not None else (False, None)
+
+    def put(self, source, url, value, expires_at, fetch_seconds=None):
+        """Store the value extracted from url until expires_at (epoch seconds)"""
+        with self._lock:
+            self._entries[url] = {
+                    'source': source,
+                    'value': value,
+                    'fetched_at': time.time(),
+                    'expires_at': expires_at
+                    }
+            self._dirty = True
+            if fetch_seconds is not None:
+                stats = self._stats_for(source)
+                stats['fetches'] += 1
+                stats['fetch_seconds'] += fetch_seconds
+
+    def flush(self):
+        """Write the cache file if anything changed since the last flush"""
+        with self._lock:
+            if not self._dirty:
+                return
+            # other worker processes may have flushed their own entries since we loaded
+            with file_lock(self.path):
+                entries = self._load()
+                entries.update(self._entries)
+                write_json_atomic(self.path, entries)
+            self._entries = entries
+            self._dirty = False
+
+    def _stats_for(self, source):
+        return self.stats.setdefault(source or 'unknown', {'hits': 0, 'misses': 0, 'fetches': 0, 'fetch_seconds': 0.0})
+
+    def get_stats(self):
+        """Get hit rate and average detail-fetch time per source"""
+        with self._lock:
+            sources = {}
+            for source, stats in self.stats.items():
+                lookups = stats['hits'] + stats['misses']
+                sources[source] = {
+                        'hits': stats['hits'],
+                        'misses': stats['misses'],
+                        'hit_rate': round(stats['hits'] / lookups, 3) if lookups else None,
+                        'fetches': stats['fetches'],
+                        'avg_fetch_seconds': round(stats['fetch_seconds'] / stats['fetches'], 3) if stats['fetches'] else None
+                        }
+            return {'entries': len(self._entries), 'sources': sources}
+
+
+# Shared instance used by scrapers that fetch detail pages
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def configure_detail_cache(config):
+    """Create the shared cache from app config (None when disabled)"""
+    global _cache
+    with _cache_lock:
+        _cache = DetailCache.from_config(config) if config.get('DETAIL_CACHE_ENABLED', True) else None
+    return _cache
+
+
+def get_detail_cache():
+    """Get the shared cache (None until configured or when disabled)"""
+    return _cache
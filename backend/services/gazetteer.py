@@ -0,0 +1,222 @@
+# backend/services/gazetteer.py
+import json
+import os
+import re
+import unicodedata
+from collections import namedtuple
+
+# A place a name refers to: kind is 'country', 'region', 'division', 'district' or 'upazila'
+Place = namedtuple('Place', 'name country kind')
+
+COUNTRIES = [
+        'Afghanistan', 'Albania', 'Algeria', 'Angola', 'Argentina', 'Armenia', 'Australia', 'Austria',
+        'Azerbaijan', 'Bahrain', 'Bangladesh', 'Barbados', 'Belarus', 'Belgium', 'Belize', 'Benin', 'Bhutan',
+        'Bolivia', 'Bosnia and Herzegovina', 'Botswana', 'Brazil', 'Bulgaria', 'Burkina Faso', 'Burundi',
+        'Cabo Verde', 'Cambodia', 'Cameroon', 'Canada', 'Central African Republic', 'Chad', 'Chile', 'China',
+        'Colombia', 'Comoros', 'Costa Rica', "Cote d'Ivoire", 'Croatia', 'Cuba', 'Cyprus', 'Czech Republic',
+        'Democratic Republic of Congo', 'Denmark', 'Djibouti', 'Dominica', 'Dominican Republic', 'Ecuador', 'Egypt',
+        'El Salvador', 'Equatorial Guinea', 'Eritrea', 'Estonia', 'Eswatini', 'Ethiopia', 'Fiji', 'Finland',
+        'France', 'Gabon', 'Gambia', 'Georgia', 'Germany', 'Ghana', 'Greece', 'Grenada', 'Guatemala', 'Guinea',
+        'Guinea-Bissau', 'Guyana', 'Haiti', 'Honduras', 'Hungary', 'Iceland', 'India', 'Indonesia', 'Iran', 'Iraq',
+        'Ireland', 'Israel', 'Italy', 'Jamaica', 'Japan', 'Jordan', 'Kazakhstan', 'Kenya', 'Kiribati', 'Kosovo',
+        'Kuwait', 'Kyrgyz Republic', 'Lao PDR', 'Latvia', 'Lebanon', 'Lesotho', 'Liberia', 'Libya', 'Lithuania',
+        'Madagascar', 'Malawi', 'Malaysia', 'Maldives', 'Mali', 'Marshall Islands', 'Mauritania', 'Mauritius',
+        'Mexico', 'Micronesia', 'Moldova', 'Mongolia', 'Montenegro', 'Morocco', 'Mozambique', 'Myanmar', 'Namibia',
+        'Nauru', 'Nepal', 'Netherlands', 'New Zealand', 'Nicaragua', 'Niger', 'Nigeria', 'North Macedonia',
+        'Norway', 'Oman', 'Pakistan', 'Palau', 'Panama', 'Papua New Guinea', 'Paraguay', 'Peru', 'Philippines',
+        'Poland', 'Portugal', 'Qatar', 'Republic of Congo', 'Romania', 'Russia', 'Rwanda', 'Samoa',
+        'Sao Tome and Principe', 'Saudi Arabia', 'Senegal', 'Serbia', 'Seychelles', 'Sierra Leone', 'Singapore',
+        'Slovakia', 'Slovenia', 'Solomon Islands', 'Somalia', 'South Africa', 'South Sudan', 'Spain', 'Sri Lanka',
+        'St. Lucia', 'St. Vincent and the Grenadines', 'Sudan', 'Suriname', 'Sweden', 'Switzerland', 'Syria',
+        'Tajikistan', 'Tanzania', 'Thailand', 'Timor-Leste', 'Togo', 'Tonga', 'Trinidad and Tobago', 'Tunisia',
+        'Turkiye', 'Turkmenistan', 'Tuvalu', 'Uganda', 'Ukraine', 'United Arab Emirates', 'United Kingdom',
+        'United States', 'Uruguay', 'Uzbekistan', 'Vanuatu', 'Venezuela', 'Viet Nam', 'West Bank and Gaza',
+        'Yemen', 'Zambia', 'Zimbabwe',
+        ]
+
+# Other names for the countries above: spellings, short forms, Bengali names
+# and a few well-known sub-national places
+COUNTRY_ALIASES = {
+        'Bangladesh': ['বাংলাদেশ', 'Bangladeshi', 'Peoples Republic of Bangladesh'],
+        'India': ['ভারত', 'Odisha', 'Telangana', 'Karnataka', 'Delhi', 'Mumbai', 'West Bengal', 'Assam'],
+        'Myanmar': ['মিয়ানমার', 'Burma', 'Rakhine'],
+        'Nepal': ['নেপাল'],
+        'Bhutan': ['ভুটান'],
+        'Pakistan': ['পাকিস্তান'],
+        'Sri Lanka': ['শ্রীলঙ্কা'],
+        'Azerbaijan': ['Baku'],
+        'Jamaica': ['Kingston'],
+        'Kyrgyz Republic': ['Kyrgyzstan', 'Kyrgyz'],
+        'Tajikistan': ['Tajik'],
+        'Lao PDR': ['Laos', 'Lao'],
+        'Viet Nam': ['Vietnam'],
+        'Turkiye': ['Turkey'],
+        "Cote d'Ivoire": ['Ivory Coast'],
+        'Timor-Leste': ['East Timor'],
+        'Eswatini': ['Swaziland'],
+        'Cabo Verde': ['Cape Verde'],
+        'Democratic Republic of Congo': ['DRC', 'Congo, Democratic Republic', 'DR Congo'],
+        'Republic of Congo': ['Congo'],
+        'Gambia': ['The Gambia'],
+        'West Bank and Gaza': ['West Bank', 'Gaza', 'Palestine'],
+        'United Kingdom': ['UK'],
+        'United States': ['USA', 'United States of America'],
+        }
+
+# Groups of countries named as one area in titles
+REGIONS = {
+        'Africa': 'Africa', 'Sub-Saharan Africa': 'Africa', 'Central Asia': 'Central Asia',
+        'South Asia': 'South Asia', 'Southeast Asia': 'Southeast Asia', 'Middle East': 'Middle East',
+        'Eastern Europe': 'Eastern Europe', 'Latin America': 'Latin America', 'Caribbean': 'Caribbean',
+        }
+
+# Older English spellings still used in notices
+BANGLADESH_ALIASES = {
+        'Barishal': ['Barisal'], 'Chattogram': ['Chittagong', 'CTG'], 'Cumilla': ['Comilla'],
+        'Jashore': ['Jessore'], 'Bogura': ['Bogra'], 'Nawabganj': ['Chapai Nawabganj', 'Chapainawabganj'],
+        'Sirajgonj': ['Sirajganj'], 'Jhalokati': ['Jhalokathi'], 'Maulvibazar': ['Moulvibazar'],
+        'Netrokona': ['Netrakona'], 'Khagrachari': ['Khagrachhari'], "Cox's Bazar": ['Coxs Bazar', 'Cox Bazar'],
+        'Gazipur Sadar': ['Joydebpur'], 'Shariatpur Sadar': ['Palong'],
+        }
+
+# Upazila names that are also ordinary words or well-known places elsewhere
+# (Raipur and Mirpur are cities in India and Pakistan); only their Bengali
+# names are matched
+AMBIGUOUS_UPAZILAS = {
+        'Bagha', 'Bandar', 'Bera', 'Boda', 'Itna', 'Juri', 'Kalai', 'Lalpur', 'Lama', 'Manda', 'Mirpur',
+        'Paba', 'Palash', 'Raipur', 'Ruma', 'Sripur', 'Tala',
+        }
+
+# Country codes only count in capitals ('BD', not the 'bd' in 'abdul')
+CODES = {'BD': 'Bangladesh', 'BGD': 'Bangladesh'}
+
+BANGLADESH_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gazetteer_bd.json')
+
+# letters and combining marks that make a match part of a longer word
+_WORD = r'\w\u0980-\u09ff'
+
+
+class Gazetteer:
+    """Place names compiled into one regex, for finding where a notice is.
+
+    Every alias is folded into a single alternation laid out as a trie
+    (shared prefixes written once), so a text is scanned in one pass
+    however many names there are. Matches must stand alone as words,
+    English names match in any case (the text is lower-cased once rather
+    than matching with IGNORECASE, which is slower) and Bengali names
+    exactly. Longer names win over their prefixes ('Niger' vs 'Nigeria').
+    """
+
+    def __init__(self, places, codes=None):
+        self._places = {}
+        for alias, place in places:
+            # Bengali letters like ড় are typed both precomposed and with a separate nukta
+            for form in {alias, unicodedata.normalize('NFC', alias)}:
+                self._places.setdefault(form.lower(), place)
+        self._codes = {code: Place(country, country, 'country') for code, country in (codes or {}).items()}
+        self.pattern = re.compile(rf'(?<![{_WORD}])(?:{_trie_pattern(self._places)})(?![{_WORD}])')
+        self.code_pattern = None
+        if self._codes:
+            codes = '|'.join(re.escape(code) for code in sorted(self._codes, key=len, reverse=True))
+            self.code_pattern = re.compile(rf'(?<![{_WORD}])(?:{codes})(?![{_WORD}])')
+
+    def _matches(self, text):
+        """(position, place) for every name in text, in order"""
+        if not text:
+            return []
+        found = [(match.start(), self._lookup(match.group(0))) for match in self.pattern.finditer(text.lower())]
+        # plain substring checks first, the codes rarely appear at all
+        if self.code_pattern is not None and any(code in text for code in self._codes):
+            codes = [(match.start(), self._codes[match.group(0)]) for match in self.code_pattern.finditer(text)]
+            if codes:
+                found = sorted(found + codes, key=lambda item: item[0])
+        return found
+
+    def _lookup(self, name):
+        place = self._places.get(name)
+        if place is None:
+            # matched across a line break or with a typographic apostrophe
+            place = self._places[_SPACES.sub(' ', name).replace('’', "'")]
+        return place
+
+    def find(self, text):
+        """First place named in text, or None"""
+        found = self._matches(text)
+        return found[0][1] if found else None
+
+    def find_all(self, text):
+        """Every place named in text, in order"""
+        return [place for _, place in self._matches(text)]
+
+    def mentions(self, text, country):
+        """Whether text names the country or a place inside it"""
+        return any(place.country == country for _, place in self._matches(text))
+
+    def __len__(self):
+        return len(self._places) + len(self._codes)
+
+
+_SPACES = re.compile(r'\s+')
+
+# a space in a name also matches line breaks and repeated spaces, and an
+# apostrophe matches the typographic one
+_ATOMS = {' ': r'\s+', "'": "['’]"}
+
+
+def _trie_pattern(words):
+    """Regex alternation for words, nested by common prefix"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        end = '' in node
+        branches = []
+        for char in sorted(c for c in node if c):
+            atom = _ATOMS.get(char) or re.escape(char)
+            branches.append(atom + build(node[char]))
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # branches are tried before stopping here, so the longest name wins
+        if end:
+            return '(?:' + body + ')?' if len(branches) > 1 or len(body) > 1 else body + '?'
+        return body
+
+    return build(trie)
+
+
+def _default_places():
+    for country in COUNTRIES:
+        yield country, Place(country, country, 'country')
+    for country, aliases in COUNTRY_ALIASES.items():
+        for alias in aliases:
+            yield alias, Place(country, country, 'country')
+    for region, name in REGIONS.items():
+        yield region, Place(name, None, 'region')
+
+    with open(BANGLADESH_DATA, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    for kind, rows in (('division', data['divisions']), ('district', data['districts']),
+                       ('upazila', data['upazilas'])):
+        for row in rows:
+            name, bengali = row[0], row[1]
+            place = Place(name, 'Bangladesh', kind)
+            if not (kind == 'upazila' and name in AMBIGUOUS_UPAZILAS):
+                yield name, place
+                for alias in BANGLADESH_ALIASES.get(name, []):
+                    yield alias, place
+            if bengali:
+                yield bengali, place
+
+
+# Built once at import and shared by the scrapers and filters
+_gazetteer = Gazetteer(_default_places(), codes=CODES)
+
+
+def get_gazetteer():
+    """Get the shared gazetteer"""
+    return _gazetteer
@@ -0,0 +1,246 @@
+# backend/services/high_water.py
+import hashlib
+import json
+import os
+import threading
+import time
+
+from services.process_lock import file_lock, file_version, write_json_atomic
+
+# fields that identify a notice, most specific first
+KEY_FIELDS = ('reference_no', 'procurement_number', 'detail_url', 'link', 'url')
+
+
+def row_key(tender):
+    """Stable identity of a listing row: its reference or link, else a
+    fingerprint of the title and dates"""
+    for field in KEY_FIELDS:
+        value = tender.get(field)
+        if value and value != '#':
+            return f"{field}:{value}"
+    text = '|'.join(str(tender.get(field, '')) for field in ('title', 'publication_date', 'deadline'))
+    return 'row:' + hashlib.blake2b(text.encode('utf-8'), digest_size=12).hexdigest()
+
+
+class HighWaterMarks:
+    """Per-source record of the listing rows already seen.
+
+    Each source keeps the keys of the rows from its last crawls (see
+    row_key), the newest row and when it was last crawled in full.
+    Paginated scrapers stop at the first page holding a known row
+    (reached()) and say so with stopped_paging_early(); only then does
+    run_incremental() merge the new rows over the previous listing -
+    a scrape that read the whole listing replaces it. A full crawl ignores the marks; it runs every
+    full_interval seconds or when asked for with request_full().
+
+    The marks file may be shared by several worker processes: reads
+    reload it when another process has rewritten it, and writes merge
+    into the current file under a cross-process file lock.
+    """
+
+    def __init__(self, path='cache/high_water.json', full_interval=86400, max_keys=2000):
+        self.path = path
+        self.full_interval = full_interval
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._version = None
+        self._marks = self._load()
+        self._early_stops = set()
+        self.stats = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build the marks from a Flask config mapping"""
+        return cls(
+                path=config.get('HIGH_WATER_FILE', os.path.join('cache', 'high_water.json')),
+                full_interval=config.get('HIGH_WATER_FULL_INTERVAL', 86400),
+                max_keys=config.get('HIGH_WATER_MAX_KEYS', 2000)
+                )
+
+    def _load(self):
+        self._version = file_version(self.path)
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                marks = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        for mark in marks.values():
+            mark['keys'] = set(mark.get('keys', []))
+        return marks
+
+    def _save(self):
+        data = {source: dict(mark, keys=sorted(mark['keys'])) for source, mark in self._marks.items()}
+        write_json_atomic(self.path, data)
+        self._version = file_version(self.path)
+
+    def _refresh(self):
+        """Reload the marks if another process saved them (caller holds _lock)"""
+        if file_version(self.path) != self._version:
+            self._marks = self._load()
+
+    def request_full(self, source):
+        """Make the next crawl of source a full one"""
+        with self._lock, file_lock(self.path):
+            self._marks = self._load()
+            if source in self._marks:
+                self._marks[source]['full_requested'] = True
+                self._save()
+
+    def full_due(self, source):
+        """Whether the next crawl of source should ignore the marks"""
+        with self._lock:
+            self._refresh()
+            mark = self._marks.get(source)
+            return (mark is None or mark.get('full_requested', False)
+                    or time.time() - mark.get('last_full', 0) >= self.full_interval)
+
+    def known_keys(self, source):
+        """Keys of rows seen before (empty when a full crawl is due)"""
+        if self.full_due(source):
+            return set()
+        with self._lock:
+            mark = self._marks.get(source)
+            return set(mark['keys']) if mark else set()
+
+    def reached(self, source, rows):
+        """Whether a page of rows has reached the part of the listing already seen"""
+        known = self.known_keys(source)
+        return bool(known) and any(row_key(row) in known for row in rows)
+
+    def stopped_early(self, source):
+        """Note that this process's crawl of source skipped the rest of the listing"""
+        with self._lock:
+            self._early_stops.add(source)
+
+    def take_early_stop(self, source):
+        """Whether the crawl of source stopped early since the last call"""
+        with self._lock:
+            if source in self._early_stops:
+                self._early_stops.discard(source)
+                return True
+            return False
+
+    def new_rows(self, source, rows):
+        """The rows not seen before, in order (even when a full crawl is due)"""
+        with self._lock:
+            self._refresh()
+            mark = self._marks.get(source)
+            known = set(mark['keys']) if mark else set()
+        return [row for row in rows if row_key(row) not in known]
+
+    def record(self, source, rows, full=False, new=0):
+        """Add a crawl's rows to the marks; a full crawl replaces them"""
+        keys = [row_key(row) for row in rows]
+        with self._lock, file_lock(self.path):
+            self._marks = self._load()
+            stats = self._stats_for(source)
+            stats['full' if full else 'incremental'] += 1
+            stats['new_rows'] += new
+            stats['last_new'] = new
+            mark = self._marks.get(source)
+            if full or mark is None:
+                mark = self._marks[source] = {'keys': set(), 'last_full': time.time()}
+            mark['keys'].update(keys)
+            if len(mark['keys']) > self.max_keys:
+                # keep this crawl's rows; older keys are only needed until a full crawl
+                mark['keys'] = set(keys[:self.max_keys])
+            if keys:
+                mark['newest'] = keys[0]
+            mark['updated_at'] = time.time()
+            self._save()
+
+    def _stats_for(self, source):
+        return self.stats.setdefault(source, {'full': 0, 'incremental': 0, 'new_rows': 0, 'last_new': None})
+
+    def get_stats(self):
+        """Get the marks and incremental/full crawl counts per source"""
+        now = time.time()
+        with self._lock:
+            self._refresh()
+            sources = {}
+            for source, mark in self._marks.items():
+                sources[source] = dict(
+                        self.stats.get(source, {}),
+                        known_rows=len(mark['keys']),
+                        newest=mark.get('newest'),
+                        last_full_age=round(now - mark['last_full']),
+                        full_requested=mark.get('full_requested', False)
+                        )
+            return {'full_interval': self.full_interval, 'sources': sources}
+
+
+def run_incremental(source, scrape, previous=None):
+    """Scrape source against its high-water mark.
+
+    Returns (data, new_rows): data is the scraped rows, followed by the
+    previous rows this crawl did not reach when the scraper stopped
+    paging early, and new_rows the rows not seen before. Scrapers stop
+    paging at known rows by calling reached_known_rows(), and report
+    that they skipped pages with stopped_paging_early(); a scrape that
+    read the whole listing replaces the previous one, so notices taken
+    down are dropped.
+    """
+    marks = get_high_water_marks()
+    if marks is None:
+        data = scrape()
+        return data, data
+
+    full = marks.full_due(source)
+    marks.take_early_stop(source)   # forget a stop left over from a scrape run outside this function
+    rows = scrape()
+    partial = marks.take_early_stop(source)
+    new = marks.new_rows(source, rows)
+
+    if full or (rows and not partial):
+        data = rows
+    elif not rows:
+        # nothing came back (the scrape failed): keep the listing we have
+        return list(previous or []), []
+    else:
+        seen = {row_key(row) for row in rows}
+        older = [row for row in previous or [] if row_key(row) not in seen]
+        # number the merged listing again, as a full scrape would
+        data = [dict(row, id=number) if 'id' in row else row
+                for number, row in enumerate(rows + older, 1)]
+
+    if rows:
+        marks.record(source, rows, full=full, new=len(new))
+
+    kind = 'full' if full else 'incremental, stopped early' if partial else 'incremental'
+    print(f"🌊 {source}: {len(new)} new of {len(rows)} rows ({kind} crawl)")
+    return data, new
+
+
+def reached_known_rows(source, rows):
+    """Whether a paginated scrape of source can stop after this page of rows"""
+    marks = get_high_water_marks()
+    return marks is not None and marks.reached(source, rows)
+
+
+def stopped_paging_early(source):
+    """Tell run_incremental() a paginated scrape of source did not read
+    the whole listing (it reached known rows or was cancelled), so the
+    previous rows it did not reach are kept"""
+    marks = get_high_water_marks()
+    if marks is not None:
+        marks.stopped_early(source)
+
+
+# Shared instance used by the scrapers, the app and the ToR scan
+_marks = None
+_marks_lock = threading.Lock()
+
+
+def configure_high_water_marks(config):
+    """Create the shared marks from app config (None when disabled)"""
+    global _marks
+    with _marks_lock:
+        _marks = HighWaterMarks.from_config(config) if config.get('HIGH_WATER_ENABLED', True) else None
+    return _marks
+
+
+def get_high_water_marks():
+    """Get the shared marks (None until configured or when disabled)"""
+    return _marks
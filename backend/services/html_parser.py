@@ -0,0 +1,179 @@
+# backend/services/html_parser.py
+import codecs
+import os
+import re
+import threading
+from functools import lru_cache
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Try to import the C parsers, fall back to Python's html.parser if missing
+try:
+    import lxml  # noqa: F401 - used by BeautifulSoup as the 'lxml' tree builder
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    print("⚠️ lxml not installed. Parsing with html.parser. Install with: pip install lxml")
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+BACKENDS = ('lxml', 'selectolax', 'html.parser')
+
+_BOMS = ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16'), (codecs.BOM_UTF16_BE, 'utf-16'))
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+_SIMPLE_SELECTOR = re.compile(r'^([\w-]+)?(?:#([\w-]+))?((?:\.[\w-]+)*)$')
+
+# Backend picked by configure_html_parser(); read from the environment too so
+# spawned parse-pool workers agree with the app process
+_backend = os.environ.get('HTML_PARSER', 'lxml')
+_partial = os.environ.get('HTML_PARTIAL_PARSING', 'true').lower() == 'true'
+_backend_lock = threading.Lock()
+
+
+def sniff_encoding(content):
+    """Find a page's encoding from its BOM or <meta charset> (None if absent)"""
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+    match = _META_CHARSET.search(content[:4096])
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode('ascii')).name
+        except (LookupError, UnicodeDecodeError):
+            return None
+    return None
+
+
+def content_type_charset(content_type):
+    """Pull the charset out of a Content-Type header (None if absent)"""
+    for part in (content_type or '').split(';')[1:]:
+        key, _, value = part.strip().partition('=')
+        if key.lower() == 'charset' and value:
+            return value.strip('"\'')
+    return None
+
+
+def decode_html(content, encoding=None):
+    """Decode page bytes to text without BeautifulSoup's charset detection.
+
+    Tries the given encoding (e.g. from Content-Type), then the BOM or
+    <meta charset>, then UTF-8; anything else is read as Windows-1252.
+    All of these are single C-level decodes, much cheaper than letting
+    BeautifulSoup guess from raw bytes.
+    """
+    if isinstance(content, str):
+        return content
+    for candidate in (encoding, sniff_encoding(content), 'utf-8'):
+        if not candidate:
+            continue
+        try:
+            return content.decode(candidate)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return content.decode('cp1252', errors='replace')
+
+
+def configure_html_parser(config):
+    """Pick the parser backend and partial parsing from app config"""
+    set_partial_parsing(config.get('HTML_PARTIAL_PARSING', True))
+    return set_backend(config.get('HTML_PARSER', 'lxml'))
+
+
+def set_partial_parsing(enabled):
+    """Turn region-only parsing on or off for this process"""
+    global _partial
+    _partial = bool(enabled)
+
+
+def set_backend(name):
+    """Switch the backend used by make_soup() for this process"""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser '{name}', expected one of {', '.join(BACKENDS)}")
+    with _backend_lock:
+        _backend = name
+    return tree_builder()
+
+
+def get_backend():
+    return _backend
+
+
+def get_partial_parsing():
+    return _partial
+
+
+def tree_builder():
+    """BeautifulSoup tree builder for the current backend.
+
+    selectolax has its own node API, so scrapers still walk BeautifulSoup
+    trees; with the selectolax backend lexbor only cuts out the scraper's
+    region (see make_soup) and the trees are built with lxml.
+    Falls back to html.parser when lxml is missing.
+    """
+    if _backend in ('lxml', 'selectolax') and LXML_AVAILABLE:
+        return 'lxml'
+    return 'html.parser'
+
+
+def make_soup(markup, encoding=None, region=None):
+    """Parse page bytes or text with the configured backend.
+
+    region is a CSS selector for the part of the page a scraper reads.
+    When given, only the matching elements (and their contents) are built
+    into the tree, skipping navigation, scripts and footers. If nothing
+    matches, the whole page is parsed so the scraper's fallbacks still run.
+    """
+    text = decode_html(markup, encoding)
+    if region and _partial:
+        soup = _parse_region(text, region)
+        if soup is not None:
+            return soup
+    return BeautifulSoup(text, tree_builder())
+
+
+def _parse_region(text, region):
+    """Build a tree of just the elements matching region (None if none do)"""
+    if _backend == 'selectolax' and SELECTOLAX_AVAILABLE:
+        # lexbor finds the region in C, BeautifulSoup only parses the slice
+        nodes = LexborHTMLParser(text).css(region)
+        if not nodes:
+            return None
+        return BeautifulSoup(''.join(node.html for node in nodes), tree_builder())
+
+    strainer = _strainer(region)
+    if strainer is None:
+        return None
+    soup = BeautifulSoup(text, tree_builder(), parse_only=strainer)
+    return soup if soup.find() is not None else None
+
+
+@lru_cache(maxsize=64)
+def _strainer(region):
+    """SoupStrainer for a tag#id.class selector (None if more complex).
+
+    Only the first class is matched, so the strainer may keep a few extra
+    elements; the scraper's own select() narrows them down.
+    """
+    match = _SIMPLE_SELECTOR.match(region.strip())
+    if not match:
+        return None
+    name, element_id, classes = match.groups()
+    attrs = {}
+    if element_id:
+        attrs['id'] = element_id
+    if classes:
+        attrs['class'] = _has_class(classes.split('.')[1])
+    return SoupStrainer(name or True, attrs=attrs)
+
+
+def _has_class(class_name):
+    def matches(value):
+        if not value:
+            return False
+        return class_name in (value.split() if isinstance(value, str) else value)
+    return matches
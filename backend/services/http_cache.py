@@ -0,0 +1,186 @@
+# backend/services/http_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from services.process_lock import file_lock, file_version
+
+
+class HttpCache:
+    """On-disk cache of GET responses revalidated with conditional requests.
+
+    Bodies are stored with their ETag / Last-Modified validators. The next
+    fetch of the same URL sends If-None-Match / If-Modified-Since, and a 304
+    is answered from disk. Total body size is bounded with least-recently-used eviction.
+
+    The directory may be shared by several worker processes: the index is
+    reloaded when another process has rewritten it, and stores merge into
+    the current index (and evict) under a cross-process file lock.
+    """
+
+    def __init__(self, cache_dir='cache/http', max_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_file = os.path.join(cache_dir, 'index.json')
+        self._lock = threading.RLock()
+        self.stats = {}
+        os.makedirs(cache_dir, exist_ok=True)
+        self._version = None
+        self._index = self._load_index()
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a cache from a Flask config mapping"""
+        return cls(
+                cache_dir=config.get('HTTP_CACHE_DIR', 'cache/http'),
+                max_bytes=config.get('HTTP_CACHE_MAX_BYTES', 50 * 1024 * 1024)
+                )
+
+    def _load_index(self):
+        """Load the url -> entry index, most recently used last"""
+        self._version = file_version(self.index_file)
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                return OrderedDict(sorted(entries.items(), key=lambda item: item[1]['last_used']))
+            except (OSError, ValueError, KeyError):
+                return OrderedDict()
+        return OrderedDict()
+
+    def _save_index(self):
+        # one temp file per process, so workers sharing the directory do not collide
+        tmp = f"{self.index_file}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self.index_file)
+        self._version = file_version(self.index_file)
+
+    def _reload(self):
+        """Take the index on disk, keeping this process's newer last-used
+        times for entries it shares with it (caller holds _lock)"""
+        index = self._load_index()
+        for url, entry in index.items():
+            ours = self._index.get(url)
+            if ours is not None and ours.get('stored_at') == entry.get('stored_at'):
+                entry['last_used'] = max(entry['last_used'], ours['last_used'])
+        self._index = OrderedDict(sorted(index.items(), key=lambda item: item[1]['last_used']))
+
+    def _refresh(self):
+        """Reload the index if another process saved it (caller holds _lock)"""
+        if file_version(self.index_file) != self._version:
+            self._reload()
+
+    def _body_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
+
+    def validators(self, url):
+        """Get conditional request headers for a cached url (empty if none)"""
+        with self._lock:
+            self._refresh()
+            entry = self._index.get(url)
+            if entry is None:
+                return {}
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            return headers
+
+    def load(self, url):
+        """Get (body, content_type) of a cached url, marking it recently used"""
+        with self._lock:
+            self._refresh()
+            entry = self._index.get(url)
+            if entry is None:
+                return None
+            try:
+                with open(self._body_path(url), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                self._index.pop(url, None)
+                return None
+            entry['last_used'] = time.time()
+            self._index.move_to_end(url)
+            return body, entry.get('content_type')
+
+    def store(self, url, headers, body):
+        """Cache a 200 response body if the server sent validators"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return False
+
+        # the body is written and the index merged, evicted and saved under
+        # one file lock, so no other worker evicts a body it does not list
+        with self._lock, file_lock(self.index_file):
+            self._reload()
+            path = self._body_path(url)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(body)
+            os.replace(tmp, path)
+            self._index[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'content_type': headers.get('Content-Type'),
+                    'size': len(body),
+                    'stored_at': time.time(),
+                    'last_used': time.time()
+                    }
+            self._index.move_to_end(url)
+            self._evict()
+            self._save_index()
+        return True
+
+    def _evict(self):
+        total = sum(entry['size'] for entry in self._index.values())
+        while total > self.max_bytes and len(self._index) > 1:
+            url, entry = self._index.popitem(last=False)
+            total -= entry['size']
+            try:
+                os.remove(self._body_path(url))
+            except OSError:
+                pass
+
+    def record(self, source, outcome):
+        """Count a 'hit' (304), 'miss' (full download) or 'uncacheable' fetch"""
+        with self._lock:
+            stats = self.stats.setdefault(source or 'unknown', {'hit': 0, 'miss': 0, 'uncacheable': 0})
+            stats[outcome] += 1
+
+    def get_stats(self):
+        """Get hit/miss counters per source and cache size"""
+        with self._lock:
+            sources = {}
+            for source, stats in self.stats.items():
+                fetches = stats['hit'] + stats['miss']
+                sources[source] = dict(stats, hit_rate=round(stats['hit'] / fetches, 3) if fetches else None)
+            return {
+                    'entries': len(self._index),
+                    'bytes': sum(entry['size'] for entry in self._index.values()),
+                    'max_bytes': self.max_bytes,
+                    'sources': sources
+                    }
+
+
+# Shared instance used by the sync and async HTTP clients
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def configure_http_cache(config):
+    """Create the shared cache from app config (None when disabled)"""
+    global _cache
+    with _cache_lock:
+        _cache = HttpCache.from_config(config) if config.get('HTTP_CACHE_ENABLED', True) else None
+    return _cache
+
+
+def get_http_cache():
+    """Get the shared cache (None until configured or when disabled)"""
+    return _cache
@@ -0,0 +1,205 @@
+# backend/services/http_client.py
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from services.rate_limiter import get_rate_limiter
+from services.http_cache import get_http_cache
+from services.content_fingerprint import fetch_parsed_result
+from services.html_parser import content_type_charset
+
+
+class HttpClient:
+    """Shared HTTP client - one keep-alive connection pool per host"""
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_sizes=None, timeout=30):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self._adapters = []
+        self._lock = threading.Lock()
+        self.host_stats = {}
+        self.source_stats = {}
+
+        # default adapter: pool_connections host pools, pool_maxsize sockets each
+        self._mount('http://', pool_connections, pool_maxsize)
+        self._mount('https://', pool_connections, pool_maxsize)
+
+        # bigger pools for hosts we hit in bursts (e.g. BDJobs detail pages)
+        for host, size in (pool_sizes or {}).items():
+            self._mount(f'https://{host}', 1, size)
+            self._mount(f'http://{host}', 1, size)
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a client from a Flask config mapping"""
+        return cls(
+                pool_connections=config.get('HTTP_POOL_CONNECTIONS', 10),
+                pool_maxsize=config.get('HTTP_POOL_MAXSIZE', 10),
+                pool_sizes=config.get('HTTP_POOL_SIZES', {}),
+                timeout=config.get('HTTP_TIMEOUT', 30)
+                )
+
+    def _mount(self, prefix, pool_connections, pool_maxsize):
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=False)
+        self.session.mount(prefix, adapter)
+        self._adapters.append(adapter)
+
+    def for_source(self, source, headers=None):
+        """Get a client bound to a scraper's name and default headers"""
+        return SourceClient(self, source, headers)
+
+    def request(self, method, url, source=None, **kwargs):
+        """Send a request through the shared session and record timings"""
+        kwargs.setdefault('timeout', self.timeout)
+
+        # plain GETs are revalidated against the on-disk response cache
+        http_cache = get_http_cache() if method == 'GET' and not kwargs.get('stream') else None
+        if http_cache is None:
+            return self._send(method, url, source, **kwargs)
+
+        conditional = http_cache.validators(url)
+        headers = dict(kwargs.pop('headers', None) or {})
+        response = self._send(method, url, source, headers=dict(headers, **conditional), **kwargs)
+        response.from_cache = False
+
+        if response.status_code == 304 and conditional:
+            cached = http_cache.load(url)
+            if cached is None:
+                # body went missing from disk - fetch it unconditionally
+                response = self._send(method, url, source, headers=headers, **kwargs)
+                response.from_cache = False
+            else:
+                body, content_type = cached
+                response.status_code = 200
+                response._content = body
+                if content_type:
+                    response.headers['Content-Type'] = content_type
+                response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+                response.from_cache = True
+                http_cache.record(source, 'hit')
+                return response
+
+        if response.status_code == 200:
+            stored = http_cache.store(url, response.headers, response.content)
+            http_cache.record(source, 'miss' if stored else 'uncacheable')
+
+        return response
+
+    def _send(self, method, url, source, **kwargs):
+        host = urlsplit(url).netloc
+        get_rate_limiter().acquire(url)
+        started = time.monotonic()
+        try:
+            return self.session.request(method, url, **kwargs)
+        finally:
+            self._record(host, source, time.monotonic() - started)
+
+    def _record(self, host, source, elapsed):
+        with self._lock:
+            for key, table in ((host, self.host_stats), (source, self.source_stats)):
+                if key is None:
+                    continue
+                entry = table.setdefault(key, {'requests': 0, 'total_seconds': 0.0})
+                entry['requests'] += 1
+                entry['total_seconds'] += elapsed
+
+    def get_stats(self):
+        """Get request counts and connection reuse per host"""
+        pools = {}
+        for adapter in self._adapters:
+            manager = adapter.poolmanager
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                entry = pools.setdefault(pool.host, {'connections_opened': 0, 'pooled_requests': 0})
+                entry['connections_opened'] += pool.num_connections
+                entry['pooled_requests'] += pool.num_requests
+
+        with self._lock:
+            hosts = {}
+            for host, entry in self.host_stats.items():
+                hostname = host.split(':')[0]
+                pool = pools.get(hostname, {'connections_opened': 0, 'pooled_requests': 0})
+                hosts[host] = {
+                        'requests': entry['requests'],
+                        'avg_seconds': round(entry['total_seconds'] / entry['requests'], 3),
+                        'connections_opened': pool['connections_opened'],
+                        'connections_reused': max(0, pool['pooled_requests'] - pool['connections_opened'])
+                        }
+            sources = {
+                    source: {
+                        'requests': entry['requests'],
+                        'avg_seconds': round(entry['total_seconds'] / entry['requests'], 3)
+                        }
+                    for source, entry in self.source_stats.items()
+                    }
+
+        return {'hosts': hosts, 'sources': sources}
+
+
+class SourceClient:
+    """Per-scraper view of the shared client with its default headers"""
+
+    def __init__(self, client, source, headers=None):
+        self.client = client
+        self.source = source
+        self.headers = dict(headers or {})
+
+    def request(self, method, url, headers=None, **kwargs):
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        return self.client.request(method, url, source=self.source, headers=merged, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def scan(self, url, scanner, chunk_size=16 * 1024, **kwargs):
+        """Stream url through scanner until it finds its field (see
+        FieldScanner), then close the connection instead of reading on"""
+        response = self.get(url, stream=True, **kwargs)
+        try:
+            response.raise_for_status()
+            scanner.encoding = content_type_charset(response.headers.get('Content-Type')) or scanner.encoding
+            for chunk in response.iter_content(chunk_size):
+                if scanner.feed(chunk) is not None:
+                    break
+            else:
+                scanner.finish()
+            return scanner.result
+        finally:
+            response.close()
+
+    def fetch_parsed(self, url, parse, **kwargs):
+        """GET url and return parse(response), reusing the last parsed
+        result when the page content has not changed"""
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return fetch_parsed_result(self.source, url, response, parse)
+
+
+# Shared instance - the single injection point used by all scrapers
+_client = None
+_client_lock = threading.Lock()
+
+
+def configure_http_client(config):
+    """Create the shared client from app config (called once at startup)"""
+    global _client
+    with _client_lock:
+        _client = HttpClient.from_config(config)
+    return _client
+
+
+def get_http_client():
+    """Get the shared client, creating it with defaults if needed"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
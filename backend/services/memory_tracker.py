@@ -1,17 +1,36 @@
 import json
 import os
+import threading
 from datetime import datetime, date
 
+from services.process_lock import file_lock, file_version, write_json_atomic
+
 
 class MemoryTracker:
-    """Track seen links to identify new postings"""
+    """Track seen links to identify new postings
+
+    The memory file may be shared by several worker processes: changes
+    re-read it under a cross-process file lock before writing it back, and
+    reads pick up other workers' changes when the file is rewritten.
+    """
 
     def __init__(self, memory_file='seen_links.json'):
         self.memory_file = memory_file
-        self.seen_links = self._load_memory()
+        self._lock = threading.RLock()
+        self._version = None
+        self._seen = self._load_memory()
+
+    @property
+    def seen_links(self):
+        """Seen links, re-read if another process changed the file"""
+        with self._lock:
+            if file_version(self.memory_file) != self._version:
+                self._seen = self._load_memory()
+            return self._seen
 
     def _load_memory(self):
         """Load seen links from file"""
+        self._version = file_version(self.memory_file)
         if os.path.exists(self.memory_file):
             try:
                 with open(self.memory_file, 'r', encoding='utf-8') as f:
@@ -22,8 +41,8 @@ class MemoryTracker:
 
     def _save_memory(self):
         """Save seen links to file"""
-        with open(self.memory_file, 'w', encoding='utf-8') as f:
-            json.dump(self.seen_links, f, indent=2)
+        write_json_atomic(self.memory_file, self._seen, indent=2)
+        self._version = file_version(self.memory_file)
 
     def is_new(self, notice):
         """Check if a notice is new (not seen before)"""
@@ -35,11 +54,17 @@ class MemoryTracker:
 
     def add_to_memory(self, notices):
         """Add notices to memory"""
+        with self._lock, file_lock(self.memory_file):
+            self._seen = self._load_memory()
+            return self._add(notices)
+
+    def _add(self, notices):
+        """Add notices to the loaded memory (caller holds both locks)"""
         new_count = 0
         for notice in notices:
             link = notice.get('link') or notice.get('detail_url') or notice.get('url')
-            if link and link not in self.seen_links:
-                self.seen_links[link] = {
+            if link and link not in self._seen:
+                self._seen[link] = {
                         'first_seen': datetime.now().isoformat(),
                         'title': notice.get('title', ''),
                         'source': notice.get('source', '')
@@ -53,13 +78,16 @@ class MemoryTracker:
 
     def get_new_notices(self, notices):
         """Filter notices to only new ones"""
-        new_notices = []
-        for notice in notices:
-            if self.is_new(notice):
-                new_notices.append(notice)
+        # filter and record in one step, so two workers never both report a notice as new
+        with self._lock, file_lock(self.memory_file):
+            self._seen = self._load_memory()
+            new_notices = []
+            for notice in notices:
+                if self.is_new(notice):
+                    new_notices.append(notice)
 
-        # Auto-add to memory
-        self.add_to_memory(new_notices)
+            # Auto-add to memory
+            self._add(new_notices)
 
         return new_notices
 
@@ -82,5 +110,6 @@ class MemoryTracker:
 
     def clear_memory(self):
         """Clear all memory (for testing)"""
-        self.seen_links = {}
-        self._save_memory()
+        with self._lock, file_lock(self.memory_file):
+            self._seen = {}
+            self._save_memory()
@@ -0,0 +1,224 @@
+# backend/services/parse_pool.py
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from services.html_parser import get_backend, get_partial_parsing, set_backend, set_partial_parsing
+
+# Plain attribute types copied onto the worker-side scraper instance
+_STATE_TYPES = (str, bytes, int, float, bool, type(None), tuple, list, dict)
+
+# Modules the forkserver imports once, so the workers it forks start warm
+_PRELOAD = ['bs4', 'scrapers']
+
+
+def _warm_worker(backend, partial):
+    """Import bs4 and every scraper module once per worker process, and
+    use the parent's parser settings (spawned workers do not inherit them)"""
+    import bs4  # noqa: F401
+    import scrapers  # noqa: F401 - registers and imports all scrapers
+    set_backend(backend)
+    set_partial_parsing(partial)
+
+
+def _noop():
+    return os.getpid()
+
+
+def _call_parser(scraper_class, state, method, content, args):
+    """Run scraper_class.method(content, *args) on a bare instance.
+
+    __init__ is skipped so the worker never builds HTTP clients; only the
+    scraper's plain attributes (urls, headers, ...) are restored.
+    """
+    scraper = scraper_class.__new__(scraper_class)
+    scraper.__dict__.update(state)
+    return getattr(scraper, method)(content, *args)
+
+
+class ParsePool:
+    """Warm process pool for HTML parsing.
+
+    Parsing with BeautifulSoup is pure-Python CPU work that holds the GIL,
+    so parsing several sources at once in threads runs serially. Large
+    pages are shipped as raw bytes to worker processes and come back as
+    plain notice dicts; pages under min_bytes are parsed in-process, where
+    the pickling round-trip would cost more than it saves.
+
+    Workers are started with forkserver (spawn where unavailable), never
+    by forking the app, whose event loop, scheduler and lease threads a
+    forked child would inherit mid-operation. The pool starts on first
+    use, in the process that parses (so after gunicorn forks its workers),
+    on a background thread; pages are parsed in-process until it is warm,
+    and again while it is rebuilt after a worker crash.
+    """
+
+    def __init__(self, max_workers=2, min_bytes=64 * 1024):
+        self.max_workers = max_workers
+        self.min_bytes = min_bytes
+        self._executor = None
+        self._pid = None
+        self._starting = None   # pid of the process starting the pool in the background
+        self._closed = False
+        self._lock = threading.Lock()
+        self.stats = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a pool from a Flask config mapping"""
+        return cls(
+                max_workers=config.get('PARSE_POOL_WORKERS') or max(1, (os.cpu_count() or 2) - 1),
+                min_bytes=config.get('PARSE_POOL_MIN_BYTES', 64 * 1024)
+                )
+
+    def start(self, method=None):
+        """Start every worker and return once they are warm.
+
+        Blocks the caller - parse() starts the pool in the background by
+        itself; call this directly only where waiting is wanted (benchmarks).
+        """
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context(method or ('forkserver' if 'forkserver' in methods else 'spawn'))
+        if context.get_start_method() == 'forkserver':
+            context.set_forkserver_preload(_PRELOAD)
+        executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=context, initializer=_warm_worker,
+                initargs=(get_backend(), get_partial_parsing()))
+        warmups = [executor.submit(_noop) for _ in range(self.max_workers)]
+        pids = {future.result() for future in warmups}
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._executor, self._pid = executor, os.getpid()
+        if closed:
+            executor.shutdown(wait=False, cancel_futures=True)
+            return self
+        print(f"🧵 Parse pool ready with {len(pids)} worker process(es) ({context.get_start_method()})")
+        return self
+
+    def _ready_executor(self):
+        """The running executor, or None after starting one in the background"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # not started yet, or started by a parent process before it forked
+                self._executor = None
+            if self._executor is not None or self._closed:
+                return self._executor
+            if self._starting != os.getpid():
+                self._starting = os.getpid()
+                threading.Thread(target=self._start_in_background, name='parse-pool-start',
+                                 daemon=True).start()
+            return None
+
+    def _start_in_background(self):
+        try:
+            self.start()
+        except Exception as e:
+            print(f"⚠️ Parse pool failed to start, parsing in-process: {e}")
+            with self._lock:
+                self._closed = True
+        finally:
+            with self._lock:
+                self._starting = None
+
+    def parse(self, scraper, method, content, *args):
+        """Run scraper.method(content, *args), in a worker for large pages"""
+        name = f"{type(scraper).__name__}.{method}"
+        started = time.monotonic()
+
+        executor = self._ready_executor() if len(content) >= self.min_bytes else None
+        if executor is None:
+            result = getattr(scraper, method)(content, *args)
+            self._record(name, 'inline', time.monotonic() - started)
+            return result
+
+        state = {key: value for key, value in vars(scraper).items() if isinstance(value, _STATE_TYPES)}
+        try:
+            result = executor.submit(_call_parser, type(scraper), state, method, content, args).result()
+        except BrokenProcessPool:
+            print("⚠️ Parse pool broke, restarting and parsing in-process")
+            self._restart(executor)
+            result = getattr(scraper, method)(content, *args)
+            self._record(name, 'inline', time.monotonic() - started)
+            return result
+
+        self._record(name, 'pool', time.monotonic() - started)
+        return result
+
+    def _restart(self, broken):
+        """Drop a broken executor; the next large page starts a new one"""
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _record(self, name, where, elapsed):
+        with self._lock:
+            entry = self.stats.setdefault(name, {'pool': 0, 'inline': 0, 'pool_seconds': 0.0, 'inline_seconds': 0.0})
+            entry[where] += 1
+            entry[f'{where}_seconds'] += elapsed
+
+    def get_stats(self):
+        """Get pool size and per-parser counts and average parse times"""
+        with self._lock:
+            parsers = {}
+            for name, entry in self.stats.items():
+                parsers[name] = {
+                        'pool': entry['pool'],
+                        'inline': entry['inline'],
+                        'pool_avg_seconds': round(entry['pool_seconds'] / entry['pool'], 4) if entry['pool'] else None,
+                        'inline_avg_seconds': round(entry['inline_seconds'] / entry['inline'], 4) if entry['inline'] else None
+                        }
+            return {
+                    'running': self._executor is not None and self._pid == os.getpid(),
+                    'starting': self._starting == os.getpid(),
+                    'workers': self.max_workers,
+                    'min_bytes': self.min_bytes,
+                    'parsers': parsers
+                    }
+
+    def shutdown(self):
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        # a parent's workers are not this process's to stop
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown(wait=True)
+
+
+# Shared instance used by every scraper
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def configure_parse_pool(config):
+    """Create the shared pool from app config (None when disabled); its
+    workers start on the first large page, see ParsePool"""
+    global _pool
+    with _pool_lock:
+        _pool = ParsePool.from_config(config) if config.get('PARSE_POOL_ENABLED', True) else None
+    return _pool
+
+
+def get_parse_pool():
+    """Get the shared pool (None until configured or when disabled)"""
+    return _pool
+
+
+def parse_with(scraper, method, *args):
+    """fetch_parsed() callback for scraper.method(response.content, *args).
+
+    Uses the shared pool when one is running, otherwise parses in-process.
+    """
+    def parse(response):
+        pool = get_parse_pool()
+        if pool is None:
+            return getattr(scraper, method)(response.content, *args)
+        return pool.parse(scraper, method, response.content, *args)
+    # what the fingerprint memo keys a parsed result by, with the url
+    parse.memo_key = (type(scraper).__qualname__, method, repr(args))
+    return parse
@@ -0,0 +1,204 @@
+# backend/services/process_lock.py
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # not available on windows - file locks become no-ops
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive lock on path + '.lock', across processes and threads.
+
+    Used around read-modify-write of JSON files that several worker
+    processes share. Without fcntl (windows) only one process is supported.
+    """
+    if fcntl is None:
+        yield
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path + '.lock', 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def file_version(path):
+    """(mtime, size) of a file, None if missing - changes when another process rewrites it"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_json_atomic(path, data, **kwargs):
+    """Write data as JSON so readers in other processes never see a partial file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # one temp file per process, so two workers saving at once do not collide
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **kwargs)
+    os.replace(tmp, path)
+
+
+class SourceLocks:
+    """Leases kept in a SQLite table so one process at a time scrapes a source.
+
+    A lease names its owner (host, pid and a token per hold) and expires
+    ttl seconds after it was last renewed; hold() renews it in the
+    background while the scrape runs, so a worker that dies mid-scrape only
+    blocks the source until its lease runs out. Waiters poll every poll
+    seconds and give up after wait seconds.
+    """
+
+    def __init__(self, path='cache/locks.db', ttl=120, poll=0.25, wait=600):
+        self.path = path
+        self.ttl = ttl
+        self.poll = poll
+        self.wait = wait
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self.stats = {'acquired': 0, 'contended': 0, 'wait_seconds': 0.0, 'expired_taken': 0, 'timeouts': 0}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build the locks from a Flask config mapping"""
+        return cls(
+                path=config.get('SCRAPE_LOCK_FILE', os.path.join('cache', 'locks.db')),
+                ttl=config.get('SCRAPE_LOCK_TTL', 120),
+                poll=config.get('SCRAPE_LOCK_POLL', 0.25),
+                wait=config.get('SCRAPE_LOCK_WAIT', 600)
+                )
+
+    def _connect(self):
+        # a connection must not be used across fork (gunicorn --preload)
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, owner TEXT, "
+                         "acquired_at REAL, expires_at REAL)")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def try_acquire(self, name, owner):
+        """Take the lease on name if it is free, expired or already ours"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = conn.execute("SELECT owner, expires_at FROM leases WHERE name = ?", (name,)).fetchone()
+                free = row is None or row[1] <= now or row[0] == owner
+                if free:
+                    conn.execute("INSERT OR REPLACE INTO leases (name, owner, acquired_at, expires_at) "
+                                 "VALUES (?, ?, ?, ?)", (name, owner, now, now + self.ttl))
+                    if row is not None and row[0] != owner:
+                        print(f"🔓 lease on {name} held by {row[0]} expired - taking it over")
+                        self.stats['expired_taken'] += 1
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return free
+
+    def renew(self, name, owner):
+        """Push a held lease's expiry back; False if it is no longer ours"""
+        with self._lock:
+            cursor = self._connect().execute("UPDATE leases SET expires_at = ? WHERE name = ? AND owner = ?",
+                                             (time.time() + self.ttl, name, owner))
+            return cursor.rowcount == 1
+
+    def release(self, name, owner):
+        with self._lock:
+            self._connect().execute("DELETE FROM leases WHERE name = ? AND owner = ?", (name, owner))
+
+    @contextmanager
+    def hold(self, name):
+        """Hold the lease on name for the duration of the block.
+
+        Yields True once the lease is ours, or False if it could not be
+        taken within the wait limit (the caller decides what to do then).
+        """
+        owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        started = time.monotonic()
+        acquired = self.try_acquire(name, owner)
+        if not acquired:
+            print(f"⏳ waiting for another worker to finish scraping {name}")
+            with self._lock:
+                self.stats['contended'] += 1
+            while not acquired and time.monotonic() - started < self.wait:
+                time.sleep(self.poll)
+                acquired = self.try_acquire(name, owner)
+        with self._lock:
+            self.stats['wait_seconds'] += time.monotonic() - started
+            self.stats['acquired' if acquired else 'timeouts'] += 1
+        if not acquired:
+            yield False
+            return
+
+        stop = threading.Event()
+
+        def keep_alive():
+            while not stop.wait(self.ttl / 3):
+                if not self.renew(name, owner):
+                    print(f"⚠️ lost the lease on {name}")
+                    return
+
+        renewer = threading.Thread(target=keep_alive, name=f'lease-{name}', daemon=True)
+        renewer.start()
+        try:
+            yield True
+        finally:
+            stop.set()
+            renewer.join()
+            self.release(name, owner)
+
+    def holders(self):
+        """Get {name: owner} for every unexpired lease"""
+        with self._lock:
+            rows = self._connect().execute("SELECT name, owner FROM leases WHERE expires_at > ?", (time.time(),))
+            return dict(rows.fetchall())
+
+    def get_stats(self):
+        """Get lease counters and the current holders"""
+        holders = self.holders()
+        with self._lock:
+            return dict(self.stats, wait_seconds=round(self.stats['wait_seconds'], 3), held=holders,
+                        pid=os.getpid())
+
+
+# Shared instance used by the app's scrape path
+_locks = None
+_locks_lock = threading.Lock()
+
+
+def configure_source_locks(config):
+    """Create the shared source locks from app config (None when disabled)"""
+    global _locks
+    with _locks_lock:
+        _locks = SourceLocks.from_config(config) if config.get('SCRAPE_LOCK_ENABLED', True) else None
+    return _locks
+
+
+def get_source_locks():
+    """Get the shared source locks (None until configured or when disabled)"""
+    return _locks
@@ -0,0 +1,131 @@
+# backend/services/rate_limiter.py
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token bucket refilled at rate tokens/second, holding at most burst"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token and return how long the caller must wait for it.
+
+        Tokens may go negative: each caller reserves its own slot, so
+        concurrent threads and asyncio tasks queue up fairly instead of
+        racing for the same refill.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter:
+    """Per-host politeness limits shared by every scraper's fetches"""
+
+    def __init__(self, default_rate=2.0, default_burst=4, limits=None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.limits = dict(limits or {})
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self.stats = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a limiter from a Flask config mapping"""
+        rate, burst = config.get('RATE_LIMIT_DEFAULT', (2.0, 4))
+        return cls(default_rate=rate, default_burst=burst,
+                   limits=config.get('RATE_LIMITS', {}))
+
+    def _limit_for(self, host):
+        """Find the configured (rate, burst) for a host or its parent domain"""
+        parts = host.split('.')
+        for i in range(len(parts)):
+            domain = '.'.join(parts[i:])
+            if domain in self.limits:
+                return self.limits[domain]
+        return self.default_rate, self.default_burst
+
+    def _bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._limit_for(host)
+                bucket = self._buckets[host] = TokenBucket(rate, burst)
+                self.stats[host] = {'requests': 0, 'waited': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+            return bucket
+
+    def _reserve(self, url):
+        host = urlsplit(url).hostname or url
+        delay = self._bucket(host).reserve()
+        with self._lock:
+            stats = self.stats[host]
+            stats['requests'] += 1
+            if delay > 0:
+                stats['waited'] += 1
+                stats['total_wait'] += delay
+                stats['max_wait'] = max(stats['max_wait'], delay)
+        return delay
+
+    def acquire(self, url):
+        """Block the calling thread until a request to url's host is allowed"""
+        delay = self._reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, url):
+        """Wait on the event loop until a request to url's host is allowed"""
+        delay = self._reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def get_stats(self):
+        """Get request and wait-time counters per host"""
+        with self._lock:
+            return {
+                    host: {
+                        'rate': self._buckets[host].rate,
+                        'burst': self._buckets[host].burst,
+                        'requests': stats['requests'],
+                        'waited': stats['waited'],
+                        'total_wait': round(stats['total_wait'], 3),
+                        'avg_wait': round(stats['total_wait'] / stats['requests'], 3),
+                        'max_wait': round(stats['max_wait'], 3)
+                        }
+                    for host, stats in self.stats.items()
+                    }
+
+
+# Shared instance used by the sync and async HTTP clients
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def configure_rate_limiter(config):
+    """Create the shared limiter from app config"""
+    global _limiter
+    with _limiter_lock:
+        _limiter = RateLimiter.from_config(config)
+    return _limiter
+
+
+def get_rate_limiter():
+    """Get the shared limiter, creating it with defaults if needed"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
@@ -0,0 +1,160 @@
+# backend/services/refresh_scheduler.py
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+
+class RefreshScheduler:
+    """Refresh every source in the background on its own interval.
+
+    Sources are warmed shortly after start, then re-scraped every
+    interval seconds (+/- jitter, so they do not all fire together).
+    trigger() asks for an early refresh, e.g. when a reader sees stale data.
+    With a TTLPolicy, intervals are the policy's TTLs and a failing source
+    is retried after its backoff instead.
+    """
+
+    def __init__(self, refresh_fn, sources, default_interval=300, intervals=None,
+                 jitter=0.1, startup_spread=5, max_workers=4, policy=None):
+        self.refresh_fn = refresh_fn
+        self.policy = policy
+        self.sources = list(sources)
+        self.default_interval = default_interval
+        self.intervals = dict(intervals or {})
+        self.jitter = jitter
+        self.startup_spread = startup_spread
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='refresh')
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._queue = []      # heap of (due_at, source)
+        self._running = set()
+        self.status = {source: {
+            'runs': 0,
+            'failures': 0,
+            'last_run': None,
+            'last_duration': None,
+            'next_run': None
+            } for source in self.sources}
+
+    @classmethod
+    def from_config(cls, config, refresh_fn, sources, policy=None):
+        """Build a scheduler from a Flask config mapping"""
+        return cls(
+                refresh_fn,
+                sources,
+                default_interval=config.get('REFRESH_DEFAULT_INTERVAL', 300),
+                intervals=config.get('REFRESH_INTERVALS', {}),
+                jitter=config.get('REFRESH_JITTER', 0.1),
+                startup_spread=config.get('REFRESH_STARTUP_SPREAD', 5),
+                max_workers=config.get('REFRESH_MAX_WORKERS', 4),
+                policy=policy
+                )
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def interval_for(self, source):
+        """Get the refresh interval in seconds for a source"""
+        if self.policy is not None:
+            return self.policy.ttl_for(source)
+        return self.intervals.get(source, self.default_interval)
+
+    def _jittered(self, interval):
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _schedule(self, source, delay):
+        due_at = time.time() + delay
+        with self._lock:
+            # keep a single pending run per source
+            self._queue = [(t, s) for t, s in self._queue if s != source]
+            heapq.heapify(self._queue)
+            heapq.heappush(self._queue, (due_at, source))
+            self.status[source]['next_run'] = datetime.fromtimestamp(due_at).isoformat()
+        self._wakeup.set()
+
+    def start(self, ages=None):
+        """Warm every source and start the scheduling thread.
+
+        ages maps a source to the age in seconds of data already cached for
+        it (e.g. kept across a restart); such a source is first refreshed
+        when that data goes stale instead of during the warm-up.
+        """
+        if self.running:
+            return
+        ages = ages or {}
+        for source in self.sources:
+            delay = random.uniform(0, self.startup_spread)
+            if ages.get(source) is not None:
+                delay = max(delay, self.interval_for(source) - ages[source])
+            self._schedule(source, delay)
+        self._thread = threading.Thread(target=self._loop, name='refresh-scheduler', daemon=True)
+        self._thread.start()
+        print(f"⏰ background refresh started for {len(self.sources)} sources")
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def trigger(self, source):
+        """Refresh a source now unless it is already refreshing"""
+        with self._lock:
+            if source in self._running or source not in self.status:
+                return False
+        self._schedule(source, 0)
+        return True
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            with self._lock:
+                now = time.time()
+                due = []
+                while self._queue and self._queue[0][0] <= now:
+                    _, source = heapq.heappop(self._queue)
+                    if source not in self._running:
+                        self._running.add(source)
+                        due.append(source)
+                wait_for = self._queue[0][0] - now if self._queue else None
+
+            for source in due:
+                self._executor.submit(self._refresh, source)
+
+            self._wakeup.wait(timeout=wait_for)
+
+    def _refresh(self, source):
+        started = time.monotonic()
+        try:
+            self.refresh_fn(source)
+            failed = False
+        except Exception as e:
+            print(f"❌ background refresh of {source} failed: {e}")
+            failed = True
+
+        with self._lock:
+            status = self.status[source]
+            status['runs'] += 1
+            status['failures'] += int(failed)
+            status['last_run'] = datetime.now().isoformat()
+            status['last_duration'] = round(time.monotonic() - started, 3)
+            self._running.discard(source)
+
+        delay = self.policy.next_refresh_in(source) if self.policy is not None else self.interval_for(source)
+        self._schedule(source, self._jittered(delay))
+
+    def get_stats(self):
+        """Get per-source refresh status"""
+        with self._lock:
+            return {
+                    'running': self.running,
+                    'refreshing': sorted(self._running),
+                    'sources': {source: dict(status, interval=self.interval_for(source))
+                                for source, status in self.status.items()}
+                    }
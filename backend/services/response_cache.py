@@ -0,0 +1,155 @@
+# backend/services/response_cache.py
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from flask import Response, request
+
+# Try to import the fast encoder and brotli, fall back to json and gzip only
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# An encoded response: tag is the body hash the ETags are made from,
+# encoded maps a content-coding ('gzip', 'br') to the compressed body
+Body = namedtuple('Body', 'tag identity encoded')
+
+# preferred order when the client accepts several codings equally
+CODINGS = ('br', 'gzip')
+
+
+def dumps(payload):
+    """Encode payload as JSON bytes - with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=str, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class ResponseCache:
+    """JSON response bodies encoded once per version of the data behind them.
+
+    A read endpoint names its body with a key and a version (e.g. a source
+    and the timestamp of its last scrape). The first request for a version
+    encodes the payload, hashes it into a strong ETag and compresses it
+    with gzip (and brotli when installed). Later requests for that version
+    get the stored bytes in the best coding the client accepts, or an
+    empty 304 when their If-None-Match already names it. Only the latest
+    version of each key is kept.
+    """
+
+    def __init__(self, max_entries=64, min_compress_size=1024, gzip_level=6, brotli_quality=5):
+        self.max_entries = max_entries
+        self.min_compress_size = min_compress_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (version, Body), least recently used first
+        self.stats = {'hits': 0, 'builds': 0, 'not_modified': 0, 'build_seconds': 0.0,
+                      'bytes_sent': 0, 'bytes_uncompressed': 0, 'codings': {}}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a cache from a Flask config mapping"""
+        return cls(
+                max_entries=config.get('RESPONSE_CACHE_MAX_ENTRIES', 64),
+                min_compress_size=config.get('RESPONSE_COMPRESS_MIN_SIZE', 1024),
+                gzip_level=config.get('RESPONSE_GZIP_LEVEL', 6),
+                brotli_quality=config.get('RESPONSE_BROTLI_QUALITY', 5)
+                )
+
+    def _encode(self, payload):
+        identity = dumps(payload)
+        encoded = {}
+        if len(identity) >= self.min_compress_size:
+            # mtime=0 keeps the gzip bytes identical for identical bodies
+            encoded['gzip'] = gzip.compress(identity, compresslevel=self.gzip_level, mtime=0)
+            if BROTLI_AVAILABLE:
+                encoded['br'] = brotli.compress(identity, quality=self.brotli_quality)
+        tag = hashlib.blake2b(identity, digest_size=16).hexdigest()
+        return Body(tag, identity, encoded)
+
+    def get(self, key, version, build):
+        """Get the Body for key at version, encoding build() if it is not stored"""
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None and stored[0] == version:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return stored[1]
+
+        # encoded outside the lock; two requests racing on a new version both build it
+        started = time.perf_counter()
+        body = self._encode(build())
+        with self._lock:
+            self.stats['builds'] += 1
+            self.stats['build_seconds'] += time.perf_counter() - started
+            self._entries[key] = (version, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return body
+
+    def respond(self, key, version, build, max_age=0):
+        """Response for the current request: 304 if the client has this
+        version, else the stored body in the best accepted coding.
+
+        max_age 0 makes clients revalidate on every use (Cache-Control:
+        no-cache); above that they may reuse the body for max_age seconds.
+        """
+        body = self.get(key, version, build)
+        coding = self._pick_coding(body)
+        headers = {
+                'ETag': f'"{body.tag}-{coding}"' if coding else f'"{body.tag}"',
+                'Cache-Control': f'public, max-age={max_age}' if max_age else 'no-cache',
+                'Vary': 'Accept-Encoding'
+                }
+
+        # every coding of this version is the same data, so any of its tags matches
+        tags = [body.tag] + [f'{body.tag}-{name}' for name in body.encoded]
+        if any(request.if_none_match.contains_weak(tag) for tag in tags):
+            with self._lock:
+                self.stats['not_modified'] += 1
+            return Response(status=304, headers=headers)
+
+        content = body.encoded[coding] if coding else body.identity
+        if coding:
+            headers['Content-Encoding'] = coding
+        with self._lock:
+            self.stats['bytes_sent'] += len(content)
+            self.stats['bytes_uncompressed'] += len(body.identity)
+            codings = self.stats['codings']
+            codings[coding or 'identity'] = codings.get(coding or 'identity', 0) + 1
+        return Response(content, mimetype='application/json', headers=headers)
+
+    def _pick_coding(self, body):
+        """Best stored coding the client accepts, None for the plain body"""
+        accepted = request.accept_encodings
+        best, best_quality = None, 0
+        for name in CODINGS:
+            quality = accepted[name]
+            if name in body.encoded and quality > best_quality:
+                best, best_quality = name, quality
+        return best
+
+    def get_stats(self):
+        """Get hit, build and 304 counters and bytes saved by compression"""
+        with self._lock:
+            requests = self.stats['hits'] + self.stats['builds']
+            return dict(self.stats,
+                        codings=dict(self.stats['codings']),
+                        build_seconds=round(self.stats['build_seconds'], 3),
+                        hit_rate=round(self.stats['hits'] / requests, 3) if requests else None,
+                        entries=len(self._entries),
+                        encoder='orjson' if ORJSON_AVAILABLE else 'json',
+                        brotli=BROTLI_AVAILABLE)
@@ -0,0 +1,167 @@
+# backend/services/scrape_cache.py
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+
+class ScrapeCache:
+    """Thread-safe store of the last scraped notices per source"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries = {}
+
+    def get(self, source):
+        """Get {'data', 'timestamp'} for a source (empty entry if never scraped)"""
+        with self._lock:
+            entry = self._entries.get(source)
+            if entry is None:
+                return {'data': [], 'timestamp': None}
+            return dict(entry)
+
+    def set(self, source, data, timestamp=None):
+        """Replace a source's notices and stamp them"""
+        entry = {'data': data, 'timestamp': timestamp or datetime.now().isoformat()}
+        with self._lock:
+            self._entries[source] = entry
+        return dict(entry)
+
+    def sources(self):
+        """Get the sources that have an entry"""
+        with self._lock:
+            return list(self._entries)
+
+    def timestamps(self):
+        """Get {source: timestamp} for every source with an entry"""
+        with self._lock:
+            return {source: entry['timestamp'] for source, entry in self._entries.items()}
+
+    def snapshot(self):
+        """Get a consistent copy of every entry"""
+        with self._lock:
+            return {source: dict(entry) for source, entry in self._entries.items()}
+
+    def __contains__(self, source):
+        with self._lock:
+            return source in self._entries
+
+
+class SqliteScrapeCache(ScrapeCache):
+    """ScrapeCache kept in a SQLite database so it survives restarts.
+
+    The database is opened on first use and each source's notices are read
+    into memory the first time that source is asked for, so startup does
+    not pay for sources nobody reads yet. Every set() replaces a source's
+    notices and timestamp in one transaction. The database runs in WAL
+    mode, so readers are never blocked by a write in progress.
+
+    Several worker processes can share the file: each read compares the
+    source's stored timestamp with the copy in memory and reloads the
+    notices when another process has written newer ones.
+    """
+
+    def __init__(self, path='cache/scrape_cache.db'):
+        super().__init__()
+        self.path = path
+        self._conn = None
+        self._pid = None
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a cache from a Flask config mapping"""
+        return cls(path=config.get('SCRAPE_CACHE_FILE', os.path.join('cache', 'scrape_cache.db')))
+
+    def _connect(self):
+        # a connection must not be used across fork (gunicorn --preload)
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # autocommit mode; writes open their own transaction
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS sources (source TEXT PRIMARY KEY, timestamp TEXT, count INTEGER)")
+            conn.execute("CREATE TABLE IF NOT EXISTS notices (source TEXT, position INTEGER, body TEXT, "
+                         "PRIMARY KEY (source, position))")
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def _load(self, source):
+        """Read a source's notices into memory unless the copy there is current"""
+        conn = self._connect()
+        row = conn.execute("SELECT timestamp FROM sources WHERE source = ?", (source,)).fetchone()
+        if row is None:
+            return
+        entry = self._entries.get(source)
+        if entry is None or entry['timestamp'] != row[0]:
+            # read in one transaction so a concurrent set() cannot mix two scrapes
+            conn.execute("BEGIN")
+            try:
+                timestamp, = conn.execute("SELECT timestamp FROM sources WHERE source = ?", (source,)).fetchone()
+                bodies = conn.execute("SELECT body FROM notices WHERE source = ? ORDER BY position", (source,))
+                self._entries[source] = {'data': [json.loads(body) for body, in bodies], 'timestamp': timestamp}
+            finally:
+                conn.execute("COMMIT")
+
+    def get(self, source):
+        with self._lock:
+            self._load(source)
+            return super().get(source)
+
+    def set(self, source, data, timestamp=None):
+        entry = {'data': data, 'timestamp': timestamp or datetime.now().isoformat()}
+        rows = [(source, position, json.dumps(notice, default=str)) for position, notice in enumerate(data)]
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM notices WHERE source = ?", (source,))
+                conn.executemany("INSERT INTO notices (source, position, body) VALUES (?, ?, ?)", rows)
+                conn.execute("INSERT OR REPLACE INTO sources (source, timestamp, count) VALUES (?, ?, ?)",
+                             (source, entry['timestamp'], len(data)))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._entries[source] = entry
+        return dict(entry)
+
+    def sources(self):
+        with self._lock:
+            stored = [source for source, in self._connect().execute("SELECT source FROM sources")]
+            return list(dict.fromkeys(stored + list(self._entries)))
+
+    def timestamps(self):
+        """Get {source: timestamp} without reading any notices"""
+        with self._lock:
+            stamps = super().timestamps()
+            stamps.update(self._connect().execute("SELECT source, timestamp FROM sources").fetchall())
+            return stamps
+
+    def snapshot(self):
+        with self._lock:
+            for source in self.sources():
+                self._load(source)
+            return super().snapshot()
+
+    def __contains__(self, source):
+        with self._lock:
+            self._load(source)
+            return super().__contains__(source)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def configure_scrape_cache(config):
+    """Create the app's scrape cache: SQLite-backed unless
+    SCRAPE_CACHE_BACKEND is 'memory'"""
+    if config.get('SCRAPE_CACHE_BACKEND', 'sqlite') == 'memory':
+        return ScrapeCache()
+    return SqliteScrapeCache.from_config(config)
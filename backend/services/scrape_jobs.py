@@ -0,0 +1,161 @@
+# backend/services/scrape_jobs.py
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+
+class ScrapeJobManager:
+    """Run scrapes as background jobs that clients poll for progress.
+
+    A job scrapes a list of sources on a bounded worker pool. Each source's
+    status, item count, elapsed time and results are visible as soon as
+    that source finishes. Finished jobs are dropped after a retention period.
+    """
+
+    def __init__(self, max_workers=4, retention=3600):
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='scrape-job')
+        self._lock = threading.Lock()
+        self._jobs = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a job manager from a Flask config mapping"""
+        return cls(
+                max_workers=config.get('JOB_MAX_WORKERS', 4),
+                retention=config.get('JOB_RETENTION', 3600)
+                )
+
+    def submit(self, kind, sources, task, finalize=None):
+        """Start a job running task(source) for every source.
+
+        finalize(results), if given, runs once all sources are done and its
+        return value is stored as the job's 'result'.
+        """
+        self._expire()
+
+        job_id = uuid.uuid4().hex
+        job = {
+                'id': job_id,
+                'kind': kind,
+                'status': 'pending',
+                'created_at': datetime.now().isoformat(),
+                'finished_at': None,
+                'finished_ts': None,
+                'sources': {source: {
+                    'status': 'pending',
+                    'count': 0,
+                    'elapsed': None,
+                    'error': None,
+                    'data': None
+                    } for source in sources},
+                'result': None,
+                'remaining': len(sources),
+                'finalize': finalize
+                }
+
+        with self._lock:
+            self._jobs[job_id] = job
+
+        if not sources:
+            self._finish(job)
+        for source in sources:
+            self._executor.submit(self._run_source, job, source, task)
+
+        return job_id
+
+    def _run_source(self, job, source, task):
+        entry = job['sources'][source]
+        with self._lock:
+            entry['status'] = 'running'
+            job['status'] = 'running'
+
+        started = time.monotonic()
+        try:
+            data = task(source) or []
+            update = {'status': 'done', 'count': len(data), 'data': data}
+        except Exception as e:
+            print(f"❌ job {job['id'][:8]}: {source} failed: {e}")
+            update = {'status': 'failed', 'error': str(e)}
+
+        with self._lock:
+            entry.update(update)
+            entry['elapsed'] = round(time.monotonic() - started, 3)
+            job['remaining'] -= 1
+            last = job['remaining'] == 0
+
+        if last:
+            self._finish(job)
+
+    def _finish(self, job):
+        result = None
+        status = 'done'
+        if job['finalize']:
+            try:
+                results = {source: entry['data'] or [] for source, entry in job['sources'].items()}
+                result = job['finalize'](results)
+            except Exception as e:
+                print(f"❌ job {job['id'][:8]} finalize failed: {e}")
+                result = {'error': str(e)}
+                status = 'failed'
+
+        with self._lock:
+            job['result'] = result
+            job['status'] = status
+            job['finished_at'] = datetime.now().isoformat()
+            job['finished_ts'] = time.time()
+
+    def _expire(self):
+        """Drop finished jobs older than the retention period"""
+        cutoff = time.time() - self.retention
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job['finished_ts'] is not None and job['finished_ts'] < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def get(self, job_id, include_data=True):
+        """Get a job's status (None if unknown or expired)"""
+        self._expire()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+
+            sources = {}
+            for source, entry in job['sources'].items():
+                view = {k: v for k, v in entry.items() if k != 'data'}
+                if include_data and entry['status'] == 'done':
+                    view['data'] = entry['data']
+                sources[source] = view
+
+            done = sum(1 for entry in job['sources'].values() if entry['status'] in ('done', 'failed'))
+            return {
+                    'id': job['id'],
+                    'kind': job['kind'],
+                    'status': job['status'],
+                    'created_at': job['created_at'],
+                    'finished_at': job['finished_at'],
+                    'progress': {'done': done, 'total': len(job['sources'])},
+                    'sources': sources,
+                    'result': job['result'] if include_data else None
+                    }
+
+    def list_jobs(self):
+        """Get a summary of every retained job"""
+        self._expire()
+        with self._lock:
+            job_ids = list(self._jobs)
+        jobs = [self.get(job_id, include_data=False) for job_id in job_ids]
+        return [job for job in jobs if job is not None]
+
+    def get_stats(self):
+        """Get job counts by status"""
+        with self._lock:
+            counts = {}
+            for job in self._jobs.values():
+                counts[job['status']] = counts.get(job['status'], 0) + 1
+            return {'jobs': len(self._jobs), 'by_status': counts, 'retention': self.retention}
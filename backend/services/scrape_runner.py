@@ -0,0 +1,152 @@
+# backend/services/scrape_runner.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Cancellation flag of the scrape running on the current worker thread
+_local = threading.local()
+
+
+def is_cancelled():
+    """Check whether the scrape running on this thread has been cancelled.
+
+    Long-running scrapers (pagination loops, detail fetches) call this
+    between steps so a source that ran past its time budget stops early.
+    """
+    event = getattr(_local, 'cancel_event', None)
+    return event is not None and event.is_set()
+
+
+class ScrapeRunner:
+    """Run several scrapers concurrently with a time budget per source"""
+
+    def __init__(self, max_workers=8, default_timeout=120, timeouts=None):
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.timeouts = dict(timeouts or {})
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='scraper')
+        self._lock = threading.Lock()
+        self.stats = {
+                'runs': 0,
+                'completed': 0,
+                'failed': 0,
+                'timed_out': 0,
+                'last_run_seconds': None
+                }
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a runner from a Flask config mapping"""
+        return cls(
+                max_workers=config.get('SCRAPE_MAX_WORKERS', 8),
+                default_timeout=config.get('SCRAPE_TIMEOUT', 120),
+                timeouts=config.get('SCRAPE_TIMEOUTS', {})
+                )
+
+    def timeout_for(self, source):
+        """Get the time budget in seconds for a source"""
+        return self.timeouts.get(source, self.default_timeout)
+
+    def _run_task(self, task, source, cancel_event, started):
+        """Worker wrapper - exposes the cancel flag and records start time"""
+        if cancel_event.is_set():
+            return None
+        started[source] = time.monotonic()
+        _local.cancel_event = cancel_event
+        try:
+            return task(source)
+        finally:
+            _local.cancel_event = None
+
+    def iter_results(self, sources, task):
+        """Run task(source) for every source, yielding results as they finish.
+
+        Each yielded item is a dict with source, status ('done', 'failed'
+        or 'timeout'), data, error and elapsed seconds. A source that runs
+        past its budget is reported as timed out and asked to cancel.
+        """
+        run_started = time.monotonic()
+        started = {}
+        futures = {}
+
+        for source in sources:
+            cancel_event = threading.Event()
+            future = self._executor.submit(self._run_task, task, source, cancel_event, started)
+            futures[future] = (source, cancel_event)
+
+        with self._lock:
+            self.stats['runs'] += 1
+
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+
+                # expire sources that ran past their budget
+                for future in list(pending):
+                    source, cancel_event = futures[future]
+                    begin = started.get(source)
+                    if begin is not None and now - begin >= self.timeout_for(source):
+                        pending.discard(future)
+                        cancel_event.set()
+                        future.cancel()
+                        yield self._record(source, 'timeout', None,
+                                           f'timed out after {self.timeout_for(source)}s', now - begin)
+
+                if not pending:
+                    break
+
+                # wake up at the earliest deadline of a running source
+                deadlines = [
+                        started[futures[f][0]] + self.timeout_for(futures[f][0]) - now
+                        for f in pending if futures[f][0] in started
+                        ]
+                slice_timeout = max(0.05, min(deadlines)) if deadlines else 0.5
+
+                done, _ = wait(pending, timeout=slice_timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    source, _ = futures[future]
+                    elapsed = time.monotonic() - started.get(source, run_started)
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        yield self._record(source, 'failed', None, str(e), elapsed)
+                    else:
+                        yield self._record(source, 'done', data, None, elapsed)
+        finally:
+            # consumer stopped early - cancel whatever is still running
+            for future in pending:
+                futures[future][1].set()
+                future.cancel()
+            with self._lock:
+                self.stats['last_run_seconds'] = round(time.monotonic() - run_started, 3)
+
+    def run_all(self, sources, task):
+        """Run all sources and return {source: result} once every one is done"""
+        return {result['source']: result for result in self.iter_results(sources, task)}
+
+    def _record(self, source, status, data, error, elapsed):
+        key = {'done': 'completed', 'failed': 'failed', 'timeout': 'timed_out'}[status]
+        with self._lock:
+            self.stats[key] += 1
+
+        if status == 'done':
+            print(f"⏱️ {source} finished in {elapsed:.1f}s")
+        else:
+            print(f"⚠️ {source} {status}: {error}")
+
+        return {
+                'source': source,
+                'status': status,
+                'data': data,
+                'error': error,
+                'elapsed': round(elapsed, 3)
+                }
+
+    def get_stats(self):
+        """Get runner statistics"""
+        with self._lock:
+            return dict(self.stats, max_workers=self.max_workers,
+                        default_timeout=self.default_timeout)
@@ -0,0 +1,71 @@
+# backend/services/single_flight.py
+import threading
+
+
+class _Call:
+    """One in-flight call that other callers can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running block and share its result (or its exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.stats = {'calls': 0, 'executions': 0, 'coalesced': 0}
+        self.coalesced_by_key = {}
+
+    def do(self, key, fn):
+        """Run fn() for key unless a call for key is already in flight"""
+        with self._lock:
+            self.stats['calls'] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.stats['coalesced'] += 1
+                self.coalesced_by_key[key] = self.coalesced_by_key.get(key, 0) + 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.stats['executions'] += 1
+                leader = True
+
+        if not leader:
+            print(f"🔗 joining in-flight scrape for {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        """Get the keys currently being executed"""
+        with self._lock:
+            return list(self._calls)
+
+    def get_stats(self):
+        """Get call, execution and coalescing counters"""
+        with self._lock:
+            return dict(self.stats,
+                        in_flight=list(self._calls),
+                        coalesced_by_key=dict(self.coalesced_by_key))
@@ -0,0 +1,99 @@
+# backend/services/stream_extract.py
+import codecs
+import html
+import re
+
+_TAG_OPEN = re.compile(r'(script|style|template)\b', re.IGNORECASE)
+_SPACES = re.compile(r'\s+')
+
+
+class FieldScanner:
+    """Find the first match of a pattern in a page's text while it downloads.
+
+    Chunks are decoded incrementally, tags are dropped (script, style and
+    template contents too, like BeautifulSoup's get_text) and entities are
+    unescaped. The text is searched after every chunk, so the caller can
+    stop reading as soon as feed() returns a value. The last `overlap`
+    characters are searched again with the next chunk, so a field split
+    across two chunks is still found.
+    """
+
+    def __init__(self, pattern, overlap=256, encoding='utf-8'):
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.overlap = overlap
+        self.encoding = encoding
+        self.bytes_read = 0
+        self.result = None
+        self._decoder = None
+        self._markup = ''    # decoded markup not yet turned into text
+        self._text = ''      # tail of the text searched so far
+        self._skipping = None
+
+    def feed(self, chunk):
+        """Add the next chunk of bytes; returns the field once it is found"""
+        if self._decoder is None:
+            self._decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        self.bytes_read += len(chunk)
+        self._markup += self._decoder.decode(chunk)
+        return self._search(self._take_text(), final=False)
+
+    def finish(self):
+        """Flush what is left at the end of the page"""
+        if self._decoder is not None:
+            self._markup += self._decoder.decode(b'', final=True)
+        return self._search(self._take_text(final=True), final=True)
+
+    def _search(self, text, final):
+        if self.result is not None:
+            return self.result
+        # collapse whitespace so values read like get_text(' ', strip=True)
+        self._text = _SPACES.sub(' ', self._text + text)
+        match = self.pattern.search(self._text)
+        # a match touching the end of the text may still grow with the next chunk
+        if match and (final or match.end() < len(self._text)):
+            self.result = match.group(0)
+            return self.result
+        self._text = self._text[-self.overlap:]
+        return None
+
+    def _take_text(self, final=False):
+        """Turn the complete part of the buffered markup into text"""
+        markup = self._markup
+        out = []
+        pos = 0
+        while pos < len(markup):
+            if self._skipping:
+                end = markup.lower().find('</' + self._skipping, pos)
+                if end == -1:
+                    # keep enough to recognise a closing tag split across chunks
+                    pos = max(pos, len(markup) - len(self._skipping) - 2)
+                    break
+                pos = end
+                self._skipping = None
+                continue
+
+            lt = markup.find('<', pos)
+            if lt == -1:
+                out.append(markup[pos:])
+                pos = len(markup)
+                break
+            out.append(markup[pos:lt])
+            gt = markup.find('>', lt)
+            if gt == -1:
+                pos = lt  # tag continues in the next chunk
+                break
+            opened = _TAG_OPEN.match(markup, lt + 1)
+            if opened:
+                self._skipping = opened.group(1).lower()
+            out.append(' ')
+            pos = gt + 1
+
+        text = ''.join(out)
+        rest = markup[pos:]
+        if not final:
+            # hold back an entity cut off at the end of the chunk
+            amp = text.rfind('&')
+            if amp != -1 and ';' not in text[amp:] and len(text) - amp < 12:
+                text, rest = text[:amp], text[amp:] + rest
+        self._markup = '' if final else rest
+        return html.unescape(text)
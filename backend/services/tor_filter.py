@@ -1,6 +1,7 @@
 # backend/services/tor_filter.py
 # import re
 # from datetime import datetime
+from services.gazetteer import get_gazetteer
 
 class ToRFilter:
     """Filter opportunities for ToR monitoring"""
@@ -47,20 +48,15 @@ class ToRFilter:
 
     def _is_bangladesh(self, notice):
         """Check if notice is for Bangladesh"""
-        text = str(notice.get('country', '')).upper() + ' ' + \
-                str(notice.get('place', '')).upper() + ' ' + \
-                str(notice.get('title', '')).upper() + ' ' + \
-                str(notice.get('description', '')).upper()
-
-        # Check for Bangladesh indicators
-        if 'BANGLADESH' in text or 'BD' in text or 'DHAKA' in text:
-            return True
-
         # Check for Bangladesh-specific sources
         if notice.get('source') in ['bppa', 'cptu', 'bdjobs']:
             return True
 
-        return False
+        # Check for Bangladesh or any of its divisions, districts and upazilas
+        # (fields joined so the text is scanned once; '|' keeps names from running across fields)
+        text = ' | '.join(str(notice[field]) for field in ('country', 'place', 'title', 'description')
+                          if notice.get(field))
+        return get_gazetteer().mentions(text, 'Bangladesh')
 
     def _get_matching_keywords(self, notice):
         """Get all keywords that match in the notice"""
@@ -0,0 +1,108 @@
+# backend/services/ttl_policy.py
+import threading
+import time
+from datetime import datetime
+
+
+def entry_age(entry):
+    """Age in seconds of a cache entry, None if never scraped"""
+    if entry['timestamp'] is None:
+        return None
+    try:
+        return (datetime.now() - datetime.fromisoformat(entry['timestamp'])).total_seconds()
+    except (ValueError, TypeError):
+        return None
+
+
+class TTLPolicy:
+    """Decides when cached notices are fresh and when to retry a failing source.
+
+    A source's notices stay fresh for its TTL (its refresh interval). A
+    failed scrape does not replace them: the last good notices keep being
+    served, and the failure itself is cached for failure_ttl seconds,
+    multiplied by backoff for each further consecutive failure up to
+    max_backoff, so a broken site is not hit again on every request.
+    """
+
+    def __init__(self, default_ttl=300, ttls=None, failure_ttl=60, backoff=2.0, max_backoff=1800):
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.failure_ttl = failure_ttl
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._failures = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build a policy from a Flask config mapping"""
+        return cls(
+                default_ttl=config.get('REFRESH_DEFAULT_INTERVAL', 300),
+                ttls=config.get('REFRESH_INTERVALS', {}),
+                failure_ttl=config.get('FAILURE_TTL', 60),
+                backoff=config.get('FAILURE_BACKOFF', 2.0),
+                max_backoff=config.get('FAILURE_MAX_BACKOFF', 1800)
+                )
+
+    def ttl_for(self, source):
+        """Seconds a source's notices stay fresh"""
+        return self.ttls.get(source, self.default_ttl)
+
+    def record_success(self, source):
+        """Forget a source's failures after a good scrape"""
+        with self._lock:
+            self._failures.pop(source, None)
+
+    def record_failure(self, source, error):
+        """Cache a failed scrape; returns the seconds until the next attempt"""
+        with self._lock:
+            state = self._failures.setdefault(source, {'failures': 0})
+            state['failures'] += 1
+            delay = min(self.failure_ttl * self.backoff ** (state['failures'] - 1), self.max_backoff)
+            now = time.time()
+            state.update(last_error=str(error)[:200], failed_at=now, retry_at=now + delay)
+            return delay
+
+    def retry_in(self, source):
+        """Seconds left before a failing source may be scraped again (0 if not failing)"""
+        with self._lock:
+            state = self._failures.get(source)
+            return max(0.0, state['retry_at'] - time.time()) if state else 0.0
+
+    def is_fresh(self, source, entry):
+        """Whether entry can be served without scraping: younger than the
+        TTL, or the source failed recently and is backing off"""
+        if self.retry_in(source) > 0:
+            return True
+        age = entry_age(entry)
+        return age is not None and age < self.ttl_for(source)
+
+    def next_refresh_in(self, source):
+        """Seconds until a background refresh: the backoff while failing, else the TTL"""
+        return self.retry_in(source) or self.ttl_for(source)
+
+    def describe(self, source, entry):
+        """Age, TTL and failure state of a source's cache entry"""
+        age = entry_age(entry)
+        with self._lock:
+            state = dict(self._failures.get(source, {}))
+        return {
+                'age_seconds': round(age) if age is not None else None,
+                'ttl': self.ttl_for(source),
+                'stale': age is None or age >= self.ttl_for(source),
+                'failures': state.get('failures', 0),
+                'last_error': state.get('last_error'),
+                'retry_in': round(max(0.0, state['retry_at'] - time.time())) if state else None
+                }
+
+    def get_stats(self):
+        """Get the TTL settings and every source currently failing"""
+        with self._lock:
+            failing = {source: dict(state) for source, state in self._failures.items()}
+        return {
+                'default_ttl': self.default_ttl,
+                'failure_ttl': self.failure_ttl,
+                'backoff': self.backoff,
+                'max_backoff': self.max_backoff,
+                'failing': failing
+                }
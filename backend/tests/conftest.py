@@ -0,0 +1,36 @@
+# backend/tests/conftest.py
+import os
+import sys
+import tempfile
+
+import pytest
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND)
+
+# The app reads its config when imported: run it with the testing config,
+# no background work, and every on-disk cache in a scratch directory
+_workdir = tempfile.mkdtemp(prefix='tender-tests-')
+os.environ.update(
+        flask_env='testing',
+        REFRESH_ENABLED='false',
+        PARSE_POOL_ENABLED='false',
+        BROWSER_WARM='false',
+        HTTP_CACHE_ENABLED='false',
+        SCRAPE_CACHE_FILE=os.path.join(_workdir, 'scrape_cache.db'),
+        SCRAPE_LOCK_FILE=os.path.join(_workdir, 'locks.db'),
+        DETAIL_CACHE_FILE=os.path.join(_workdir, 'details.json'),
+        HIGH_WATER_FILE=os.path.join(_workdir, 'high_water.json'),
+        )
+
+
+@pytest.fixture(scope='session')
+def flask_app():
+    """The app module, imported once for the whole run"""
+    import app
+    return app
+
+
+@pytest.fixture
+def client(flask_app):
+    return flask_app.app.test_client()
@@ -0,0 +1,43 @@
+# backend/tests/test_async_engine.py
+"""A scrape that runs out of time is cancelled on the engine loop, not left running"""
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from services.async_engine import AsyncScrapeEngine
+from services.scrape_runner import ScrapeRunner
+
+
+@pytest.fixture
+def engine():
+    engine = AsyncScrapeEngine()
+    yield engine
+    engine._loop.call_soon_threadsafe(engine._loop.stop)
+
+
+def slow_scrape(cancelled):
+    async def scrape():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+    return scrape()
+
+
+def test_timeout_cancels_the_coroutine(engine):
+    cancelled = threading.Event()
+    with pytest.raises(FutureTimeoutError):
+        engine.run(slow_scrape(cancelled), timeout=0.2)
+    assert cancelled.wait(5)
+
+
+def test_runner_budget_cancels_the_coroutine(engine):
+    cancelled = threading.Event()
+    runner = ScrapeRunner(max_workers=1, default_timeout=0.3)
+
+    results = list(runner.iter_results(['slow'], lambda source: engine.run(slow_scrape(cancelled), poll=0.05)))
+    assert [result['status'] for result in results] == ['timeout']
+    assert cancelled.wait(5)
@@ -0,0 +1,39 @@
+# backend/tests/test_bppa_pagination.py
+"""BPPA learns its page parameter from the pagination block only"""
+from scrapers.bppa import BPPAScraper
+
+
+def listing(pagination='', row_href='/notice?id=7&p=412'):
+    return (
+            "<html><body><div id='bodyContent'><table><tbody>"
+            f"<tr><td>1</td><td><a href='{row_href}'>Baseline study</a><br>REF-1</td>"
+            "<td>LGED</td><td>01/01/2026</td><td>10/02/2026<br>12:00</td><td>Dhaka</td></tr>"
+            f"</tbody></table>{pagination}</div></body></html>"
+            )
+
+
+def pagination_of(html):
+    scraper = BPPAScraper()
+    return scraper._pagination(scraper._find_content(html))
+
+
+def test_row_links_are_not_read_as_page_links():
+    info = pagination_of(listing())
+    assert (info['param'], info['last_link']) == ('page', 1)
+
+
+def test_page_links_come_from_the_pagination_list():
+    links = "".join(f"<li><a href='?limitstart={n * 20}'>{n + 1}</a></li>" for n in range(4))
+    info = pagination_of(listing(f"<div class='col-md-12'>Showing 1 to 20 of 80</div>"
+                                 f"<ul class='pagination'>{links}</ul>", row_href='/notice?page=99'))
+    assert (info['param'], info['last_link'], info['total'], info['per_page']) == ('limitstart', 60, 80, 20)
+
+
+def test_bare_p_is_read_inside_the_showing_block():
+    block = "<div class='col-md-12'>Page 1 <a href='?p=2'>2</a> <a href='?p=3'>3</a></div>"
+    info = pagination_of(listing(block))
+    assert (info['param'], info['last_link']) == ('p', 3)
+
+    urls = BPPAScraper()._page_urls(info)
+    assert [number for number, _ in urls] == [2, 3]
+    assert urls[-1][1].endswith('p=3')
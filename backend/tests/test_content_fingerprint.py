@@ -0,0 +1,65 @@
+# backend/tests/test_content_fingerprint.py
+"""Unchanged pages reuse their parsed result, changed content never does"""
+from types import SimpleNamespace
+
+import pytest
+
+from services import content_fingerprint
+from services.content_fingerprint import FingerprintMemo, fetch_parsed_result
+from services.parse_pool import parse_with
+
+PAGE = (b"<html><head><meta name='generated' content='2026-03-01T10:15:{s}Z'>"
+        b"<!-- rendered 2026-03-01 10:15:{s} -->"
+        b"<script>var serverTime = '2026-03-01T10:15:{s}';</script></head><body><table>"
+        b"<tr><td>Baseline survey</td><td>2026-04-{day}T17:00:00</td></tr>"
+        b"</table></body></html>")
+
+
+def page(seconds='00', day='10'):
+    return PAGE.replace(b'{s}', seconds.encode()).replace(b'{day}', day.encode())
+
+
+def test_render_stamps_are_ignored():
+    memo = FingerprintMemo()
+    assert memo.fingerprint(page('00')) == memo.fingerprint(page('59'))
+
+
+def test_changed_deadline_changes_the_fingerprint():
+    memo = FingerprintMemo()
+    assert memo.fingerprint(page(day='10')) != memo.fingerprint(page(day='17'))
+
+
+class Listing:
+    def _parse(self, content, max_items=None):
+        rows = [{'row': number} for number in range(5)]
+        return rows[:max_items] if max_items else rows
+
+
+@pytest.fixture
+def memo(monkeypatch):
+    memo = FingerprintMemo()
+    monkeypatch.setattr(content_fingerprint, '_memo', memo)
+    return memo
+
+
+def test_memo_is_keyed_by_the_parse_arguments(memo):
+    response = SimpleNamespace(content=page())
+    scraper = Listing()
+
+    assert len(fetch_parsed_result('undp', 'https://example.org', response, parse_with(scraper, '_parse', 2))) == 2
+    assert len(fetch_parsed_result('undp', 'https://example.org', response, parse_with(scraper, '_parse', 4))) == 4
+    assert len(fetch_parsed_result('undp', 'https://example.org', response, parse_with(scraper, '_parse', 2))) == 2
+    assert memo.get_stats()['sources']['undp'] == {'unchanged': 1, 'parsed': 2}
+
+
+def test_callbacks_without_a_key_are_not_memoized(memo):
+    response = SimpleNamespace(content=page())
+    calls = []
+
+    def parse(response):
+        calls.append(response)
+        return []
+
+    fetch_parsed_result('care', 'https://example.org', response, parse)
+    fetch_parsed_result('care', 'https://example.org', response, parse)
+    assert len(calls) == 2
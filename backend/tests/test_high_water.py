@@ -0,0 +1,69 @@
+# backend/tests/test_high_water.py
+"""Incremental crawls keep older rows only for listings they stopped paging early"""
+import itertools
+
+import pytest
+
+import scrapers
+from services import high_water
+from services.high_water import HighWaterMarks, run_incremental, stopped_paging_early
+
+_names = itertools.count()
+
+
+def notice(number):
+    return {'id': number, 'title': f'Mid-term review {number}', 'detail_url': f'https://example.org/{number}'}
+
+
+def urls(rows):
+    return [row['detail_url'] for row in rows]
+
+
+@pytest.fixture
+def marks(monkeypatch, tmp_path):
+    marks = HighWaterMarks(str(tmp_path / 'high_water.json'))
+    monkeypatch.setattr(high_water, '_marks', marks)
+    return marks
+
+
+def test_whole_listing_replaces_the_previous_one(marks):
+    first, _ = run_incremental('single', lambda: [notice(1), notice(2)])
+    data, new = run_incremental('single', lambda: [notice(3), notice(1)], first)
+
+    assert not marks.full_due('single')
+    assert urls(data) == urls([notice(3), notice(1)])
+    assert urls(new) == urls([notice(3)])
+
+
+def test_listing_that_stopped_early_keeps_the_rows_it_did_not_reach(marks):
+    first, _ = run_incremental('paged', lambda: [notice(1), notice(2)])
+
+    def scrape():
+        stopped_paging_early('paged')
+        return [notice(3), notice(1)]
+
+    data, _ = run_incremental('paged', scrape, first)
+    assert urls(data) == urls([notice(3), notice(1), notice(2)])
+    assert [row['id'] for row in data] == [1, 2, 3]
+
+    # the stop belongs to that crawl only
+    data, _ = run_incremental('paged', lambda: [notice(3), notice(1)], data)
+    assert urls(data) == urls([notice(3), notice(1)])
+
+
+def test_removed_notice_is_not_served_again(flask_app, monkeypatch):
+    rows = [notice(1), notice(2)]
+    name = f'single{next(_names)}'
+
+    class SinglePageScraper:
+        def scrape(self):
+            return [dict(row) for row in rows]
+
+    monkeypatch.setattr(scrapers, 'SCRAPERS', {name: {'class': SinglePageScraper, 'display_name': 'Single',
+                                                      'module': __name__}})
+    flask_app.run_scraper(name)
+
+    # notice 2 is withdrawn from the listing
+    rows.pop()
+    assert urls(flask_app.run_scraper(name, force_refresh=True)) == urls([notice(1)])
+    assert urls(flask_app.cache.get(name)['data']) == urls([notice(1)])
@@ -0,0 +1,36 @@
+# backend/tests/test_http_cache.py
+"""Worker processes sharing the HTTP cache directory keep each other's entries"""
+import os
+
+from services.http_cache import HttpCache
+
+HEADERS = {'ETag': '"v1"', 'Content-Type': 'text/html'}
+
+
+def test_workers_keep_each_others_entries(tmp_path):
+    first, second = HttpCache(str(tmp_path)), HttpCache(str(tmp_path))
+
+    first.store('https://example.org/a', HEADERS, b'a' * 10)
+    second.store('https://example.org/b', HEADERS, b'b' * 10)
+    first.store('https://example.org/c', HEADERS, b'c' * 10)
+
+    fresh = HttpCache(str(tmp_path))
+    for cache in (first, second, fresh):
+        for name in 'abc':
+            assert cache.load(f'https://example.org/{name}')[0] == name.encode() * 10
+
+
+def test_eviction_is_shared(tmp_path):
+    first, second = HttpCache(str(tmp_path), max_bytes=25), HttpCache(str(tmp_path), max_bytes=25)
+
+    first.store('https://example.org/a', HEADERS, b'a' * 10)
+    second.store('https://example.org/b', HEADERS, b'b' * 10)
+    # over the limit: the least recently used entry (a) goes, for both workers
+    first.store('https://example.org/c', HEADERS, b'c' * 10)
+
+    assert first.load('https://example.org/a') is None
+    assert second.load('https://example.org/a') is None
+    assert second.validators('https://example.org/a') == {}
+    assert second.load('https://example.org/b')[0] == b'b' * 10
+    assert sorted(name for name in os.listdir(tmp_path) if len(name) == 40) == sorted(
+            os.path.basename(first._body_path(f'https://example.org/{name}')) for name in 'bc')
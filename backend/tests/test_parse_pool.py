@@ -0,0 +1,78 @@
+# backend/tests/test_parse_pool.py
+"""The parse pool starts and restarts in the background, never by forking the app"""
+import time
+
+import pytest
+
+from scrapers.care import CareScraper
+from services.parse_pool import ParsePool
+
+PAGE = (b"<html><body><div id='project1' class='tab-pane show active'>"
+        b"<div class='col-md-3'><p>Deadline: 10 Feb 2026</p><p>Endline evaluation</p>"
+        b"<a class='default-btn' href='/care/1.pdf'>Download</a></div></div></body></html>")
+
+
+@pytest.fixture
+def pool():
+    pool = ParsePool(max_workers=1, min_bytes=0)
+    yield pool
+    pool.shutdown()
+
+
+def parse(pool):
+    """Titles parsed from PAGE and how long the caller waited"""
+    started = time.monotonic()
+    tenders = pool.parse(CareScraper.__new__(CareScraper), '_parse', PAGE)
+    assert [t['title'] for t in tenders] == ['Endline evaluation']
+    return time.monotonic() - started
+
+
+def wait_for_workers(pool, previous=None):
+    deadline = time.monotonic() + 60
+    while (pool._executor is None or pool._executor is previous) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert pool._executor is not None and pool._executor is not previous
+    assert pool._executor._mp_context.get_start_method() in ('forkserver', 'spawn')
+    return pool._executor
+
+
+def counts(pool):
+    entry = pool.get_stats()['parsers']['CareScraper._parse']
+    return entry['inline'], entry['pool']
+
+
+def test_first_use_starts_the_pool_without_waiting(pool):
+    assert parse(pool) < 1
+    assert counts(pool) == (1, 0)
+
+    wait_for_workers(pool)
+    parse(pool)
+    assert counts(pool) == (1, 1)
+
+
+def test_broken_pool_is_rebuilt_in_the_background(pool):
+    parse(pool)
+    broken = wait_for_workers(pool)
+    for process in list(broken._processes.values()):
+        process.kill()
+        process.join()
+
+    # the page that finds the pool broken and the next one are parsed in-process
+    assert parse(pool) < 1
+    assert parse(pool) < 1
+    assert counts(pool) == (3, 0)
+
+    wait_for_workers(pool, previous=broken)
+    parse(pool)
+    assert counts(pool) == (3, 1)
+
+
+def test_pool_started_by_a_parent_process_is_not_used(pool):
+    parse(pool)
+    inherited = wait_for_workers(pool)
+    pool._pid = -1   # as in a child forked after the pool started
+
+    parse(pool)
+    assert counts(pool) == (2, 0)
+    wait_for_workers(pool, previous=inherited)
+    inherited.shutdown()
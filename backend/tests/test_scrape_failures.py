@@ -0,0 +1,83 @@
+# backend/tests/test_scrape_failures.py
+"""A failing scrape keeps the last good notices and backs off, cold or warm"""
+import itertools
+
+import pytest
+
+import scrapers
+from scrapers import ScrapeError
+from scrapers.worldbank import WorldBankScraper
+from services.high_water import get_high_water_marks
+
+_names = itertools.count()
+
+
+@pytest.fixture
+def source(monkeypatch):
+    """A single fake source that returns rows or fails, as the test says"""
+    state = {'rows': [], 'fail': False, 'calls': 0}
+    name = f'flaky{next(_names)}'
+
+    class FlakyScraper:
+        def scrape(self):
+            state['calls'] += 1
+            if state['fail']:
+                raise ScrapeError(f"{name}: site is down")
+            return [dict(row) for row in state['rows']]
+
+    monkeypatch.setattr(scrapers, 'SCRAPERS', {name: {'class': FlakyScraper, 'display_name': 'Flaky',
+                                                      'module': __name__}})
+    return name, state
+
+
+def test_cold_failure_backs_off(flask_app, source):
+    name, state = source
+    state['fail'] = True
+
+    assert flask_app.run_scraper(name) == []
+    assert flask_app.cache.get(name)['timestamp'] is None
+    assert flask_app.ttl_policy.retry_in(name) > 0
+
+    # nothing cached, but the failure is: the site is not hit again
+    assert flask_app.run_scraper(name) == []
+    assert state['calls'] == 1
+
+
+def test_repeated_failures_double_the_backoff(flask_app, source):
+    name, state = source
+    state['fail'] = True
+    policy = flask_app.ttl_policy
+
+    flask_app.run_scraper(name)
+    first = policy.retry_in(name)
+    flask_app.run_scraper(name, force_refresh=True)
+    second = policy.retry_in(name)
+
+    assert first <= policy.failure_ttl < second <= policy.failure_ttl * policy.backoff
+    assert policy.get_stats()['failing'][name]['failures'] == 2
+
+
+def test_failure_keeps_the_last_good_notices(flask_app, source):
+    name, state = source
+    state['rows'] = [{'id': 1, 'title': 'Endline evaluation', 'detail_url': 'https://example.org/1'}]
+    good = flask_app.run_scraper(name)
+    known = set(get_high_water_marks().known_keys(name))
+
+    state['fail'] = True
+    assert flask_app.run_scraper(name, force_refresh=True) == good
+    assert flask_app.cache.get(name)['data'] == good
+    assert set(get_high_water_marks().known_keys(name)) == known
+
+    # the next good scrape clears the backoff
+    state['fail'] = False
+    flask_app.run_scraper(name, force_refresh=True)
+    assert flask_app.ttl_policy.retry_in(name) == 0
+
+
+def test_worldbank_fails_instead_of_serving_sample_data(monkeypatch):
+    scraper = WorldBankScraper(use_selenium=False)
+    monkeypatch.setattr(scraper, '_scrape_with_data_feed', lambda: [])
+    monkeypatch.setattr(scraper, '_scrape_with_requests', lambda: [])
+
+    with pytest.raises(ScrapeError):
+        scraper.scrape()
@@ -0,0 +1,83 @@
+# backend/tests/test_tor_scan.py
+"""The ToR scan reports notices new to the ToR pipeline, however they were first scraped"""
+import itertools
+
+import pytest
+
+import scrapers
+from routes import tor_routes
+from services.memory_tracker import MemoryTracker
+
+_names = itertools.count()
+
+
+def notice(number):
+    return {
+        'title': f'Baseline study {number} for a WASH programme in Bangladesh',
+        'country': 'Bangladesh',
+        'detail_url': f'https://example.org/tenders/{number}',
+        }
+
+
+@pytest.fixture
+def listing(monkeypatch, tmp_path):
+    """A single fake source whose listing the test controls"""
+    rows = []
+    name = f'fake{next(_names)}'
+
+    class FakeScraper:
+        def scrape(self):
+            return [dict(row) for row in rows]
+
+    monkeypatch.setattr(scrapers, 'SCRAPERS', {name: {'class': FakeScraper, 'display_name': 'Fake',
+                                                      'module': __name__}})
+    monkeypatch.setattr(tor_routes, 'memory_tracker', MemoryTracker(str(tmp_path / 'seen_links.json')))
+    return name, rows
+
+
+def scan(client):
+    body = client.post('/api/tor/scan').get_json()
+    assert body['success'], body
+    return body
+
+
+def test_scan_reports_rows_first_seen_by_a_refresh(client, flask_app, listing):
+    name, rows = listing
+    rows.append(notice(1))
+    first = scan(client)
+    assert (first['total'], first['new']) == (1, 1)
+
+    # a background refresh sees the next notice before the next scan does
+    rows.insert(0, notice(2))
+    flask_app.run_scraper(name, force_refresh=True)
+
+    second = scan(client)
+    assert second['total'] == 2
+    assert [n['detail_url'] for n in second['new_notices']] == ['https://example.org/tenders/2']
+
+
+def test_scan_does_not_report_a_notice_twice(client, listing):
+    name, rows = listing
+    rows.append(notice(1))
+    assert scan(client)['new'] == 1
+    assert scan(client)['new'] == 0
+
+
+def test_scan_leaves_cached_notices_unannotated(client, flask_app, listing):
+    name, rows = listing
+    rows.append(notice(1))
+    scan(client)
+    assert 'document_type' not in flask_app.cache.get(name)['data'][0]
+
+
+def test_scan_reads_the_listing_fresh(client, listing):
+    name, rows = listing
+    rows.extend([notice(1), notice(2)])
+    scan(client)
+
+    # notice 2 is withdrawn and notice 3 published, with no refresh in between
+    rows[:] = [notice(3), notice(1)]
+    body = scan(client)
+    assert [n['detail_url'] for n in body['all_notices']] == ['https://example.org/tenders/3',
+                                                              'https://example.org/tenders/1']
+    assert [n['detail_url'] for n in body['new_notices']] == ['https://example.org/tenders/3']
@@ -0,0 +1,109 @@
+# backend/tests/test_worldbank_feed.py
+"""WorldBank data-feed mode against the recorded feed served by the local stub"""
+from urllib.parse import urlsplit
+
+import pytest
+
+import scrapers.worldbank as worldbank
+from benchmarks.bench_worldbank_feed import feed, listing_page, load_recording
+from benchmarks.stub_server import StubServer
+from scrapers.worldbank import WorldBankScraper
+from services.rate_limiter import configure_rate_limiter
+
+LISTING = '/rfxnow/public/index.html'
+FEED = '/rfxnow/public/advertisement/list.json'
+
+
+@pytest.fixture(scope='module')
+def rows():
+    return load_recording()
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch):
+    configure_rate_limiter({'RATE_LIMITS': {'127.0.0.1': (1000.0, 100)}})
+    # every test is a first crawl - never stop at rows from another test
+    monkeypatch.setattr(worldbank, 'reached_known_rows', lambda source, rows: False)
+    WorldBankScraper._discovered_data_urls.clear()
+
+
+def serve(rows, rendered=10, fail=False, seen=None):
+    return StubServer(latency=0, routes={LISTING: lambda: listing_page(rows, rendered)},
+                      feeds={FEED: feed(rows, fail, seen)}).start()
+
+
+def scrape(stub, use_data_feed=True, use_selenium=False):
+    scraper = WorldBankScraper(use_selenium=False, use_data_feed=use_data_feed)
+    scraper.use_selenium = use_selenium
+    scraper.base_url = stub.base_url
+    scraper.url = stub.base_url + LISTING
+    return scraper, scraper.scrape()
+
+
+def fields(tender):
+    return (tender['id'], tender['procurement_number'], tender['title'], tender['organization'],
+            tender['country'], tender['publication_date'], tender['deadline'],
+            urlsplit(tender['detail_url']).path, tender['source'])
+
+
+def test_feed_pages_through_every_record(rows):
+    seen = []
+    stub = serve(rows, seen=seen)
+    try:
+        _, tenders = scrape(stub)
+        requests = stub.requests
+    finally:
+        stub.stop()
+
+    assert len(tenders) == len(rows) == 230
+    # one listing page to find the feed, then 100-row pages
+    assert requests == 1 + 3
+    assert [(int(p['draw']), int(p['start']), int(p['length'])) for p in seen] == [(1, 0, 100), (2, 100, 100),
+                                                                                 (3, 200, 100)]
+    assert [int(p['iDisplayStart']) for p in seen] == [0, 100, 200]
+    assert [t['id'] for t in tenders] == list(range(1, 231))
+
+
+def test_feed_records_match_the_rendered_table(rows):
+    # a page rendering every row, read by the HTML path, is the reference
+    stub = serve(rows, rendered=None)
+    try:
+        _, from_feed = scrape(stub)
+        _, from_html = scrape(stub, use_data_feed=False)
+    finally:
+        stub.stop()
+
+    assert len(from_html) == len(from_feed) == len(rows)
+    assert [fields(t) for t in from_feed] == [fields(t) for t in from_html]
+
+
+def test_failing_feed_falls_back_to_the_html_table(rows):
+    stub = serve(rows, fail=True)
+    try:
+        _, tenders = scrape(stub)
+    finally:
+        stub.stop()
+
+    assert [t['procurement_number'] for t in tenders] == [row[0] for row in rows[:10]]
+
+
+def test_failing_feed_falls_back_to_selenium_first(rows, monkeypatch):
+    from_browser = [{'id': 1, 'procurement_number': 'FROM-BROWSER'}]
+    monkeypatch.setattr(WorldBankScraper, '_scrape_with_selenium', lambda self: from_browser)
+    stub = serve(rows, fail=True)
+    try:
+        _, tenders = scrape(stub, use_selenium=True)
+    finally:
+        stub.stop()
+
+    assert tenders == from_browser
+
+
+def test_listing_without_a_feed_falls_back(rows):
+    stub = StubServer(latency=0, routes={LISTING: lambda: listing_page(rows).split('<script>')[0]}).start()
+    try:
+        _, tenders = scrape(stub)
+    finally:
+        stub.stop()
+
+    assert len(tenders) == 10
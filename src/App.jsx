@@ -111,19 +111,38 @@ function App() {
       setError(null);
       console.log('Fetching all data...');
 
-      const response = await axios.get(`${API_BASE_URL}/scrape/all`, {
-        params: { force }
-      });
+      // Stream one NDJSON line per source so fast tabs render before slow ones finish
+      const response = await fetch(`${API_BASE_URL}/scrape/all?force=${force}&stream=ndjson`);
+      if (!response.ok || !response.body) {
+        throw new Error(`Failed to fetch data (status ${response.status})`);
+      }
 
-      console.log('Data response:', response.data);
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
 
-      if (response.data.success) {
-        setTenderData(response.data.data);
-        setLastUpdated(new Date(response.data.timestamp));
-        setApiStatus('connected');
-        console.log('✅ Data loaded successfully');
-      } else {
-        throw new Error(response.data.error || 'Failed to fetch data');
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+
+        for (const line of lines) {
+          if (!line.trim()) continue;
+          const message = JSON.parse(line);
+
+          if (message.source) {
+            console.log(`Data for ${message.source}: ${message.count} items`);
+            setTenderData(prev => ({ ...prev, [message.source]: message.data }));
+            setApiStatus('connected');
+            setLoading(false);
+          } else if (message.done) {
+            setLastUpdated(new Date(message.timestamp));
+            console.log('✅ Data loaded successfully');
+          }
+        }
       }
     } catch (err) {
       console.error('Error fetching data:', err);